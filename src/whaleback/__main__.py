@@ -394,5 +394,14 @@ def compute_analysis(date_str: str | None):
     click.echo(f"Analysis complete: {results}")
 
 
+@cli.command("export-bert-onnx")
+def export_bert_onnx():
+    """Export the news sentiment BERT model to ONNX (FP32 + INT8) for fast scoring."""
+    from whaleback.analysis.news_scorer import export_bert_onnx as export
+
+    click.echo("Exporting BERT model to ONNX...")
+    click.echo(f"Export complete: {export()}")
+
+
 if __name__ == "__main__":
     cli()
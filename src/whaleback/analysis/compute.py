@@ -16,10 +16,13 @@ from sqlalchemy import select, func, and_, desc
 from sqlalchemy.orm import Session
 
 from whaleback.analysis.quant import (
-    compute_rim,
+    Fundamentals,
+    rim_calculator,
     compute_safety_margin,
     compute_fscore,
+    format_fscore_criteria,
     compute_investment_grade,
+    with_median_labels,
 )
 from whaleback.analysis.whale import compute_whale_score
 from whaleback.analysis.trend import compute_relative_strength, compute_rs_percentile
@@ -148,6 +151,11 @@ class AnalysisComputer:
 
     def __init__(self, settings: Settings | None = None):
         self.settings = settings or Settings()
+        # RIM specialized once for the configured rates
+        self._rim = rim_calculator(
+            risk_free_rate=self.settings.risk_free_rate,
+            equity_risk_premium=self.settings.equity_risk_premium,
+        )
 
     def run(self, target_date: date) -> dict[str, int]:
         """Run all analysis computations for the target date.
@@ -458,8 +466,8 @@ class AnalysisComputer:
 
     def _compute_sector_medians(
         self, session: Session, target_date: date
-    ) -> dict[str, dict[str, float]]:
-        """Pre-compute median PBR and PER per sector for F-Score signals."""
+    ) -> dict[str, dict[str, Any]]:
+        """Pre-compute median PBR and PER (with F-Score labels) per sector."""
         query = (
             select(SectorMapping.sector, Fundamental.pbr, Fundamental.per)
             .join(
@@ -482,7 +490,7 @@ class AnalysisComputer:
             if row.per and float(row.per) > 0:
                 sector_data[row.sector]["per"].append(float(row.per))
 
-        medians: dict[str, dict[str, float]] = {}
+        medians: dict[str, dict[str, Any]] = {}
         for sector, data in sector_data.items():
             medians[sector] = {}
             if data["pbr"]:
@@ -493,6 +501,7 @@ class AnalysisComputer:
                 sorted_per = sorted(data["per"])
                 mid = len(sorted_per) // 2
                 medians[sector]["median_per"] = sorted_per[mid]
+            with_median_labels(medians[sector])
 
         return medians
 
@@ -534,7 +543,7 @@ class AnalysisComputer:
         ticker: str,
         target_date: date,
         sector_map: dict[str, str],
-        sector_medians: dict[str, dict[str, float]],
+        sector_medians: dict[str, dict[str, Any]],
     ) -> dict[str, Any] | None:
         """Compute quant analysis for a single ticker."""
         # Current fundamentals — exact match preferred, fallback to most recent
@@ -553,15 +562,7 @@ class AnalysisComputer:
         if not current_fund:
             return None
 
-        current = {
-            "bps": float(current_fund.bps) if current_fund.bps else None,
-            "per": float(current_fund.per) if current_fund.per else None,
-            "pbr": float(current_fund.pbr) if current_fund.pbr else None,
-            "eps": float(current_fund.eps) if current_fund.eps else None,
-            "div": float(current_fund.div) if current_fund.div else None,
-            "dps": float(current_fund.dps) if current_fund.dps else None,
-            "roe": float(current_fund.roe) if current_fund.roe else None,
-        }
+        current = Fundamentals.from_record(current_fund)
 
         # Previous year fundamentals (approximate: ~365 days back)
         prev_date = target_date - timedelta(days=365)
@@ -572,16 +573,7 @@ class AnalysisComputer:
             .limit(1)
         ).scalar_one_or_none()
 
-        previous = None
-        if prev_fund:
-            previous = {
-                "bps": float(prev_fund.bps) if prev_fund.bps else None,
-                "per": float(prev_fund.per) if prev_fund.per else None,
-                "pbr": float(prev_fund.pbr) if prev_fund.pbr else None,
-                "eps": float(prev_fund.eps) if prev_fund.eps else None,
-                "div": float(prev_fund.div) if prev_fund.div else None,
-                "roe": float(prev_fund.roe) if prev_fund.roe else None,
-            }
+        previous = Fundamentals.from_record(prev_fund) if prev_fund else None
 
         # Volume data (last ~40 trading days)
         vol_result = session.execute(
@@ -607,12 +599,7 @@ class AnalysisComputer:
         s_medians = sector_medians.get(sector) if sector else None
 
         # Compute RIM
-        rim_result = compute_rim(
-            bps=current.get("bps"),
-            roe=current.get("roe"),
-            risk_free_rate=self.settings.risk_free_rate,
-            equity_risk_premium=self.settings.equity_risk_premium,
-        )
+        rim_result = self._rim(current.bps, current.roe)
 
         rim_value = rim_result.get("rim_value")
 
@@ -634,7 +621,7 @@ class AnalysisComputer:
             "rim_value": rim_value,
             "safety_margin": safety_margin,
             "fscore": fscore,
-            "fscore_detail": fscore_result["criteria"],
+            "fscore_detail": format_fscore_criteria(fscore_result["criteria"]),
             "investment_grade": grade_result["grade"],
             "data_completeness": data_completeness,
         }
@@ -1093,6 +1080,12 @@ class AnalysisComputer:
                 anthropic_api_key=settings.news_anthropic_api_key,
                 use_batch_api=settings.news_use_batch_api,
                 max_llm_escalation=settings.news_max_llm_escalation,
+                llm_concurrency=settings.news_llm_concurrency,
+                keyword_prefilter=settings.news_keyword_prefilter,
+                keyword_polar=settings.news_keyword_polar,
+                llm_articles_per_request=settings.news_llm_articles_per_request,
+                cache_path=settings.news_sentiment_cache_path or None,
+                bert_compile=settings.news_bert_compile,
             )
 
             # Split scored articles back by ticker
@@ -7,12 +7,17 @@ Generates daily market analysis reports using Anthropic Claude:
 Sync client only (compute pipeline is synchronous).
 """
 
+import functools
 import json
 import logging
 import re
+import threading
 from dataclasses import dataclass, field
 from typing import Any
 
+import httpx
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -65,18 +70,32 @@ class DashboardSummaryResult:
 
 _client = None
 _client_api_key: str | None = None
+_client_lock = threading.Lock()
+
+# Keep-alive pool shared by all report calls; long read timeout for streamed Opus output
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
 
 
 def _get_client(api_key: str):
-    """Lazy-load Anthropic sync client (singleton)."""
+    """Lazy-load Anthropic sync client (thread-safe singleton, pooled connections)."""
     global _client, _client_api_key
-    if _client is not None and _client_api_key == api_key:
+    client = _client
+    if client is not None and _client_api_key == api_key:
+        return client
+    with _client_lock:
+        # Re-check: another thread may have built the client while we waited
+        if _client is not None and _client_api_key == api_key:
+            return _client
+        import anthropic
+
+        _client = anthropic.Anthropic(
+            api_key=api_key,
+            max_retries=3,
+            http_client=httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+        )
+        _client_api_key = api_key
         return _client
-    import anthropic
-
-    _client = anthropic.Anthropic(api_key=api_key, max_retries=3)
-    _client_api_key = api_key
-    return _client
 
 
 # ---------------------------------------------------------------------------
@@ -111,18 +130,36 @@ _SECTION_KEY_MAP: dict[str, str] = {
 }
 
 
+_HEADER_RE = re.compile(r"^##\s+\d*\.?\s*(.+)")
+_NON_WORD_RE = re.compile(r"[^a-zA-Z가-힣0-9]")
+_BULLET_RE = re.compile(r"^[-*•]\s*")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+
+
 def _parse_report_sections(report: str) -> dict[str, Any]:
-    """Parse markdown report into key_insights by ## section headers."""
-    sections: dict[str, str] = {}
+    """Parse markdown report into key_insights by ## section headers.
+
+    Parsing is memoized on the report text; callers get a fresh copy so the
+    cached result cannot be mutated.
+    """
+    cached = _parse_report_sections_cached(report)
+    return {k: list(v) if isinstance(v, list) else v for k, v in cached.items()}
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_report_sections_cached(report: str) -> dict[str, Any]:
+    # Section lines are kept as lists; only the first few lines of each are read below,
+    # so joining/re-splitting the full section text is unnecessary.
+    sections: dict[str, list[str]] = {}
     current_key: str | None = None
     current_lines: list[str] = []
 
-    for line in report.split("\n"):
-        header_match = re.match(r"^##\s+\d*\.?\s*(.+)", line)
+    for line in report.splitlines():
+        header_match = _HEADER_RE.match(line)
         if header_match:
             # Save previous section
             if current_key is not None:
-                sections[current_key] = "\n".join(current_lines).strip()
+                sections[current_key] = current_lines
             # Map header to key
             header_text = header_match.group(1).strip()
             current_key = None
@@ -132,14 +169,14 @@ def _parse_report_sections(report: str) -> dict[str, Any]:
                     break
             if current_key is None:
                 # Fallback: use sanitized header
-                current_key = re.sub(r"[^a-zA-Z가-힣0-9]", "_", header_text).strip("_").lower()
+                current_key = _NON_WORD_RE.sub("_", header_text).strip("_").lower()
             current_lines = []
         elif current_key is not None:
             current_lines.append(line)
 
     # Save last section
     if current_key is not None:
-        sections[current_key] = "\n".join(current_lines).strip()
+        sections[current_key] = current_lines
 
     # Build key_insights: summary per section
     key_insights: dict[str, Any] = {}
@@ -147,23 +184,24 @@ def _parse_report_sections(report: str) -> dict[str, Any]:
     for key, content in sections.items():
         if key in _STOCK_LIST_KEYS:
             # Extract stock names/tickers from bullet points (bold **name** preferred)
-            stocks = []
-            for line in content.split("\n"):
-                line = line.strip()
+            stocks: list[str] = []
+            for line in map(str.strip, content):
                 if line.startswith(("-", "*", "•")):
-                    clean = re.sub(r"^[-*•]\s*", "", line)
-                    bold_match = re.search(r"\*\*(.+?)\*\*", clean)
+                    clean = _BULLET_RE.sub("", line)
+                    bold_match = _BOLD_RE.search(clean)
                     if bold_match:
                         stocks.append(bold_match.group(1))
                     elif clean:
                         stocks.append(clean.split(":")[0].split("(")[0].strip()[:30])
-            key_insights[key] = stocks[:10]
+                    if len(stocks) == 10:
+                        break
+            key_insights[key] = stocks
         else:
             # Take first 2-3 non-empty lines as summary (500 char cap for richer context)
-            lines = [l.strip() for l in content.split("\n") if l.strip() and not l.strip().startswith("#")]
+            lines = [l.strip() for l in content if l.strip() and not l.strip().startswith("#")]
             summary_lines = []
             for l in lines:
-                clean = re.sub(r"^[-*•]\s*", "", l)
+                clean = _BULLET_RE.sub("", l)
                 if clean:
                     summary_lines.append(clean)
                 if len(summary_lines) >= 3:
@@ -328,9 +366,129 @@ SYSTEM_PROMPT = """당신은 20년 경력의 시니어 퀀트 애널리스트이
 - 금액은 억원 단위 사용"""
 
 
-def _build_user_prompt(data: MarketSummaryInput, previous_report: str | None = None) -> str:
-    """Build the user prompt with all data sections."""
+# Per-table row templates: (str.format template, defaults for missing keys).
+# Rows are rendered with template.format_map({**defaults, **row}), which mirrors the
+# row.get(key, default) semantics without re-evaluating an f-string per field.
+_SECTOR_FLOW_ROW = (
+    "- {sector_name} | {investor_type} | 순매수: {net_purchase:.1f}억 | "
+    "매수: {buy_amount:.1f}억 | 매도: {sell_amount:.1f}억",
+    {"sector_name": "?", "investor_type": "?", "net_purchase": 0, "buy_amount": 0, "sell_amount": 0},
+)
+_WHALE_ROW = (
+    "- {name}({ticker}) | 고래점수: {whale_score:.1f} | {comp_str}",
+    {"name": "?", "ticker": "?", "whale_score": 0},
+)
+_WHALE_COMPONENT = (
+    "{investor}: 순매수{net_purchase:.0f}억, 매수{buy_days}일/매도{sell_days}일, 추세:{trend}",
+    {"net_purchase": 0, "buy_days": 0, "sell_days": 0, "trend": "?"},
+)
+_TREND_SECTOR_ROW = (
+    "- {sector} | RS_20일: {rs_vs_kospi_20d:.4f} | RS_60일: {rs_vs_kospi_60d:.4f} | "
+    "RS백분위: {rs_percentile}%",
+    {"sector": "?", "rs_vs_kospi_20d": 0, "rs_vs_kospi_60d": 0, "rs_percentile": 0},
+)
+_TREND_TOP_ROW = (
+    "- {name}({ticker}) | RS_20일: {rs_vs_kospi_20d:.4f} | RS_60일: {rs_vs_kospi_60d:.4f} | "
+    "RS백분위: {rs_percentile}% | 섹터: {sector}",
+    {
+        "name": "?", "ticker": "?", "sector": "?",
+        "rs_vs_kospi_20d": 0, "rs_vs_kospi_60d": 0, "rs_percentile": 0,
+    },
+)
+_NEWS_ROW = (
+    "- {name}({ticker}) | 기사수: {article_count} | 평균감성: {avg_sentiment:.3f} | "
+    "긍정: {positive_count} | 부정: {negative_count}",
+    {
+        "name": "?", "ticker": "?", "article_count": 0, "avg_sentiment": 0,
+        "positive_count": 0, "negative_count": 0,
+    },
+)
+_QUANT_ROW = (
+    "- {name}({ticker}) | 퀀트점수: {quant_score:.1f} | F-Score: {f_score} | "
+    "안전마진: {safety_margin:.1f}% | PER: {per} | PBR: {pbr}",
+    {
+        "name": "?", "ticker": "?", "quant_score": 0, "f_score": "N/A",
+        "safety_margin": 0, "per": "N/A", "pbr": "N/A",
+    },
+)
+_FLOW_ROW = (
+    "- {name}({ticker}) | {investor_type} | 순매수: {net_purchase:.1f}억 | "
+    "매수: {buy_amount:.1f}억 | 매도: {sell_amount:.1f}억",
+    {
+        "name": "?", "ticker": "?", "investor_type": "?",
+        "net_purchase": 0, "buy_amount": 0, "sell_amount": 0,
+    },
+)
+
+
+def _format_rows(row_format: tuple[str, dict[str, Any]], rows: list[dict[str, Any]]) -> list[str]:
+    """Render rows with a precompiled table template (see ``_SECTOR_FLOW_ROW`` etc.)."""
+    template, defaults = row_format
+    render = template.format_map
+    return [render({**defaults, **row}) for row in rows]
+
+
+# (label, key, printf format, suffix) for composite table columns
+_COMPOSITE_COLUMNS: tuple[tuple[str, str, str, str], ...] = (
+    ("종합", "composite_score", "%.1f", ""),
+    ("퀀트", "quant_score", "%.1f", ""),
+    ("수급", "whale_score", "%.1f", ""),
+    ("추세", "trend_score", "%.1f", ""),
+    ("시뮬레이션 중앙수익률", "simulation_median_return", "%.2f", "%"),
+)
+
+
+def _format_composite_table(rows: list[dict[str, Any]], cap: int) -> list[str]:
+    """Format composite score rows column-at-a-time.
+
+    Each numeric column is extracted once into a float array and formatted with a
+    single ``np.char.mod`` call; lines are assembled by element-wise string concat.
+    Missing (or None) scores render as 0, missing name/ticker as "?".
+    """
+    rows = rows[:cap]
+    if not rows:
+        return []
+
+    names = np.array([str(r.get("name", "?")) for r in rows], dtype=object)
+    tickers = np.array([str(r.get("ticker", "?")) for r in rows], dtype=object)
+    lines = "- " + names + "(" + tickers + ")"
+
+    for label, key, fmt, suffix in _COMPOSITE_COLUMNS:
+        values = np.array([r.get(key, 0) for r in rows], dtype=float)
+        formatted = np.char.mod(fmt, np.nan_to_num(values, nan=0.0)).astype(object)
+        lines = lines + f" | {label}: " + formatted + suffix
+
+    return lines.tolist()
+
+
+# Input-token budget for the full-report prompt. Tokens are estimated from character
+# count (Hangul-heavy text tokenizes at roughly 2 chars/token) to avoid an API round-trip.
+_PROMPT_TOKEN_BUDGET = 30_000
+_CHARS_PER_TOKEN = 2
+_PREVIOUS_REPORT_CHARS = 4000
+
+# Sections dropped (in order) when the prompt exceeds the budget — lowest priority first
+_PROMPT_SHRINK_ORDER = ("flow_data", "composite_bottom", "news_data", "sector_flows")
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap input-token estimate from character count."""
+    return len(text) // _CHARS_PER_TOKEN
+
+
+def _build_user_prompt(
+    data: MarketSummaryInput,
+    previous_report: str | None = None,
+    max_tokens: int = _PROMPT_TOKEN_BUDGET,
+) -> str:
+    """Build the user prompt with all data sections.
+
+    If the estimated prompt size exceeds ``max_tokens``, whole sections are dropped
+    following ``_PROMPT_SHRINK_ORDER`` until it fits (or nothing droppable remains).
+    """
     parts: list[str] = []
+    # section name -> (start, end) index range in parts, for budget shrinking
+    spans: dict[str, tuple[int, int]] = {}
     parts.append(f"# 시장 분석 데이터 ({data.trade_date})\n")
 
     # 1. Market stats
@@ -348,131 +506,84 @@ def _build_user_prompt(data: MarketSummaryInput, previous_report: str | None = N
 
     # 2. Sector flows (cap at 80)
     if data.sector_flows:
+        start = len(parts)
         parts.append("## [섹터별 수급 현황]")
-        for sf in data.sector_flows[:80]:
-            parts.append(
-                f"- {sf.get('sector_name', '?')} | {sf.get('investor_type', '?')} | "
-                f"순매수: {sf.get('net_purchase', 0):.1f}억 | "
-                f"매수: {sf.get('buy_amount', 0):.1f}억 | "
-                f"매도: {sf.get('sell_amount', 0):.1f}억"
-            )
+        parts.extend(_format_rows(_SECTOR_FLOW_ROW, data.sector_flows[:80]))
         parts.append("")
+        spans["sector_flows"] = (start, len(parts))
 
     # 3. Whale top (cap at 25)
     if data.whale_top:
         parts.append("## [고래 매집 상위 종목 (수급 강도)]")
+        comp_tmpl, comp_defaults = _WHALE_COMPONENT
+        whale_tmpl, whale_defaults = _WHALE_ROW
         for w in data.whale_top[:25]:
             comps = w.get("components", {})
             comp_str = " | ".join(
-                f"{k}: 순매수{v.get('net_purchase', 0):.0f}억, 매수{v.get('buy_days', 0)}일/매도{v.get('sell_days', 0)}일, 추세:{v.get('trend', '?')}"
+                comp_tmpl.format_map({**comp_defaults, **v, "investor": k})
                 for k, v in comps.items()
                 if isinstance(v, dict)
             )
-            parts.append(
-                f"- {w.get('name', '?')}({w.get('ticker', '?')}) | "
-                f"고래점수: {w.get('whale_score', 0):.1f} | {comp_str}"
-            )
+            parts.append(whale_tmpl.format_map({**whale_defaults, **w, "comp_str": comp_str}))
         parts.append("")
 
     # 4. Trend data — sector-level RS aggregates (cap at 40)
     if data.trend_data:
         parts.append("## [섹터별 추세/모멘텀 데이터 (RS 기준)]")
-        for t in sorted(data.trend_data, key=lambda x: x.get("rs_vs_kospi_20d", 0), reverse=True)[:40]:
-            parts.append(
-                f"- {t.get('sector', '?')} | "
-                f"RS_20일: {t.get('rs_vs_kospi_20d', 0):.4f} | "
-                f"RS_60일: {t.get('rs_vs_kospi_60d', 0):.4f} | "
-                f"RS백분위: {t.get('rs_percentile', 0)}%"
-            )
+        trend_sorted = sorted(data.trend_data, key=lambda x: x.get("rs_vs_kospi_20d", 0), reverse=True)
+        parts.extend(_format_rows(_TREND_SECTOR_ROW, trend_sorted[:40]))
         parts.append("")
 
     # 4b. Trend top — individual ticker leaders (cap at 20)
     if data.trend_top:
         parts.append("## [추세 상위 종목 (개별)]")
-        for t in data.trend_top[:20]:
-            parts.append(
-                f"- {t.get('name', '?')}({t.get('ticker', '?')}) | "
-                f"RS_20일: {t.get('rs_vs_kospi_20d', 0):.4f} | "
-                f"RS_60일: {t.get('rs_vs_kospi_60d', 0):.4f} | "
-                f"RS백분위: {t.get('rs_percentile', 0)}% | "
-                f"섹터: {t.get('sector', '?')}"
-            )
+        parts.extend(_format_rows(_TREND_TOP_ROW, data.trend_top[:20]))
         parts.append("")
 
     # 5. News data (cap at 30)
     if data.news_data:
+        start = len(parts)
         parts.append("## [뉴스 감성 분석 데이터]")
         if isinstance(data.news_data, list):
-            for n in data.news_data[:30]:
-                parts.append(
-                    f"- {n.get('name', '?')}({n.get('ticker', '?')}) | "
-                    f"기사수: {n.get('article_count', 0)} | "
-                    f"평균감성: {n.get('avg_sentiment', 0):.3f} | "
-                    f"긍정: {n.get('positive_count', 0)} | "
-                    f"부정: {n.get('negative_count', 0)}"
-                )
+            parts.extend(_format_rows(_NEWS_ROW, data.news_data[:30]))
         else:
             parts.append(json.dumps(data.news_data, ensure_ascii=False, default=str))
         parts.append("")
+        spans["news_data"] = (start, len(parts))
 
     # 5b. Quant top (cap at 20)
     if data.quant_data:
         parts.append("## [퀀트 분석 상위 종목]")
-        for q in data.quant_data[:20]:
-            parts.append(
-                f"- {q.get('name', '?')}({q.get('ticker', '?')}) | "
-                f"퀀트점수: {q.get('quant_score', 0):.1f} | "
-                f"F-Score: {q.get('f_score', 'N/A')} | "
-                f"안전마진: {q.get('safety_margin', 0):.1f}% | "
-                f"PER: {q.get('per', 'N/A')} | PBR: {q.get('pbr', 'N/A')}"
-            )
+        parts.extend(_format_rows(_QUANT_ROW, data.quant_data[:20]))
         parts.append("")
 
     # 6. Composite top (cap at 25)
     if data.composite_top:
         parts.append("## [종합점수 상위 종목]")
-        for c in data.composite_top[:25]:
-            parts.append(
-                f"- {c.get('name', '?')}({c.get('ticker', '?')}) | "
-                f"종합: {c.get('composite_score', 0):.1f} | "
-                f"퀀트: {c.get('quant_score', 0):.1f} | "
-                f"수급: {c.get('whale_score', 0):.1f} | "
-                f"추세: {c.get('trend_score', 0):.1f} | "
-                f"시뮬레이션 중앙수익률: {c.get('simulation_median_return', 0):.2f}%"
-            )
+        parts.extend(_format_composite_table(data.composite_top, 25))
         parts.append("")
 
     # 7. Composite bottom (cap at 25)
     if data.composite_bottom:
+        start = len(parts)
         parts.append("## [종합점수 하위 종목]")
-        for c in data.composite_bottom[:25]:
-            parts.append(
-                f"- {c.get('name', '?')}({c.get('ticker', '?')}) | "
-                f"종합: {c.get('composite_score', 0):.1f} | "
-                f"퀀트: {c.get('quant_score', 0):.1f} | "
-                f"수급: {c.get('whale_score', 0):.1f} | "
-                f"추세: {c.get('trend_score', 0):.1f} | "
-                f"시뮬레이션 중앙수익률: {c.get('simulation_median_return', 0):.2f}%"
-            )
+        parts.extend(_format_composite_table(data.composite_bottom, 25))
         parts.append("")
+        spans["composite_bottom"] = (start, len(parts))
 
     # 8. Flow data - divergence (cap at 25)
     if data.flow_data:
+        start = len(parts)
         parts.append("## [수급 상세 데이터 (투자자별)]")
-        for f in data.flow_data[:25]:
-            parts.append(
-                f"- {f.get('name', '?')}({f.get('ticker', '?')}) | "
-                f"{f.get('investor_type', '?')} | "
-                f"순매수: {f.get('net_purchase', 0):.1f}억 | "
-                f"매수: {f.get('buy_amount', 0):.1f}억 | "
-                f"매도: {f.get('sell_amount', 0):.1f}억"
-            )
+        parts.extend(_format_rows(_FLOW_ROW, data.flow_data[:25]))
         parts.append("")
+        spans["flow_data"] = (start, len(parts))
 
-    # 9. Previous report for comparison
+    # 9. Previous report for comparison — keep the tail, where the strategy and
+    # watchlist sections (most often referenced in the comparison) live
     if previous_report:
         parts.append("## [이전 리포트 (비교 참고용)]")
-        parts.append(previous_report[:4000])
+        parts.append(previous_report[-_PREVIOUS_REPORT_CHARS:])
         parts.append("")
     else:
         parts.append("## [이전 리포트]")
@@ -484,7 +595,29 @@ def _build_user_prompt(data: MarketSummaryInput, previous_report: str | None = N
         "반드시 지정된 섹션 순서와 ## 헤더 형식을 따라주세요."
     )
 
-    return "\n".join(parts)
+    prompt = "\n".join(parts)
+    dropped: set[int] = set()
+    for name in _PROMPT_SHRINK_ORDER:
+        estimate = _estimate_tokens(prompt)
+        if estimate <= max_tokens:
+            break
+        if name not in spans:
+            continue
+        dropped.update(range(*spans[name]))
+        prompt = "\n".join(p for i, p in enumerate(parts) if i not in dropped)
+        logger.warning(
+            "Market report prompt over budget (~%d > %d tokens), dropped section: %s",
+            estimate, max_tokens, name,
+        )
+
+    estimate = _estimate_tokens(prompt)
+    if estimate > max_tokens:
+        logger.warning(
+            "Market report prompt still over budget after dropping sections (~%d > %d tokens)",
+            estimate, max_tokens,
+        )
+
+    return prompt
 
 
 # ---------------------------------------------------------------------------
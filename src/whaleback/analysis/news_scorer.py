@@ -4,167 +4,675 @@ Stage 1: BERT local inference (KLUE-RoBERTa) for all articles
 Stage 2: LLM escalation (Claude Haiku) for low-confidence results
 """
 
+import hashlib
+import importlib.util
+import json
 import logging
-from typing import Any
+import random
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 # BERT model config
 BERT_MODEL_NAME = "FISA-conclave/klue-roberta-news-sentiment"
-BERT_LABEL_MAP = {
-    "LABEL_0": ("negative", -1.0),
-    "LABEL_1": ("neutral", 0.0),
-    "LABEL_2": ("positive", 1.0),
+# Sentiment classes, indexed by class id
+NEGATIVE, NEUTRAL, POSITIVE = 0, 1, 2
+_CLASS_LABELS = ("negative", "neutral", "positive")
+
+# Known model labels -> class id
+_LABEL_TO_CLASS = {
+    "LABEL_0": NEGATIVE,
+    "LABEL_1": NEUTRAL,
+    "LABEL_2": POSITIVE,
     # Some models use text labels
-    "negative": ("negative", -1.0),
-    "neutral": ("neutral", 0.0),
-    "positive": ("positive", 1.0),
+    "negative": NEGATIVE,
+    "neutral": NEUTRAL,
+    "positive": POSITIVE,
 }
+# Fallback for unknown labels: infer polarity from label text
+_POSNEG_RE = re.compile(r"(?i)(pos|neg)")
+
+# ONNX Runtime export (optional: pip install ".[news-onnx]").
+# Exported once from BERT_MODEL_NAME by ``whaleback export-bert-onnx``; on CPU the
+# dynamically INT8-quantized model runs on VNNI int8 matmuls, on GPU the FP32 graph is
+# built into a TensorRT FP16 engine. Scoring only loads an existing export.
+BERT_ONNX_DIR = Path(".cache") / "bert-onnx"
+_BERT_BATCH_SIZE = 32
+# TensorRT engines are profiled per input shape; padding to a few fixed sequence
+# lengths keeps the number of engine shapes small.
+_BERT_LENGTH_BUCKETS = (32, 64, 128, 256, 512)
+_BERT_ONNX_FILES = ("model.onnx", "model_quantized.onnx")
+
+
+@dataclass
+class _BertOnnxSession:
+    """Loaded ONNX Runtime BERT model."""
+
+    tokenizer: Any
+    session: Any
+    labels: list[str]  # model label of each logit column
+    on_gpu: bool = False
+    backend: str = "onnx-int8"  # backend/precision tag, part of the BERT cache key
+
+
+# On-disk result cache (opt-in via score_articles(cache_path=...)): repeated articles
+# across runs skip BERT/LLM entirely. Keys hash the model backend or the prompt version
+# with the text, so a model or prompt change starts fresh.
+SENTIMENT_CACHE_TTL = 86400 * 7  # seconds
+LLM_MODEL_NAME = "claude-haiku-4-5-20251001"
+
+
+class _SentimentCache:
+    """Content-addressed sentiment result cache (SQLite, JSON values, TTL expiry).
+
+    Expired rows are purged when the cache is opened. Cache errors are logged and
+    treated as misses; scoring never fails on the cache.
+    """
+
+    # Stay under SQLite's host-parameter limit for IN (...) lookups
+    _CHUNK = 500
+    # Result dicts hold only ASCII labels and pre-rounded floats: compact separators
+    # keep rows small, and one reused encoder skips per-call json.dumps setup
+    _encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def __init__(self, path: Path, ttl: float = SENTIMENT_CACHE_TTL):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM sentiment WHERE expires_at <= ?", (time.time(),))
+
+    @staticmethod
+    def key(namespace: str, identity: str) -> str:
+        digest = hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()
+        return f"{namespace}:{digest}"
+
+    def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        found: dict[str, dict[str, Any]] = {}
+        now = time.time()
+        try:
+            for start in range(0, len(keys), self._CHUNK):
+                chunk = keys[start:start + self._CHUNK]
+                rows = self._conn.execute(
+                    "SELECT key, value FROM sentiment WHERE expires_at > ? "
+                    f"AND key IN ({','.join('?' * len(chunk))})",
+                    (now, *chunk),
+                )
+                found.update((k, json.loads(v)) for k, v in rows)
+        except sqlite3.Error as e:
+            logger.warning("Sentiment cache read failed: %s", e)
+        return found
+
+    def set_many(self, items: dict[str, dict[str, Any]]) -> None:
+        if not items:
+            return
+        expires_at = time.time() + self._ttl
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO sentiment (key, value, expires_at) VALUES (?, ?, ?)",
+                    [(k, self._encode(v), expires_at) for k, v in items.items()],
+                )
+        except sqlite3.Error as e:
+            logger.warning("Sentiment cache write failed: %s", e)
+
 
 # Singleton caches
-_bert_pipeline = None
+_sentiment_caches: dict[Path, _SentimentCache] = {}
+_bert_tokenizer = None
+_bert_model = None
+_bert_onnx: _BertOnnxSession | bool | None = None  # False if unavailable
 _anthropic_client = None
 _anthropic_api_key_cached = None
 
+# Connection pool for LLM escalation: sized above the default llm_concurrency so
+# bursts reuse warm keep-alive connections. HTTP/2 (multiplexed streams over one
+# TLS connection) is used when the optional h2 package is installed.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+# Warming is only worth waiting for briefly: the client itself retries for minutes
+_WARMUP_TIMEOUT = 2.0
+
 
 def _get_anthropic_client(api_key: str):
-    """Lazy-load Anthropic async client (singleton)."""
+    """Lazy-load Anthropic async client (singleton, pooled connections)."""
     global _anthropic_client, _anthropic_api_key_cached
     if _anthropic_client is not None and _anthropic_api_key_cached == api_key:
         return _anthropic_client
     import anthropic
-    _anthropic_client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=5)
+    _anthropic_client = anthropic.AsyncAnthropic(
+        api_key=api_key,
+        max_retries=5,
+        http_client=httpx.AsyncClient(
+            http2=_HTTP2, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT,
+        ),
+    )
     _anthropic_api_key_cached = api_key
     return _anthropic_client
 
 
-def _get_bert_pipeline():
-    """Lazy-load BERT sentiment pipeline (singleton)."""
-    global _bert_pipeline
-    if _bert_pipeline is not None:
-        return _bert_pipeline
+async def _warm_anthropic_client(api_key: str) -> None:
+    """Open a pooled connection to the API ahead of LLM escalation (best effort).
 
+    Lists models instead of sending a message, so warming costs no tokens.
+    """
     try:
-        from transformers import pipeline
-        _bert_pipeline = pipeline(
-            "text-classification",
-            model=BERT_MODEL_NAME,
-            top_k=None,  # return all class probabilities
-            truncation=True,
-            max_length=512,
+        await _get_anthropic_client(api_key).models.list(limit=1)
+    except Exception as e:
+        logger.debug("Anthropic client warmup failed: %s", e)
+
+
+def _get_sentiment_cache(path: str | Path) -> _SentimentCache | None:
+    """Lazy-open the on-disk sentiment cache at ``path`` (one per path); None on failure."""
+    path = Path(path)
+    cache = _sentiment_caches.get(path)
+    if cache is None:
+        try:
+            cache = _sentiment_caches[path] = _SentimentCache(path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Sentiment cache unavailable: %s", e)
+            return None
+    return cache
+
+
+def _get_bert_model(compile_model: bool = False):
+    """Lazy-load BERT tokenizer and sequence-classification model (singleton).
+
+    ``compile_model`` applies ``_compile_bert_model`` when the model is first loaded.
+    Returns (tokenizer, model), or None if transformers/torch are unavailable.
+    """
+    global _bert_tokenizer, _bert_model
+    if _bert_model is not None:
+        return _bert_tokenizer, _bert_model
+
+    try:
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        on_gpu = torch.cuda.is_available()
+        tokenizer = AutoTokenizer.from_pretrained(BERT_MODEL_NAME)
+        model = AutoModelForSequenceClassification.from_pretrained(
+            BERT_MODEL_NAME,
+            torch_dtype=torch.float16 if on_gpu else torch.float32,
         )
-        logger.info("BERT sentiment model loaded: %s", BERT_MODEL_NAME)
-        return _bert_pipeline
+        model.to("cuda" if on_gpu else "cpu").eval()
+        if compile_model:
+            _compile_bert_model(model, tokenizer)
+        _bert_tokenizer, _bert_model = tokenizer, model
+        logger.info(
+            "BERT sentiment model loaded: %s (%s)", BERT_MODEL_NAME, "cuda" if on_gpu else "cpu",
+        )
+        return _bert_tokenizer, _bert_model
     except Exception as e:
         logger.warning("Failed to load BERT model: %s", e)
         return None
 
 
-def score_article_bert(text: str) -> dict[str, Any] | None:
-    """Score a single article using BERT.
+def _compile_bert_model(model, tokenizer) -> None:
+    """torch.compile the model's forward in place (CUDA only, opt-in), best effort.
 
-    Args:
-        text: Article title + description text.
+    "reduce-overhead" uses CUDA graphs to remove per-call Python overhead. Compilation
+    happens on the first forward call, so a warm-up batch is run here and the eager
+    forward is restored if it fails; the eager model keeps working either way.
+    """
+    import torch
 
-    Returns:
-        {sentiment_raw, sentiment_label, sentiment_confidence, scoring_method}
-        or None if model unavailable.
+    if not torch.cuda.is_available():
+        return
+
+    eager_forward = model.forward
+    try:
+        model.forward = torch.compile(eager_forward, mode="reduce-overhead", dynamic=True)
+        _bert_logits_torch(["워밍업"], tokenizer, model)
+    except Exception as e:
+        model.forward = eager_forward
+        logger.warning("torch.compile not applied, using eager model: %s", e)
+
+
+def _bert_onnx_exported() -> bool:
+    """Whether ``export_bert_onnx`` has written both ONNX models."""
+    return all((BERT_ONNX_DIR / name).exists() for name in _BERT_ONNX_FILES)
+
+
+def export_bert_onnx() -> Path:
+    """Export BERT_MODEL_NAME to ONNX (FP32 + dynamic INT8) under ``BERT_ONNX_DIR``.
+
+    Run once ahead of scoring (``whaleback export-bert-onnx``); requires the
+    ``news-onnx`` extra. Overwrites an existing export. Returns the export directory.
     """
-    pipe = _get_bert_pipeline()
-    if pipe is None:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    logger.info("Exporting BERT model to ONNX (INT8): %s", BERT_ONNX_DIR)
+    ort_model = ORTModelForSequenceClassification.from_pretrained(BERT_MODEL_NAME, export=True)
+    ort_model.save_pretrained(BERT_ONNX_DIR)
+    quantizer = ORTQuantizer.from_pretrained(ort_model)
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=BERT_ONNX_DIR, quantization_config=qconfig)
+    return BERT_ONNX_DIR
+
+
+def _get_bert_onnx_session():
+    """Lazy-load ONNX Runtime session for BERT (singleton).
+
+    Uses TensorRT (FP16) or CUDA when onnxruntime-gpu exposes them, otherwise the
+    INT8-quantized model on CPU. Returns None when onnxruntime is not installed, no
+    export exists (see ``export_bert_onnx``) or loading fails; callers then fall back
+    to the transformers model.
+    """
+    global _bert_onnx
+    if _bert_onnx is not None:
+        return _bert_onnx or None
+
+    try:
+        import onnxruntime as ort
+        from transformers import AutoConfig, AutoTokenizer
+    except ImportError:
+        _bert_onnx = False
+        return None
+
+    if not _bert_onnx_exported():
+        logger.info("No BERT ONNX export in %s (run `whaleback export-bert-onnx`)", BERT_ONNX_DIR)
+        _bert_onnx = False
         return None
 
     try:
-        results = pipe(text[:512])  # truncate input
-        if not results:
-            return None
+        model_path = BERT_ONNX_DIR / "model.onnx"
+        quantized_path = BERT_ONNX_DIR / "model_quantized.onnx"
+        tokenizer = AutoTokenizer.from_pretrained(BERT_MODEL_NAME)
+        config = AutoConfig.from_pretrained(BERT_MODEL_NAME)
+        labels = [config.id2label[i] for i in range(config.num_labels)]
+
+        providers = _onnx_providers(ort.get_available_providers())
+        quantized = _provider_name(providers[0]) == "CPUExecutionProvider"
+        path = quantized_path if quantized else model_path
+        session = ort.InferenceSession(str(path), providers=providers)
+        # ORT silently falls back to later providers when one fails to start,
+        # so the backend is taken from the provider that actually runs the session
+        provider = session.get_providers()[0]
+        backend = _onnx_backend(provider, quantized)
+        _bert_onnx = _BertOnnxSession(
+            tokenizer, session, labels, provider != "CPUExecutionProvider", backend,
+        )
+        logger.info("BERT ONNX session loaded: %s (%s, %s)", path, provider, backend)
+        return _bert_onnx
+    except Exception as e:
+        logger.warning("Failed to load BERT ONNX session, using transformers model: %s", e)
+        _bert_onnx = False
+        return None
 
-        # results is list of list of dicts: [[{label, score}, ...]]
-        predictions = results[0] if isinstance(results[0], list) else results
-
-        # Find best prediction
-        best = max(predictions, key=lambda x: x["score"])
-        label_key = best["label"]
-        confidence = float(best["score"])
-
-        label_info = BERT_LABEL_MAP.get(label_key)
-        if label_info is None:
-            # Try to infer from label text
-            label_lower = label_key.lower()
-            if "pos" in label_lower:
-                label_info = ("positive", 1.0)
-            elif "neg" in label_lower:
-                label_info = ("negative", -1.0)
-            else:
-                label_info = ("neutral", 0.0)
 
-        sentiment_label, base_score = label_info
+def _trt_shapes(batch: int, length: int) -> str:
+    return f"input_ids:{batch}x{length},attention_mask:{batch}x{length}"
+
+
+def _onnx_providers(available: list[str]) -> list[Any]:
+    """ONNX Runtime providers in preference order: TensorRT (FP16 engine), CUDA, CPU.
+
+    GPU providers run the FP32 export; CPU alone runs the INT8 export. The TensorRT
+    profile covers every batch ``_bert_logits`` can produce.
+    """
+    if "TensorrtExecutionProvider" in available:
+        trt_options = {
+            "trt_fp16_enable": True,
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": str(BERT_ONNX_DIR / "trt"),
+            "trt_profile_min_shapes": _trt_shapes(1, _BERT_LENGTH_BUCKETS[0]),
+            "trt_profile_opt_shapes": _trt_shapes(_BERT_BATCH_SIZE, 256),
+            "trt_profile_max_shapes": _trt_shapes(_BERT_BATCH_SIZE, _BERT_LENGTH_BUCKETS[-1]),
+        }
+        return [
+            ("TensorrtExecutionProvider", trt_options),
+            "CUDAExecutionProvider",
+            "CPUExecutionProvider",
+        ]
+    if "CUDAExecutionProvider" in available:
+        return ["CUDAExecutionProvider", "CPUExecutionProvider"]
+    return ["CPUExecutionProvider"]
+
+
+def _provider_name(provider: Any) -> str:
+    """Name of a provider entry (plain name or (name, options))."""
+    return provider if isinstance(provider, str) else provider[0]
+
+
+_ONNX_BACKENDS = {
+    "TensorrtExecutionProvider": "onnx-trt-fp16",
+    "CUDAExecutionProvider": "onnx-cuda-fp32",
+    "CPUExecutionProvider": "onnx-cpu-fp32",
+}
+
+
+def _onnx_backend(provider: str, quantized: bool) -> str:
+    """Backend tag for an ONNX session running ``provider`` on the (INT8) export."""
+    return "onnx-int8" if quantized else _ONNX_BACKENDS.get(provider, f"onnx-{provider}")
+
+
+def _bucket_length(length: int) -> int:
+    """Round a sequence length up to the nearest entry of ``_BERT_LENGTH_BUCKETS``."""
+    for bucket in _BERT_LENGTH_BUCKETS:
+        if length <= bucket:
+            return bucket
+    return _BERT_LENGTH_BUCKETS[-1]
+
+
+def _bert_logits(
+    texts: list[str],
+    tokenizer,
+    forward: Callable[[dict[str, np.ndarray]], np.ndarray],
+    bucket_pad: bool = False,
+) -> np.ndarray:
+    """Length-bucketed batched BERT forward pass.
+
+    Texts are tokenized once, sorted by token length and batched in that order so each
+    batch pads only to its own longest member (instead of an arbitrary long article in
+    a batch of short headlines). ``bucket_pad`` further rounds the pad length up to
+    ``_BERT_LENGTH_BUCKETS`` (for shape-specialized GPU engines).
+
+    Returns:
+        (len(texts), num_labels) float32 logits in the original text order.
+    """
+    enc = tokenizer(texts, truncation=True, max_length=512)
+    keys = list(enc.keys())
+    order = np.argsort([len(ids) for ids in enc["input_ids"]], kind="stable")
+    logits: np.ndarray | None = None
+
+    for start in range(0, len(order), _BERT_BATCH_SIZE):
+        idx = order[start:start + _BERT_BATCH_SIZE]
+        batch = {k: [enc[k][i] for i in idx] for k in keys}
+        pad_len = max(len(ids) for ids in batch["input_ids"])
+        if bucket_pad:
+            pad_len = _bucket_length(pad_len)
+        batch = tokenizer.pad(batch, padding="max_length", max_length=pad_len, return_tensors="np")
+        out = forward(batch)
+        if logits is None:
+            logits = np.empty((len(texts), out.shape[1]), dtype=np.float32)
+        logits[idx] = out
 
-        # Refine score using class probabilities for a continuous [-1, +1] value
-        pos_score = 0.0
-        neg_score = 0.0
-        for pred in predictions:
-            pred_label = pred["label"].lower()
-            if "pos" in pred_label or pred_label == "label_2":
-                pos_score = pred["score"]
-            elif "neg" in pred_label or pred_label == "label_0":
-                neg_score = pred["score"]
+    return logits if logits is not None else np.empty((0, 0), dtype=np.float32)
 
-        # Continuous score: positive probability - negative probability
-        sentiment_raw = pos_score - neg_score
-        sentiment_raw = max(-1.0, min(1.0, sentiment_raw))
 
+def _bert_logits_onnx(texts: list[str], onnx: _BertOnnxSession) -> np.ndarray:
+    """Run texts through the ONNX Runtime session."""
+    session = onnx.session
+    input_names = [i.name for i in session.get_inputs()]
+
+    def forward(batch: dict[str, np.ndarray]) -> np.ndarray:
+        return session.run(None, {name: batch[name] for name in input_names})[0]
+
+    return _bert_logits(texts, onnx.tokenizer, forward, bucket_pad=onnx.on_gpu)
+
+
+def _bert_logits_torch(texts: list[str], tokenizer, model) -> np.ndarray:
+    """Run texts through the torch model directly (no pipeline pre/post-processing)."""
+    import torch
+
+    def forward(batch: dict[str, np.ndarray]) -> np.ndarray:
+        inputs = {k: torch.from_numpy(v).to(model.device) for k, v in batch.items()}
+        with torch.inference_mode():
+            return model(**inputs).logits.float().cpu().numpy()
+
+    return _bert_logits(texts, tokenizer, forward)
+
+
+def _classify(label: str) -> int:
+    """Map a model label to a sentiment class id (unknown labels default to neutral)."""
+    class_id = _LABEL_TO_CLASS.get(label)
+    if class_id is not None:
+        return class_id
+    m = _POSNEG_RE.search(label)
+    if m is None:
+        return NEUTRAL
+    return POSITIVE if m.group(1).lower() == "pos" else NEGATIVE
+
+
+def _label_columns(labels: list[str]) -> tuple[list[str], int | None, int | None]:
+    """Resolve model labels to (sentiment label per column, positive column, negative column)."""
+    classes = [_classify(label) for label in labels]
+    pos_col = classes.index(POSITIVE) if POSITIVE in classes else None
+    neg_col = classes.index(NEGATIVE) if NEGATIVE in classes else None
+    return [_CLASS_LABELS[c] for c in classes], pos_col, neg_col
+
+
+@dataclass
+class _BertScores:
+    """Stage 1 results as parallel arrays; per-article dicts are built only on use."""
+
+    raw: np.ndarray  # P(pos) - P(neg), rounded to 4 places
+    confidence: np.ndarray  # argmax probability, rounded to 3 places; NaN if unscored
+    labels: list[str]
+
+    @classmethod
+    def empty(cls, n: int) -> "_BertScores":
+        return cls(np.zeros(n), np.full(n, np.nan), [""] * n)
+
+    def set(self, i: int, result: dict[str, Any]) -> None:
+        self.raw[i] = result["sentiment_raw"]
+        self.confidence[i] = result["sentiment_confidence"]
+        self.labels[i] = result["sentiment_label"]
+
+    def result(self, i: int) -> dict[str, Any]:
+        """Result dict of a scored entry (callers check ``confidence`` for NaN first)."""
         return {
-            "sentiment_raw": round(sentiment_raw, 4),
-            "sentiment_label": sentiment_label,
-            "sentiment_confidence": round(confidence, 3),
+            "sentiment_raw": float(self.raw[i]),
+            "sentiment_label": self.labels[i],
+            "sentiment_confidence": float(self.confidence[i]),
             "scoring_method": "bert",
         }
 
+
+def _bert_scores_from_logits(logits: np.ndarray, labels: list[str]) -> _BertScores:
+    """Convert (N, num_labels) logits into per-article sentiment scores.
+
+    Softmax, argmax label, confidence and the continuous ``P(pos) - P(neg)`` score are
+    computed and rounded for the whole batch at once.
+    """
+    column_labels, pos_col, neg_col = _label_columns(labels)
+
+    # Numerically stable softmax over classes
+    exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+    probs = exp / exp.sum(axis=1, keepdims=True)
+
+    best = probs.argmax(axis=1)
+    confidence = probs[np.arange(len(probs)), best].astype(np.float64)
+    zeros = np.zeros(len(probs))
+    pos = probs[:, pos_col] if pos_col is not None else zeros
+    neg = probs[:, neg_col] if neg_col is not None else zeros
+    sentiment_raw = np.clip(pos - neg, -1.0, 1.0).astype(np.float64)
+    np.round(sentiment_raw, 4, out=sentiment_raw)
+    np.round(confidence, 3, out=confidence)
+
+    return _BertScores(sentiment_raw, confidence, [column_labels[b] for b in best])
+
+
+# Keyword pre-filter: boilerplate notices are scored neutral without BERT; the polar
+# market terms only decide a class when explicitly enabled (see score_article_keyword).
+# Spaces in a term also match the unspaced spelling ("어닝 쇼크" / "어닝쇼크").
+_KEYWORD_TERMS = {
+    POSITIVE: (
+        "흑자 전환", "사상 최대", "어닝 서프라이즈", "상한가", "신고가", "호실적",
+        "실적 개선", "목표가 상향", "자사주 소각", "수주 계약", "최대 실적",
+    ),
+    NEGATIVE: (
+        "적자 전환", "어닝 쇼크", "하한가", "신저가", "상장 폐지", "거래 정지",
+        "횡령", "배임", "목표가 하향", "실적 부진", "감사의견 거절",
+        "부도 처리", "부도 위기", "최종 부도",
+    ),
+    # Boilerplate notices (earnings/IR schedules, IPO calendars)
+    NEUTRAL: (
+        "실적 발표 일정", "실적발표 예정", "기업 설명회", "IR 개최", "공모 일정",
+        "청약 일정", "상장 예정일", "주주총회 소집",
+    ),
+}
+_KEYWORD_CLASS = {
+    re.sub(r"\s+", "", term): class_id
+    for class_id, terms in _KEYWORD_TERMS.items()
+    for term in terms
+}
+_KEYWORD_RE = re.compile(
+    "|".join(
+        r"\s*".join(map(re.escape, term.split()))
+        for terms in _KEYWORD_TERMS.values()
+        for term in sorted(terms, key=len, reverse=True)
+    )
+)
+# Failure, cancellation and reversal words flip or void a keyword's meaning
+# ("흑자 전환 실패", "수주 계약 해지", "상한가 후 급락"): any of them defers to BERT
+_KEYWORD_GUARD_RE = re.compile("실패|무산|불발|해지|취소|철회|급락|급등|반락|반등")
+_KEYWORD_CONFIDENCE = 0.85
+
+
+def score_article_keyword(text: str, polar: bool = False) -> dict[str, Any] | None:
+    """Score an article from keyword hits alone.
+
+    Returns a result only when every matched term has the same class and no guard
+    word is present; texts with no hits, mixed signals or guard words return None and
+    go to BERT. Positive/negative hits decide only when ``polar`` is set; by default
+    only neutral boilerplate notices are scored here.
+    """
+    classes = {_KEYWORD_CLASS[re.sub(r"\s+", "", m)] for m in _KEYWORD_RE.findall(text)}
+    if len(classes) != 1 or _KEYWORD_GUARD_RE.search(text):
+        return None
+    class_id = classes.pop()
+    if class_id != NEUTRAL and not polar:
+        return None
+    return {
+        "sentiment_raw": (-1.0, 0.0, 1.0)[class_id] * _KEYWORD_CONFIDENCE,
+        "sentiment_label": _CLASS_LABELS[class_id],
+        "sentiment_confidence": _KEYWORD_CONFIDENCE,
+        "scoring_method": "keyword",
+    }
+
+
+def _bert_score_texts(texts: list[str], compile_model: bool = False) -> _BertScores | None:
+    """Batch-score texts with BERT (ONNX Runtime if available, else transformers).
+
+    ``compile_model`` is passed to ``_get_bert_model`` for the transformers path.
+    Blocking; returns None if no model is available or inference fails.
+    """
+    onnx = _get_bert_onnx_session()
+    torch_model = None
+    if onnx is None:
+        torch_model = _get_bert_model(compile_model=compile_model)
+        if torch_model is None:
+            return None
+
+    try:
+        if torch_model is None:
+            logits = _bert_logits_onnx(texts, onnx)
+            labels = onnx.labels
+        else:
+            tokenizer, model = torch_model
+            logits = _bert_logits_torch(texts, tokenizer, model)
+            id2label = model.config.id2label
+            labels = [id2label[i] for i in range(logits.shape[1])]
+        return _bert_scores_from_logits(logits, labels)
     except Exception as e:
-        logger.warning("BERT scoring failed: %s", e)
+        logger.warning("Batch BERT scoring failed: %s", e)
         return None
 
 
+def _bert_backend_tag() -> str:
+    """Backend/precision tag of the BERT model, e.g. "onnx-int8" or "torch-fp16".
+
+    INT8, FP16 and FP32 logits differ slightly, so the tag is part of the BERT cache
+    key. Once a model is loaded its tag is returned; before that the tag is inferred
+    from the installed runtimes and devices, without loading (or exporting) a model,
+    so a fully cached run never pays for it. "none" if no runtime is installed.
+    """
+    if isinstance(_bert_onnx, _BertOnnxSession):
+        return _bert_onnx.backend
+    if _bert_model is not None:
+        return "torch-fp16" if str(_bert_model.dtype) == "torch.float16" else "torch-fp32"
+
+    find_spec = importlib.util.find_spec
+    if _bert_onnx is None and find_spec("onnxruntime") and _bert_onnx_exported():
+        import onnxruntime as ort
+
+        provider = _provider_name(_onnx_providers(ort.get_available_providers())[0])
+        return _onnx_backend(provider, quantized=provider == "CPUExecutionProvider")
+    if find_spec("torch") and find_spec("transformers"):
+        import torch
+
+        return "torch-fp16" if torch.cuda.is_available() else "torch-fp32"
+    return "none"
+
+
+def score_article_bert(text: str) -> dict[str, Any] | None:
+    """Score a single article using BERT.
+
+    Runs through the same backend as batch scoring (``_bert_score_texts``), so a text
+    gets the same score alone as in a batch.
+
+    Args:
+        text: Article title + description text.
+
+    Returns:
+        {sentiment_raw, sentiment_label, sentiment_confidence, scoring_method}
+        or None if model unavailable.
+    """
+    scores = _bert_score_texts([text[:512]])
+    return scores.result(0) if scores is not None else None
+
+
+# Invariant instructions go in a cacheable system block so only the short
+# per-article user message changes between requests.
+_SENTIMENT_SYSTEM_PROMPT = """주어진 종목에 대한 뉴스 기사의 감성을 분석합니다.
+
+두 줄로만 답하세요:
+sentiment: positive/neutral/negative
+score: 0.0~1.0 확신도"""
+
+_SENTIMENT_SYSTEM = [
+    {"type": "text", "text": _SENTIMENT_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+
+
 def _build_sentiment_prompt(text: str, ticker: str) -> str:
-    """Build sentiment analysis prompt for LLM."""
-    return f"""주식 종목 {ticker}에 대한 다음 뉴스 기사의 감성을 분석해주세요.
+    """Build the per-article part of the sentiment prompt (see ``_SENTIMENT_SYSTEM``)."""
+    return f"종목: {ticker}\n기사: {text[:500]}"
 
-기사: {text[:500]}
 
-다음 형식으로만 응답해주세요:
-sentiment: [positive/neutral/negative]
-score: [0.0~1.0 사이의 확신도]
-reason: [한 줄 이유]"""
+_LLM_SENTIMENT_RE = re.compile(r"(?i)\b(positive|neutral|negative)\b")
+# "score: <x>" anywhere, or a bare number only on a line of its own ("1. ..." is no score)
+_LLM_SCORE_RE = re.compile(r"(?im)(?:score\s*:\s*|^\s*(?=\d*\.?\d+\s*$))(\d*\.?\d+)")
+# A streamed "score:" value is complete once any other character follows it
+_LLM_SCORE_DONE_RE = re.compile(r"(?i)score\s*:\s*\d*\.?\d+[^\d.]")
 
 
 def _parse_llm_response(response_text: str) -> dict[str, Any]:
-    """Parse structured LLM sentiment response."""
-    sentiment_label = "neutral"
-    confidence = 0.5
-    for line in response_text.split("\n"):
-        line = line.strip().lower()
-        if line.startswith("sentiment:"):
-            val = line.split(":", 1)[1].strip()
-            if "positive" in val:
-                sentiment_label = "positive"
-            elif "negative" in val:
-                sentiment_label = "negative"
-            else:
-                sentiment_label = "neutral"
-        elif line.startswith("score:"):
-            try:
-                confidence = float(line.split(":", 1)[1].strip())
-            except ValueError:
-                confidence = 0.5
+    """Parse structured LLM sentiment response.
+
+    Accepts ``sentiment: <label>`` / ``score: <x>`` lines as well as bare label and
+    number lines. Confidence is clamped to [0, 1].
+    """
+    m = _LLM_SENTIMENT_RE.search(response_text)
+    class_id = _LABEL_TO_CLASS[m.group(1).lower()] if m else NEUTRAL
+    m = _LLM_SCORE_RE.search(response_text)
+    return _llm_result(class_id, float(m.group(1)) if m else 0.5)
+
 
-    score_map = {"positive": 1.0, "neutral": 0.0, "negative": -1.0}
-    raw_base = score_map.get(sentiment_label, 0.0)
-    sentiment_raw = raw_base * confidence
+def _llm_result(class_id: int, confidence: float) -> dict[str, Any]:
+    """Build an LLM sentiment result; confidence is clamped to [0, 1]."""
+    confidence = min(max(confidence, 0.0), 1.0)
+    sentiment_raw = (-1.0, 0.0, 1.0)[class_id] * confidence
 
     return {
         "sentiment_raw": round(sentiment_raw, 4),
-        "sentiment_label": sentiment_label,
+        "sentiment_label": _CLASS_LABELS[class_id],
         "sentiment_confidence": round(confidence, 3),
         "scoring_method": "llm",
     }
@@ -177,25 +685,152 @@ async def score_article_llm(
 ) -> dict[str, Any] | None:
     """Score a single article using Claude Haiku (LLM escalation).
 
-    Used when BERT confidence is below threshold.
+    Used when BERT confidence is below threshold. The response is streamed; if the
+    model keeps writing after the ``score:`` value, the stream is closed as soon as
+    the value is complete (a score on the last line simply ends the stream).
     """
     if not api_key:
         return None
 
     try:
         client = _get_anthropic_client(api_key)
-        response = await client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=200,
-            messages=[{"role": "user", "content": _build_sentiment_prompt(text, ticker)}],
-        )
-        return _parse_llm_response(response.content[0].text.strip())
+        text_so_far = ""
+        async with client.messages.stream(**_llm_request_params([(text, ticker)])) as stream:
+            async for chunk in stream.text_stream:
+                text_so_far += chunk
+                if _LLM_SCORE_DONE_RE.search(text_so_far):
+                    break  # leaving the context manager closes the stream
+        return _parse_llm_response(text_so_far.strip())
 
     except Exception as e:
         logger.warning("LLM scoring failed: %s", e)
         return None
 
 
+# Multi-article requests: several low-confidence articles share one call, answered
+# as a JSON array keyed by the article's position in the prompt.
+_MULTI_SENTIMENT_SYSTEM_PROMPT = """주어진 종목별 뉴스 기사들의 감성을 분석합니다.
+
+모든 기사에 대해 한 줄 JSON 배열로만 답하세요:
+[{"id": 기사 번호, "sentiment": "positive/neutral/negative", "score": 0.0~1.0 확신도}, ...]"""
+
+_MULTI_SENTIMENT_SYSTEM = [
+    {"type": "text", "text": _MULTI_SENTIMENT_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+
+_JSON_DECODER = json.JSONDecoder()
+# Output budget per article: one '{"id": 10, "sentiment": "negative", "score": 0.85}'
+# entry is ~20 tokens; the rest is headroom so a verbose reply is not cut off mid-array
+_LLM_TOKENS_PER_ARTICLE = 40
+
+
+def _build_multi_sentiment_prompt(items: list[tuple[str, str]]) -> str:
+    """Build the user message for (text, ticker) items, numbered from 1."""
+    return "\n\n".join(
+        f"기사{i} (id={i})\n{_build_sentiment_prompt(text, ticker)}"
+        for i, (text, ticker) in enumerate(items, 1)
+    )
+
+
+def _parse_llm_multi_response(response_text: str, n: int) -> dict[int, dict[str, Any]]:
+    """Parse a JSON-array sentiment response into {0-based item index: result}.
+
+    The array is decoded from the first ``[``, so text after it (even with brackets)
+    is ignored. Entries with unknown ids or labels are skipped (those items fall back
+    to BERT).
+    """
+    start = response_text.find("[")
+    if start < 0:
+        return {}
+    try:
+        entries, _ = _JSON_DECODER.raw_decode(response_text, start)
+    except ValueError:
+        return {}
+
+    results: dict[int, dict[str, Any]] = {}
+    for entry in entries:
+        try:
+            i = int(entry["id"]) - 1
+            class_id = _LABEL_TO_CLASS[str(entry["sentiment"]).lower()]
+            confidence = float(entry.get("score", 0.5))
+        except (TypeError, KeyError, ValueError, AttributeError):
+            continue
+        if 0 <= i < n:
+            results[i] = _llm_result(class_id, confidence)
+    return results
+
+
+def _llm_request_params(items: list[tuple[str, str]]) -> dict[str, Any]:
+    """Messages API params scoring (text, ticker) items in one request."""
+    if len(items) == 1:
+        text, ticker = items[0]
+        return {
+            "model": LLM_MODEL_NAME,
+            "max_tokens": _LLM_TOKENS_PER_ARTICLE,
+            "system": _SENTIMENT_SYSTEM,
+            "messages": [{"role": "user", "content": _build_sentiment_prompt(text, ticker)}],
+        }
+    return {
+        "model": LLM_MODEL_NAME,
+        "max_tokens": _LLM_TOKENS_PER_ARTICLE * len(items) + 10,
+        "system": _MULTI_SENTIMENT_SYSTEM,
+        "messages": [{"role": "user", "content": _build_multi_sentiment_prompt(items)}],
+    }
+
+
+# LLM cache-key version: a digest of the single- and multi-article request params
+# (model, prompts, token budgets), so editing any of them invalidates cached scores
+_LLM_PROMPT_VERSION = hashlib.blake2b(
+    json.dumps(
+        [_llm_request_params([("", "")] * n) for n in (1, 2)], ensure_ascii=False, sort_keys=True,
+    ).encode(),
+    digest_size=8,
+).hexdigest()
+
+
+def _warn_if_truncated(message: Any, n: int) -> None:
+    """Log when a response was cut off at max_tokens (its unparsed items fall back to BERT)."""
+    if getattr(message, "stop_reason", None) == "max_tokens":
+        logger.warning("LLM response for %d articles hit max_tokens and was truncated", n)
+
+
+def _parse_llm_group_response(response_text: str, n: int) -> dict[int, dict[str, Any]]:
+    """Parse the response to ``_llm_request_params`` for n items."""
+    if n == 1:
+        return {0: _parse_llm_response(response_text)}
+    return _parse_llm_multi_response(response_text, n)
+
+
+async def score_articles_llm(
+    items: list[tuple[str, str]],
+    api_key: str,
+) -> dict[int, dict[str, Any]]:
+    """Score several (text, ticker) items with one LLM request.
+
+    Returns {item index: result}; items missing from the response are left out.
+    A single item goes through the streamed ``score_article_llm`` path.
+    """
+    if not api_key or not items:
+        return {}
+    if len(items) == 1:
+        result = await score_article_llm(items[0][0], api_key, items[0][1])
+        return {0: result} if result else {}
+
+    try:
+        client = _get_anthropic_client(api_key)
+        response = await client.messages.create(**_llm_request_params(items))
+        _warn_if_truncated(response, len(items))
+        return _parse_llm_multi_response(response.content[0].text, len(items))
+    except Exception as e:
+        logger.warning("LLM multi-article scoring failed: %s", e)
+        return {}
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    size = max(size, 1)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
 # Minimum articles to use Batch API (below this, concurrent calls are faster)
 _BATCH_API_THRESHOLD = 20
 
@@ -204,8 +839,10 @@ async def _score_articles_batch(
     texts: list[str],
     llm_pending: list[tuple[int, int, str]],
     api_key: str,
-    poll_interval: float = 10.0,
+    poll_interval: float = 1.0,
     max_wait: float = 1800.0,
+    max_poll_interval: float = 60.0,
+    articles_per_request: int = 1,
 ) -> dict[int, dict[str, Any]]:
     """Score articles using Anthropic Message Batches API (50% cost savings).
 
@@ -216,8 +853,11 @@ async def _score_articles_batch(
         texts: All article texts (indexed by text_idx).
         llm_pending: List of (scored_idx, text_idx, ticker) tuples.
         api_key: Anthropic API key.
-        poll_interval: Seconds between status polls.
+        poll_interval: Seconds before the first status poll; later polls back off
+            exponentially (x1.7 plus up to 0.5s jitter).
         max_wait: Maximum seconds to wait for batch completion.
+        max_poll_interval: Upper bound on the delay between polls.
+        articles_per_request: Articles packed into each batch request.
 
     Returns:
         Dict mapping scored_idx -> sentiment result dict.
@@ -230,29 +870,25 @@ async def _score_articles_batch(
 
     # Build batch requests with custom_id mapping
     requests: list[Request] = []
-    id_map: dict[str, int] = {}  # custom_id -> scored_idx
+    id_map: dict[str, list[int]] = {}  # custom_id -> scored_idx of each packed article
 
-    for scored_idx, text_idx, ticker in llm_pending:
-        cid = f"s{scored_idx}"
-        id_map[cid] = scored_idx
+    for group in _chunks(llm_pending, articles_per_request):
+        cid = f"s{group[0][0]}"
+        id_map[cid] = [scored_idx for scored_idx, _, _ in group]
+        items = [(texts[text_idx], ticker) for _, text_idx, ticker in group]
         requests.append(Request(
             custom_id=cid,
-            params=MessageCreateParamsNonStreaming(
-                model="claude-haiku-4-5-20251001",
-                max_tokens=200,
-                messages=[{
-                    "role": "user",
-                    "content": _build_sentiment_prompt(texts[text_idx], ticker),
-                }],
-            ),
+            params=MessageCreateParamsNonStreaming(**_llm_request_params(items)),
         ))
 
     # Submit batch
     batch = await client.messages.batches.create(requests=requests)
     logger.info("Batch API submitted: %s (%d requests, 50%% cost)", batch.id, len(requests))
 
-    # Poll until completion
+    # Poll until completion: short first poll catches fast batches, jittered
+    # exponential backoff keeps long waits cheap and desynchronizes concurrent callers
     elapsed = 0.0
+    delay = poll_interval
     while elapsed < max_wait:
         batch = await client.messages.batches.retrieve(batch.id)
         if batch.processing_status == "ended":
@@ -262,8 +898,13 @@ async def _score_articles_batch(
             "Batch %s: processing=%d succeeded=%d errored=%d",
             batch.id, c.processing, c.succeeded, c.errored,
         )
-        await asyncio.sleep(poll_interval)
-        elapsed += poll_interval
+        if c.processing == 0:
+            # All requests are final and the batch is only finalizing; results
+            # are not streamable until "ended", so re-poll quickly instead of backing off
+            delay = poll_interval
+        await asyncio.sleep(delay)
+        elapsed += delay
+        delay = min(delay * 1.7 + random.uniform(0, 0.5), max_poll_interval)
     else:
         logger.warning("Batch %s timed out after %.0fs", batch.id, max_wait)
         return {}
@@ -282,11 +923,14 @@ async def _score_articles_batch(
     result_stream = await client.messages.batches.results(batch.id)
 
     async for item in result_stream:
-        scored_idx = id_map.get(item.custom_id)
-        if scored_idx is not None and item.result.type == "succeeded":
-            text = item.result.message.content[0].text.strip()
-            results[scored_idx] = _parse_llm_response(text)
-        elif scored_idx is not None:
+        scored_idxs = id_map.get(item.custom_id)
+        if scored_idxs is not None and item.result.type == "succeeded":
+            message = item.result.message
+            _warn_if_truncated(message, len(scored_idxs))
+            text = message.content[0].text.strip()
+            for i, result in _parse_llm_group_response(text, len(scored_idxs)).items():
+                results[scored_idxs[i]] = result
+        elif scored_idxs is not None:
             logger.warning("Batch item %s: %s", item.custom_id, item.result.type)
 
     return results
@@ -298,23 +942,51 @@ async def score_articles(
     anthropic_api_key: str = "",
     use_batch_api: bool = False,
     max_llm_escalation: int = 0,
+    llm_concurrency: int = 32,
+    keyword_prefilter: bool = True,
+    keyword_polar: bool = False,
+    llm_articles_per_request: int = 10,
+    cache_path: str | Path | None = None,
+    bert_compile: bool = False,
+    aggregate_stop: Callable[[list[dict[str, Any]]], bool] | None = None,
 ) -> list[dict[str, Any]]:
     """Score all articles using hybrid BERT + LLM pipeline.
 
-    Stage 1: Batch score all articles with BERT (much faster than one-by-one)
+    Stage 0: Boilerplate notices (and, if enabled, unambiguous polar keyword hits)
+    are scored without BERT
+    Stage 1: Batch score remaining articles with BERT (much faster than one-by-one)
     Stage 2: Escalate low-confidence results to LLM
 
     Args:
         articles: List of article dicts with 'title' and 'description'.
         confidence_threshold: BERT confidence threshold for LLM escalation.
         anthropic_api_key: API key for LLM fallback.
+        llm_concurrency: Max in-flight LLM requests on the concurrent path.
+        keyword_prefilter: Score single-class keyword hits directly (see
+            ``score_article_keyword``) when their confidence meets the threshold.
+        keyword_polar: Let positive/negative keyword hits skip BERT too (default:
+            only neutral boilerplate notices do).
+        llm_articles_per_request: Low-confidence articles packed into one LLM request
+            (1 sends each article on its own).
+        cache_path: SQLite file of the on-disk sentiment cache; BERT and LLM results
+            are reused/stored there. No cache when None.
+        bert_compile: torch.compile the transformers model on GPU (see
+            ``_compile_bert_model``); ignored when ONNX Runtime is used.
+        aggregate_stop: Called with the scored articles after each concurrent LLM
+            response; returning True cancels the outstanding requests (their articles
+            keep the BERT result). Articles still awaiting the LLM have no sentiment
+            fields yet when it is called.
 
     Returns:
         Articles with sentiment fields added.
     """
+    import asyncio
+
     if not articles:
         return []
 
+    use_keywords = keyword_prefilter and _KEYWORD_CONFIDENCE >= confidence_threshold
+
     # Separate pre-scored articles (e.g. DART rule-based) from those needing scoring
     pre_scored: list[dict[str, Any]] = []
     texts: list[str] = []
@@ -324,70 +996,93 @@ async def score_articles(
             pre_scored.append(article)
             continue
         text = f"{article.get('title', '')} {article.get('description', '')}".strip()
-        if text:
+        keyword_result = (
+            score_article_keyword(text, polar=keyword_polar) if use_keywords and text else None
+        )
+        if keyword_result:
+            article.update(keyword_result)
+            pre_scored.append(article)
+        elif text:
             texts.append(text[:512])
             valid_articles.append(article)
 
     if not texts:
         return pre_scored
 
-    # Stage 1: Batch BERT scoring
-    pipe = _get_bert_pipeline()
-    bert_results: list[dict[str, Any] | None] = [None] * len(texts)
-
-    if pipe is not None:
-        try:
-            batch_output = pipe(texts, batch_size=32)
-            for idx, predictions in enumerate(batch_output):
-                if not isinstance(predictions, list):
-                    predictions = [predictions]
-
-                best = max(predictions, key=lambda x: x["score"])
-                label_key = best["label"]
-                confidence = float(best["score"])
-
-                label_info = BERT_LABEL_MAP.get(label_key)
-                if label_info is None:
-                    label_lower = label_key.lower()
-                    if "pos" in label_lower:
-                        label_info = ("positive", 1.0)
-                    elif "neg" in label_lower:
-                        label_info = ("negative", -1.0)
-                    else:
-                        label_info = ("neutral", 0.0)
-
-                sentiment_label, _ = label_info
-
-                # Continuous score from class probabilities
-                pos_score = 0.0
-                neg_score = 0.0
-                for pred in predictions:
-                    pred_label = pred["label"].lower()
-                    if "pos" in pred_label or pred_label == "label_2":
-                        pos_score = pred["score"]
-                    elif "neg" in pred_label or pred_label == "label_0":
-                        neg_score = pred["score"]
-
-                sentiment_raw = max(-1.0, min(1.0, pos_score - neg_score))
-
-                bert_results[idx] = {
-                    "sentiment_raw": round(sentiment_raw, 4),
-                    "sentiment_label": sentiment_label,
-                    "sentiment_confidence": round(confidence, 3),
-                    "scoring_method": "bert",
-                }
-        except Exception as e:
-            logger.warning("Batch BERT scoring failed: %s", e)
+    # Identical texts (wire-service reprints, repeated filings) are scored only once:
+    # text_idx -> unique_idx via inverse, model work runs on unique_texts
+    unique_index: dict[str, int] = {}
+    inverse = [unique_index.setdefault(t, len(unique_index)) for t in texts]
+    unique_texts = list(unique_index)
+
+    cache = _get_sentiment_cache(cache_path) if cache_path else None
+
+    # Stage 1: Batch BERT scoring (INT8 ONNX Runtime if available, else transformers)
+    scores = _BertScores.empty(len(unique_texts))
+
+    def bert_keys_for(backend: str) -> list[str]:
+        # Scores from one backend/precision are not served to another
+        return [
+            _SentimentCache.key("bert", f"{BERT_MODEL_NAME}|{backend}|{t}") for t in unique_texts
+        ]
+
+    if cache is not None:
+        backend = await asyncio.to_thread(_bert_backend_tag)
+        bert_keys = bert_keys_for(backend)
+        hits = cache.get_many(bert_keys)
+        for u, key in enumerate(bert_keys):
+            if key in hits:
+                scores.set(u, hits[key])
+    missing = np.flatnonzero(np.isnan(scores.confidence))
+
+    if missing.size:
+        # Model loading and inference run in a worker thread (torch/ONNX Runtime release
+        # the GIL), while the LLM client opens its connection for Stage 2 on the loop
+        warm_task = (
+            asyncio.create_task(_warm_anthropic_client(anthropic_api_key))
+            if anthropic_api_key else None
+        )
+        new_scores = await asyncio.to_thread(
+            _bert_score_texts, [unique_texts[u] for u in missing], compile_model=bert_compile,
+        )
+        if warm_task is not None:
+            try:
+                await asyncio.wait_for(warm_task, timeout=_WARMUP_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.debug("Anthropic client warmup timed out; cancelled")
+
+        if new_scores is not None:
+            scores.raw[missing] = new_scores.raw
+            scores.confidence[missing] = new_scores.confidence
+            for m, label in zip(missing, new_scores.labels):
+                scores.labels[m] = label
+            if cache is not None:
+                # The loaded model may differ from the inferred backend (e.g. a GPU
+                # provider failed to start); store under the backend that scored
+                loaded_backend = _bert_backend_tag()
+                if loaded_backend != backend:
+                    bert_keys = bert_keys_for(loaded_backend)
+                cache.set_many({bert_keys[m]: scores.result(int(m)) for m in missing})
+
+    # Per-article view of the unique-text scores (NaN confidence = no BERT result)
+    bert_confidence = scores.confidence[inverse]
+
+    def bert_result(text_idx: int) -> dict[str, Any] | None:
+        if np.isnan(bert_confidence[text_idx]):
+            return None
+        return scores.result(inverse[text_idx])
 
     # Stage 2: Apply BERT results, collect low-confidence for LLM batch
     scored: list[dict[str, Any]] = []
     llm_pending: list[tuple[int, int, str]] = []  # (scored_idx, text_idx, ticker)
+    # Articles with the same (text, ticker) share one LLM request:
+    # (unique_idx, ticker) -> leader scored_idx, leader scored_idx -> follower scored_idxs
+    llm_leaders: dict[tuple[int, str], int] = {}
+    llm_followers: dict[int, list[int]] = {}
 
     for idx, article in enumerate(valid_articles):
-        bert_result = bert_results[idx]
-
-        if bert_result and bert_result["sentiment_confidence"] >= confidence_threshold:
-            article.update(bert_result)
+        if bert_confidence[idx] >= confidence_threshold:
+            article.update(scores.result(inverse[idx]))
             scored.append(article)
             continue
 
@@ -395,9 +1090,14 @@ async def score_articles(
         scored_idx = len(scored)
         scored.append(article)  # placeholder, will be updated with LLM result
         if anthropic_api_key:
-            llm_pending.append((scored_idx, idx, article.get("ticker", "")))
-        elif bert_result:
-            article.update(bert_result)
+            ticker = article.get("ticker", "")
+            leader = llm_leaders.setdefault((inverse[idx], ticker), scored_idx)
+            if leader == scored_idx:
+                llm_pending.append((scored_idx, idx, ticker))
+            else:
+                llm_followers.setdefault(leader, []).append(scored_idx)
+        elif not np.isnan(bert_confidence[idx]):
+            article.update(scores.result(inverse[idx]))
         else:
             article.update({
                 "sentiment_raw": 0.0,
@@ -408,57 +1108,73 @@ async def score_articles(
 
     # Stage 2: LLM escalation (Batch API for large sets, concurrent for small)
     if llm_pending:
-        import asyncio
+        # Previously scored (text, ticker) pairs are served from the cache; single- and
+        # multi-article requests use different prompts, so their results are kept apart
+        llm_results: dict[int, dict[str, Any]] = {}
+        llm_mode = "single" if llm_articles_per_request <= 1 else "multi"
+        llm_keys = {
+            si: _SentimentCache.key("llm", f"{_LLM_PROMPT_VERSION}|{llm_mode}|{tk}|{texts[ti]}")
+            for si, ti, tk in llm_pending
+        }
+        if cache is not None:
+            hits = cache.get_many(list(llm_keys.values()))
+            llm_results = {si: hits[k] for si, k in llm_keys.items() if k in hits}
+        cached_pending = [p for p in llm_pending if p[0] in llm_results]
+        to_call = [p for p in llm_pending if p[0] not in llm_results]
 
         # Cap LLM escalation to control cost
-        if max_llm_escalation and len(llm_pending) > max_llm_escalation:
+        if max_llm_escalation and len(to_call) > max_llm_escalation:
             logger.info(
                 "LLM escalation capped: %d → %d (cost limit)",
-                len(llm_pending), max_llm_escalation,
+                len(to_call), max_llm_escalation,
             )
             # Keep lowest-confidence articles (most benefit from LLM)
-            llm_pending.sort(
-                key=lambda x: (bert_results[x[1]] or {}).get("sentiment_confidence", 0.0),
-            )
-            overflow = llm_pending[max_llm_escalation:]
-            llm_pending = llm_pending[:max_llm_escalation]
+            to_call.sort(key=lambda x: np.nan_to_num(bert_confidence[x[1]]))
+            overflow = to_call[max_llm_escalation:]
+            to_call = to_call[:max_llm_escalation]
             # Apply BERT results to capped articles
             for scored_idx, text_idx, _ in overflow:
-                article = scored[scored_idx]
-                br = bert_results[text_idx]
-                if br:
-                    article.update(br)
-                else:
-                    article.update({
-                        "sentiment_raw": 0.0, "sentiment_label": "neutral",
-                        "sentiment_confidence": 0.0, "scoring_method": "fallback",
-                    })
+                br = bert_result(text_idx)
+                for target in (scored_idx, *llm_followers.get(scored_idx, ())):
+                    if br:
+                        scored[target].update(br)
+                    else:
+                        scored[target].update({
+                            "sentiment_raw": 0.0, "sentiment_label": "neutral",
+                            "sentiment_confidence": 0.0, "scoring_method": "fallback",
+                        })
 
-        llm_results: dict[int, dict[str, Any]] = {}
+        llm_pending = cached_pending + to_call
 
-        if use_batch_api and len(llm_pending) >= _BATCH_API_THRESHOLD:
+        if use_batch_api and len(to_call) >= _BATCH_API_THRESHOLD:
             # Use Message Batches API (50% cost savings, higher latency)
             try:
-                llm_results = await _score_articles_batch(
-                    texts, llm_pending, anthropic_api_key,
+                batch_results = await _score_articles_batch(
+                    texts, to_call, anthropic_api_key,
+                    articles_per_request=llm_articles_per_request,
                 )
+                llm_results.update(batch_results)
                 logger.info(
-                    "Batch API: %d/%d succeeded", len(llm_results), len(llm_pending),
+                    "Batch API: %d/%d succeeded", len(batch_results), len(to_call),
                 )
             except Exception as e:
                 logger.warning("Batch API failed, falling back to concurrent: %s", e)
 
         # Concurrent fallback for remaining items (small batches or batch failures)
-        remaining = [p for p in llm_pending if p[0] not in llm_results]
+        remaining = [p for p in to_call if p[0] not in llm_results]
         if remaining:
-            sem = asyncio.Semaphore(3)
+            sem = asyncio.Semaphore(llm_concurrency)
             # Rate limiter: 40 RPM budget (safe margin under 50 RPM limit)
             _rpm_interval = 60.0 / 40  # 1.5s between requests
             _last_request_time = 0.0
             _rate_lock = asyncio.Lock()
-            logger.info("LLM concurrent escalation: %d articles (rate-limited 40 RPM)", len(remaining))
+            groups = _chunks(remaining, llm_articles_per_request)
+            logger.info(
+                "LLM concurrent escalation: %d articles in %d requests (rate-limited 40 RPM)",
+                len(remaining), len(groups),
+            )
 
-            async def _llm_one(scored_idx: int, text_idx: int, ticker: str):
+            async def _llm_group(group: list[tuple[int, int, str]]):
                 nonlocal _last_request_time
                 async with sem:
                     async with _rate_lock:
@@ -467,31 +1183,59 @@ async def score_articles(
                         if wait > 0:
                             await asyncio.sleep(wait)
                         _last_request_time = asyncio.get_event_loop().time()
-                    return scored_idx, await score_article_llm(
-                        texts[text_idx], anthropic_api_key, ticker
+                    group_results = await score_articles_llm(
+                        [(texts[ti], tk) for _, ti, tk in group], anthropic_api_key,
                     )
+                    return {group[i][0]: r for i, r in group_results.items() if r}
+
+            tasks = [asyncio.ensure_future(_llm_group(group)) for group in groups]
+            stopped_early = False
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception as e:
+                    logger.warning("LLM escalation error: %s", e)
+                    continue
+                llm_results.update(result)
 
-            tasks = [_llm_one(si, ti, tk) for si, ti, tk in remaining]
-            concurrent_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in concurrent_results:
-                if isinstance(result, Exception):
-                    logger.warning("LLM escalation error: %s", result)
+                if aggregate_stop is None:
                     continue
-                scored_idx, llm_result = result
-                if llm_result:
-                    llm_results[scored_idx] = llm_result
+                for scored_idx, llm_result in result.items():
+                    for target in (scored_idx, *llm_followers.get(scored_idx, ())):
+                        scored[target].update(llm_result)
+                if aggregate_stop(scored):
+                    stopped_early = True
+                    for task in tasks:
+                        task.cancel()
+                    break
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            if stopped_early:
+                # Requests that finished before cancel() took effect still count
+                cancelled = 0
+                for task in tasks:
+                    if task.cancelled():
+                        cancelled += 1
+                    elif task.exception() is None:
+                        llm_results.update(task.result())
+                if cancelled:
+                    logger.info("LLM escalation stopped early: %d requests cancelled", cancelled)
+
+        if cache is not None:
+            cache.set_many({
+                llm_keys[si]: llm_results[si] for si, _, _ in to_call if si in llm_results
+            })
 
-        # Apply all LLM results to articles, fallback to BERT or neutral
+        # Apply all LLM results to articles (and their duplicates), fallback to BERT or neutral
         for scored_idx, text_idx, _ in llm_pending:
-            article = scored[scored_idx]
             llm_result = llm_results.get(scored_idx)
-            if llm_result:
-                article.update(llm_result)
-            else:
-                bert_result = bert_results[text_idx]
-                if bert_result:
-                    article.update(bert_result)
+            br = bert_result(text_idx)
+            for target in (scored_idx, *llm_followers.get(scored_idx, ())):
+                article = scored[target]
+                if llm_result:
+                    article.update(llm_result)
+                elif br:
+                    article.update(br)
                 else:
                     article.update({
                         "sentiment_raw": 0.0,
@@ -1,12 +1,16 @@
 """Quant analysis module: RIM valuation, Modified F-Score, Investment Grade.
 
 All functions are pure computations with no database dependency.
-Input: fundamental data as dicts/floats
+Input: fundamental data as Fundamentals/dicts/floats
 Output: computed metrics as dicts/tuples
 """
 
 import logging
-from typing import Any
+import operator
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Mapping
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +81,77 @@ def compute_rim(
     }
 
 
+def rim_calculator(
+    risk_free_rate: float = 0.035,
+    equity_risk_premium: float = 0.065,
+    growth_rate: float = 0.0,
+) -> Callable[[float | None, float | None], dict[str, Any]]:
+    """Specialize ``compute_rim`` for fixed rates.
+
+    The required return, denominator and degenerate-case branch are resolved once;
+    the returned ``rim(bps, roe)`` gives the same result as ``compute_rim`` with these
+    rates. Use it when scoring many tickers under the same settings.
+    """
+    required_return = risk_free_rate + equity_risk_premium
+    denominator = required_return - growth_rate
+    inputs = {"required_return": required_return, "growth_rate": growth_rate}
+
+    if abs(denominator) < 1e-10:
+        def rim_fallback(bps: float | None, roe: float | None) -> dict[str, Any]:
+            return compute_rim(bps, roe, risk_free_rate, equity_risk_premium, growth_rate)
+
+        return rim_fallback
+
+    def rim(bps: float | None, roe: float | None) -> dict[str, Any]:
+        if bps is None or roe is None or bps <= 0:
+            return compute_rim(bps, roe, risk_free_rate, equity_risk_premium, growth_rate)
+        rim_value = bps + (roe / 100.0 - required_return) * bps / denominator
+        return {
+            "rim_value": round(max(rim_value, 0), 2),
+            "computable": True,
+            "inputs": {"bps": bps, "roe_pct": roe, **inputs},
+        }
+
+    return rim
+
+
+compute_rim_default = rim_calculator()
+
+
+def compute_rim_batch(
+    bps: np.ndarray,
+    roe: np.ndarray,
+    risk_free_rate: float = 0.035,
+    equity_risk_premium: float = 0.065,
+    growth_rate: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``compute_rim`` over a universe of tickers.
+
+    Args:
+        bps: BPS per ticker (NaN for missing)
+        roe: ROE in percent per ticker (NaN for missing)
+
+    Returns:
+        (rim_values, computable): rim_values rounded to 2 places, NaN where not
+        computable (missing data or BPS <= 0); computable is the boolean mask.
+    """
+    bps = np.asarray(bps, dtype=np.float64)
+    roe_decimal = np.asarray(roe, dtype=np.float64) / 100.0
+    required_return = risk_free_rate + equity_risk_premium
+    computable = ~np.isnan(bps) & ~np.isnan(roe_decimal) & (bps > 0)
+
+    denominator = required_return - growth_rate
+    if abs(denominator) < 1e-10:
+        # Fallback: no-growth perpetuity (value creators capped at BPS * 10)
+        rim_values = np.where(roe_decimal > required_return, bps * 10, bps)
+    else:
+        rim_values = bps + (roe_decimal - required_return) * bps / denominator
+
+    rim_values = np.round(np.maximum(rim_values, 0.0), 2)
+    rim_values[~computable] = np.nan
+    return rim_values, computable
+
+
 def compute_safety_margin(rim_value: float | None, current_price: int | None) -> dict[str, Any]:
     """Compute safety margin between intrinsic value and market price.
 
@@ -93,9 +168,153 @@ def compute_safety_margin(rim_value: float | None, current_price: int | None) ->
     }
 
 
+def compute_safety_margin_batch(
+    rim_values: np.ndarray, current_prices: np.ndarray
+) -> np.ndarray:
+    """Vectorized ``compute_safety_margin``: margin % rounded to 2 places, NaN if undefined."""
+    rim_values = np.asarray(rim_values, dtype=np.float64)
+    current_prices = np.asarray(current_prices, dtype=np.float64)
+    valid = (rim_values > 0) & (current_prices > 0)  # False for NaN inputs
+    safe_rim = np.where(valid, rim_values, 1.0)
+    margin = np.round((safe_rim - current_prices) / safe_rim * 100.0, 2)
+    return np.where(valid, margin, np.nan)
+
+
+# ---------------------------------------------------------------------------
+# F-Score criteria
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True, frozen=True)
+class Fundamentals:
+    """One period's fundamentals for a ticker (None when not reported)."""
+
+    bps: float | None = None
+    per: float | None = None
+    pbr: float | None = None
+    eps: float | None = None
+    div: float | None = None
+    dps: float | None = None
+    roe: float | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Fundamentals":
+        """Build from a {bps, per, pbr, eps, div, dps, roe} dict (missing keys -> None)."""
+        return cls(*(data.get(f.name) for f in fields(cls)))
+
+    @classmethod
+    def from_record(cls, record: Any) -> "Fundamentals":
+        """Build from an object with bps/per/... attributes, e.g. a Fundamental row.
+
+        Zero and NULL values are both treated as not reported.
+        """
+        return cls(
+            *(float(v) if (v := getattr(record, f.name)) else None for f in fields(cls))
+        )
+
+# Each evaluator takes (current, previous, sector_medians, volume_current,
+# volume_previous) and returns (score, value, label): score is None when the signal
+# is not computable, label overrides the table label when it carries detail.
+
+
+def _positive(field: str):
+    get = operator.attrgetter(field)
+
+    def evaluate(current, previous, sector_medians, volume_current, volume_previous):
+        value = get(current)
+        return (None if value is None else int(value > 0)), value, None
+
+    return evaluate
+
+
+def _increasing(field: str):
+    get = operator.attrgetter(field)
+
+    def evaluate(current, previous, sector_medians, volume_current, volume_previous):
+        value = get(current)
+        prev = get(previous) if previous is not None else None
+        if value is None or prev is None:
+            return None, None, None
+        return int(value > prev), value - prev, None
+
+    return evaluate
+
+
+def _below_sector_median(field: str, label: str, require_positive_median: bool):
+    get = operator.attrgetter(field)
+
+    def evaluate(current, previous, sector_medians, volume_current, volume_previous):
+        value = get(current)
+        median = sector_medians.get(f"median_{field}") if sector_medians else None
+        if (
+            value is None
+            or median is None
+            or value <= 0
+            or (require_positive_median and median <= 0)
+        ):
+            return None, value, None
+        # Sector-level label from with_median_labels, else formatted per call
+        detail = sector_medians.get(f"{field}_label") or f"{label} ({median:.2f})"
+        return int(value < median), value, detail
+
+    return evaluate
+
+
+def _volume_increasing(current, previous, sector_medians, volume_current, volume_previous):
+    if volume_current is None or volume_previous is None or volume_previous <= 0:
+        return None, None, None
+    return int(volume_current > volume_previous), volume_current - volume_previous, None
+
+
+# (name, label, note when not computable, evaluator)
+_FSCORE_CRITERIA = (
+    ("positive_eps", "당기순이익 > 0", "데이터 없음", _positive("eps")),
+    ("positive_roe", "자기자본이익률 > 0", "데이터 없음", _positive("roe")),
+    ("roe_increasing", "ROE 증가", "전기 데이터 없음", _increasing("roe")),
+    ("eps_increasing", "EPS 증가", "전기 데이터 없음", _increasing("eps")),
+    ("bps_increasing", "BPS 증가 (자본축적)", "전기 데이터 없음", _increasing("bps")),
+    (
+        "pbr_below_sector", "PBR < 섹터 중앙값", "섹터 데이터 없음",
+        _below_sector_median("pbr", "PBR < 섹터 중앙값", require_positive_median=False),
+    ),
+    ("positive_dividend", "배당수익률 > 0", "데이터 없음", _positive("div")),
+    (
+        "per_below_sector", "PER < 섹터 중앙값", "섹터/PER 데이터 없음",
+        _below_sector_median("per", "PER < 섹터 중앙값", require_positive_median=True),
+    ),
+    ("volume_increasing", "거래량 증가", "거래량 데이터 없음", _volume_increasing),
+)
+
+
+def with_median_labels(sector_medians: dict[str, Any]) -> dict[str, Any]:
+    """Add preformatted F-Score labels to a sector's {median_pbr, median_per} dict.
+
+    The labels depend only on the sector, so formatting them once per sector saves
+    the per-ticker formatting in ``compute_fscore``.
+    """
+    for field, label in (("pbr", "PBR < 섹터 중앙값"), ("per", "PER < 섹터 중앙값")):
+        median = sector_medians.get(f"median_{field}")
+        if median is not None:
+            sector_medians[f"{field}_label"] = f"{label} ({median:.2f})"
+    return sector_medians
+
+
+# Display precision of YoY-change values, applied when criteria are stored/served
+_FSCORE_VALUE_DIGITS = {"roe_increasing": 4, "eps_increasing": 2, "bps_increasing": 2}
+
+
+def format_fscore_criteria(criteria: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Round criterion values for output (``compute_fscore`` keeps full precision)."""
+    for c in criteria:
+        ndigits = _FSCORE_VALUE_DIGITS.get(c["name"])
+        if ndigits is not None and c["value"] is not None:
+            c["value"] = round(c["value"], ndigits)
+    return criteria
+
+
 def compute_fscore(
-    current: dict[str, Any] | None,
-    previous: dict[str, Any] | None,
+    current: Fundamentals | Mapping[str, Any] | None,
+    previous: Fundamentals | Mapping[str, Any] | None,
     sector_medians: dict[str, float] | None = None,
     volume_current: int | None = None,
     volume_previous: int | None = None,
@@ -114,18 +333,19 @@ def compute_fscore(
     9. Volume increasing (liquidity improvement)
 
     Args:
-        current: Current period fundamentals {bps, per, pbr, eps, div, dps, roe}
-        previous: Previous period fundamentals (same keys)
-        sector_medians: {median_pbr, median_per} for the stock's sector
+        current: Current period fundamentals; dicts {bps, per, pbr, eps, div, dps, roe}
+            are converted with ``Fundamentals.from_dict``
+        previous: Previous period fundamentals (same fields)
+        sector_medians: {median_pbr, median_per} for the stock's sector, optionally
+            with labels from ``with_median_labels``
         volume_current: Current period average volume
         volume_previous: Previous period average volume
 
     Returns:
-        {total_score, max_score, criteria: [...], data_completeness}
+        {total_score, max_score, criteria: [...], data_completeness}; criterion values
+        are unrounded, see ``format_fscore_criteria``.
     """
-    criteria = []
-    computable_count = 0
-    total_signals = 9
+    total_signals = len(_FSCORE_CRITERIA)
 
     if current is None:
         return {
@@ -134,226 +354,33 @@ def compute_fscore(
             "criteria": [],
             "data_completeness": 0.0,
         }
+    if not isinstance(current, Fundamentals):
+        current = Fundamentals.from_dict(current)
+    if previous is not None and not isinstance(previous, Fundamentals):
+        previous = Fundamentals.from_dict(previous)
 
-    # Signal 1: EPS > 0 (Profitability)
-    eps = current.get("eps")
-    if eps is not None:
-        computable_count += 1
-        score = 1 if eps > 0 else 0
-        criteria.append(
-            {
-                "name": "positive_eps",
-                "score": score,
-                "value": eps,
-                "label": "당기순이익 > 0",
-            }
-        )
-    else:
-        criteria.append(
-            {
-                "name": "positive_eps",
-                "score": 0,
-                "value": None,
-                "label": "당기순이익 > 0",
-                "note": "데이터 없음",
-            }
-        )
-
-    # Signal 2: ROE > 0
-    roe = current.get("roe")
-    if roe is not None:
-        computable_count += 1
-        score = 1 if roe > 0 else 0
-        criteria.append(
-            {
-                "name": "positive_roe",
-                "score": score,
-                "value": roe,
-                "label": "자기자본이익률 > 0",
-            }
-        )
-    else:
-        criteria.append(
-            {
-                "name": "positive_roe",
-                "score": 0,
-                "value": None,
-                "label": "자기자본이익률 > 0",
-                "note": "데이터 없음",
-            }
-        )
-
-    # Signal 3: ROE increasing YoY
-    roe_prev = previous.get("roe") if previous else None
-    if roe is not None and roe_prev is not None:
-        computable_count += 1
-        score = 1 if roe > roe_prev else 0
-        criteria.append(
-            {
-                "name": "roe_increasing",
-                "score": score,
-                "value": round(roe - roe_prev, 4),
-                "label": "ROE 증가",
-            }
-        )
-    else:
-        criteria.append(
-            {
-                "name": "roe_increasing",
-                "score": 0,
-                "value": None,
-                "label": "ROE 증가",
-                "note": "전기 데이터 없음",
-            }
-        )
-
-    # Signal 4: EPS increasing YoY
-    eps_prev = previous.get("eps") if previous else None
-    if eps is not None and eps_prev is not None:
-        computable_count += 1
-        score = 1 if eps > eps_prev else 0
-        criteria.append(
-            {
-                "name": "eps_increasing",
-                "score": score,
-                "value": round(eps - eps_prev, 2),
-                "label": "EPS 증가",
-            }
-        )
-    else:
-        criteria.append(
-            {
-                "name": "eps_increasing",
-                "score": 0,
-                "value": None,
-                "label": "EPS 증가",
-                "note": "전기 데이터 없음",
-            }
-        )
-
-    # Signal 5: BPS increasing YoY (retained earnings proxy)
-    bps = current.get("bps")
-    bps_prev = previous.get("bps") if previous else None
-    if bps is not None and bps_prev is not None:
-        computable_count += 1
-        score = 1 if bps > bps_prev else 0
-        criteria.append(
-            {
-                "name": "bps_increasing",
-                "score": score,
-                "value": round(bps - bps_prev, 2),
-                "label": "BPS 증가 (자본축적)",
-            }
-        )
-    else:
-        criteria.append(
-            {
-                "name": "bps_increasing",
-                "score": 0,
-                "value": None,
-                "label": "BPS 증가 (자본축적)",
-                "note": "전기 데이터 없음",
-            }
-        )
-
-    # Signal 6: PBR < sector median (relative valuation)
-    pbr = current.get("pbr")
-    median_pbr = sector_medians.get("median_pbr") if sector_medians else None
-    if pbr is not None and median_pbr is not None and pbr > 0:
-        computable_count += 1
-        score = 1 if pbr < median_pbr else 0
-        criteria.append(
-            {
-                "name": "pbr_below_sector",
-                "score": score,
-                "value": pbr,
-                "label": f"PBR < 섹터 중앙값 ({median_pbr:.2f})",
-            }
-        )
-    else:
-        criteria.append(
-            {
-                "name": "pbr_below_sector",
-                "score": 0,
-                "value": pbr,
-                "label": "PBR < 섹터 중앙값",
-                "note": "섹터 데이터 없음",
-            }
-        )
-
-    # Signal 7: DIV > 0 (shareholder returns)
-    div_val = current.get("div")
-    if div_val is not None:
-        computable_count += 1
-        score = 1 if div_val > 0 else 0
-        criteria.append(
-            {
-                "name": "positive_dividend",
-                "score": score,
-                "value": div_val,
-                "label": "배당수익률 > 0",
-            }
-        )
-    else:
-        criteria.append(
-            {
-                "name": "positive_dividend",
-                "score": 0,
-                "value": None,
-                "label": "배당수익률 > 0",
-                "note": "데이터 없음",
-            }
-        )
-
-    # Signal 8: PER < sector median AND PER > 0
-    per = current.get("per")
-    median_per = sector_medians.get("median_per") if sector_medians else None
-    if per is not None and median_per is not None and per > 0 and median_per > 0:
-        computable_count += 1
-        score = 1 if per < median_per else 0
-        criteria.append(
-            {
-                "name": "per_below_sector",
-                "score": score,
-                "value": per,
-                "label": f"PER < 섹터 중앙값 ({median_per:.2f})",
-            }
-        )
-    else:
-        criteria.append(
-            {
-                "name": "per_below_sector",
-                "score": 0,
-                "value": per,
-                "label": "PER < 섹터 중앙값",
-                "note": "섹터/PER 데이터 없음",
-            }
-        )
-
-    # Signal 9: Volume increasing
-    if volume_current is not None and volume_previous is not None and volume_previous > 0:
-        computable_count += 1
-        score = 1 if volume_current > volume_previous else 0
-        criteria.append(
-            {
-                "name": "volume_increasing",
-                "score": score,
-                "value": volume_current - volume_previous,
-                "label": "거래량 증가",
-            }
-        )
-    else:
-        criteria.append(
-            {
-                "name": "volume_increasing",
-                "score": 0,
-                "value": None,
-                "label": "거래량 증가",
-                "note": "거래량 데이터 없음",
-            }
+    # Criterion i sets bit i of score_bits (passed) / computable_bits (evaluated);
+    # the dicts are built only for the response payload.
+    criteria = []
+    score_bits = 0
+    computable_bits = 0
+    for i, (name, label, missing_note, evaluate) in enumerate(_FSCORE_CRITERIA):
+        score, value, detail_label = evaluate(
+            current, previous, sector_medians, volume_current, volume_previous
         )
-
-    total_score = sum(c["score"] for c in criteria)
+        if score is None:
+            criteria.append(
+                {"name": name, "score": 0, "value": value, "label": label, "note": missing_note}
+            )
+        else:
+            computable_bits |= 1 << i
+            score_bits |= score << i
+            criteria.append(
+                {"name": name, "score": score, "value": value, "label": detail_label or label}
+            )
+
+    total_score = score_bits.bit_count()
+    computable_count = computable_bits.bit_count()
     data_completeness = round(computable_count / total_signals, 2)
 
     return {
@@ -364,6 +391,68 @@ def compute_fscore(
     }
 
 
+def compute_fscore_batch(
+    current: dict[str, np.ndarray],
+    previous: dict[str, np.ndarray],
+    median_pbr: np.ndarray,
+    median_per: np.ndarray,
+    volume_current: np.ndarray,
+    volume_previous: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``compute_fscore`` totals over a universe of tickers.
+
+    Args:
+        current: {eps, roe, bps, pbr, per, div} arrays (NaN for missing)
+        previous: {eps, roe, bps} arrays for the prior period (NaN for missing)
+        median_pbr, median_per: Sector medians per ticker (NaN for missing)
+        volume_current, volume_previous: Volume per ticker (NaN for missing)
+
+    Returns:
+        (total_score, data_completeness) arrays; comparisons with NaN are False, so
+        missing signals score 0 exactly as in the scalar version.
+    """
+    cur = {
+        k: np.asarray(current[k], dtype=np.float64)
+        for k in ("eps", "roe", "bps", "pbr", "per", "div")
+    }
+    prev = {k: np.asarray(previous[k], dtype=np.float64) for k in ("eps", "roe", "bps")}
+    median_pbr = np.asarray(median_pbr, dtype=np.float64)
+    median_per = np.asarray(median_per, dtype=np.float64)
+    vol_cur = np.asarray(volume_current, dtype=np.float64)
+    vol_prev = np.asarray(volume_previous, dtype=np.float64)
+
+    def present(*arrays: np.ndarray) -> np.ndarray:
+        return np.logical_and.reduce([~np.isnan(a) for a in arrays])
+
+    # Columns in _FSCORE_CRITERIA order
+    scores = np.column_stack([
+        cur["eps"] > 0,
+        cur["roe"] > 0,
+        cur["roe"] > prev["roe"],
+        cur["eps"] > prev["eps"],
+        cur["bps"] > prev["bps"],
+        (cur["pbr"] > 0) & (cur["pbr"] < median_pbr),
+        cur["div"] > 0,
+        (cur["per"] > 0) & (median_per > 0) & (cur["per"] < median_per),
+        (vol_prev > 0) & (vol_cur > vol_prev),
+    ])
+    computable = np.column_stack([
+        present(cur["eps"]),
+        present(cur["roe"]),
+        present(cur["roe"], prev["roe"]),
+        present(cur["eps"], prev["eps"]),
+        present(cur["bps"], prev["bps"]),
+        present(median_pbr) & (cur["pbr"] > 0),
+        present(cur["div"]),
+        (cur["per"] > 0) & (median_per > 0),
+        present(vol_cur) & (vol_prev > 0),
+    ])
+
+    total_score = scores.sum(axis=1)
+    data_completeness = np.round(computable.sum(axis=1) / len(_FSCORE_CRITERIA), 2)
+    return total_score, data_completeness
+
+
 def compute_investment_grade(
     fscore: int,
     safety_margin_pct: float | None,
@@ -11,6 +11,20 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Label bands: index = np.searchsorted(thresholds, value, side=...) into the label tuples.
+# Volatility and beta bands are "value < threshold" (side="right"); recovery bands are
+# "drawdown > threshold" (side="left").
+_RISK_THRESHOLDS = np.array([20.0, 40.0, 60.0])
+_RISK_LEVELS = ("low", "medium", "high", "very_high")
+_RISK_LABELS = ("저변동", "보통", "고변동", "초고변동")
+
+_BETA_THRESHOLDS = np.array([0.8, 1.2, 1.5])
+_BETA_LEVELS = ("defensive", "neutral", "aggressive", "highly_aggressive")
+_BETA_LABELS = ("방어적", "중립", "공격적", "초공격적")
+
+_RECOVERY_THRESHOLDS = np.array([-0.15, -0.05])
+_RECOVERY_LABELS = ("하락 지속", "조정 중", "회복")
+
 
 def compute_volatility(
     prices: list[float],
@@ -43,14 +57,13 @@ def compute_volatility(
             "risk_label": "알 수 없음",
         }
 
-    # Compute daily returns
-    returns = []
-    for i in range(1, len(prices)):
-        if prices[i - 1] > 0:
-            daily_return = (prices[i] - prices[i - 1]) / prices[i - 1]
-            returns.append(daily_return)
+    # Compute daily returns (days following a non-positive price are skipped)
+    p = np.asarray(prices, dtype=np.float64)
+    prev = p[:-1]
+    valid = prev > 0
+    returns = (p[1:][valid] - prev[valid]) / prev[valid]
 
-    if not returns:
+    if returns.size == 0:
         return {
             "volatility_20d": None,
             "volatility_60d": None,
@@ -67,9 +80,8 @@ def compute_volatility(
     for period in periods:
         key = period_keys.get(period, f"volatility_{period}d")
 
-        if len(returns) >= period:
-            period_returns = returns[-period:]
-            vol_std = float(np.std(period_returns, ddof=1))
+        if returns.size >= period:
+            vol_std = float(returns[-period:].std(ddof=1))
             # Annualize: std * sqrt(252) * 100 for percentage
             annualized_vol = round(vol_std * np.sqrt(252) * 100, 4)
             result[key] = annualized_vol
@@ -82,18 +94,10 @@ def compute_volatility(
     if vol_60d is None:
         risk_level = "unknown"
         risk_label = "알 수 없음"
-    elif vol_60d < 20:
-        risk_level = "low"
-        risk_label = "저변동"
-    elif vol_60d < 40:
-        risk_level = "medium"
-        risk_label = "보통"
-    elif vol_60d < 60:
-        risk_level = "high"
-        risk_label = "고변동"
     else:
-        risk_level = "very_high"
-        risk_label = "초고변동"
+        band = int(np.searchsorted(_RISK_THRESHOLDS, vol_60d, side="right"))
+        risk_level = _RISK_LEVELS[band]
+        risk_label = _RISK_LABELS[band]
 
     result["risk_level"] = risk_level
     result["risk_label"] = risk_label
@@ -101,6 +105,46 @@ def compute_volatility(
     return result
 
 
+def compute_volatility_batch(
+    prices: np.ndarray,
+    periods: tuple[int, ...] = (20, 60, 252),
+) -> dict[str, np.ndarray]:
+    """Vectorized ``compute_volatility`` over a (n_tickers, n_days) price matrix.
+
+    Rows are tickers on a common date axis (oldest first). A period's volatility is
+    NaN when the row has fewer returns than the period or a non-positive price inside
+    the window (the scalar version skips such days instead).
+
+    Returns:
+        {volatility_20d, volatility_60d, volatility_1y, risk_level, risk_label} arrays
+        in row order; risk fields are string arrays based on 60-day volatility.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    prev = prices[:, :-1]
+    valid = prev > 0
+    returns = np.where(valid, (prices[:, 1:] - prev) / np.where(valid, prev, 1.0), np.nan)
+
+    result: dict[str, np.ndarray] = {}
+    period_keys = {20: "volatility_20d", 60: "volatility_60d", 252: "volatility_1y"}
+    n_returns = returns.shape[1]
+
+    for period in periods:
+        key = period_keys.get(period, f"volatility_{period}d")
+        if n_returns >= period:
+            # NaN in a window propagates, matching "not computable"
+            vol = returns[:, -period:].std(axis=1, ddof=1) * np.sqrt(252) * 100
+            result[key] = np.round(vol, 4)
+        else:
+            result[key] = np.full(len(prices), np.nan)
+
+    vol_60d = result.get("volatility_60d", np.full(len(prices), np.nan))
+    unknown = np.isnan(vol_60d)
+    band = np.searchsorted(_RISK_THRESHOLDS, vol_60d, side="right")
+    result["risk_level"] = np.where(unknown, "unknown", np.array(_RISK_LEVELS)[band])
+    result["risk_label"] = np.where(unknown, "알 수 없음", np.array(_RISK_LABELS)[band])
+    return result
+
+
 def compute_beta(
     stock_prices: list[float],
     index_prices: list[float],
@@ -132,13 +176,12 @@ def compute_beta(
             "interpretation_label": "알 수 없음",
         }
 
-    if len(stock_prices) != len(index_prices):
-        # Trim to matching length
-        min_len = min(len(stock_prices), len(index_prices))
-        stock_prices = stock_prices[-min_len:]
-        index_prices = index_prices[-min_len:]
+    # Trim to matching length
+    min_len = min(len(stock_prices), len(index_prices))
+    s = np.asarray(stock_prices, dtype=np.float64)[-min_len:]
+    x = np.asarray(index_prices, dtype=np.float64)[-min_len:]
 
-    if len(stock_prices) < 2:
+    if min_len < 2:
         return {
             "beta_60d": None,
             "beta_252d": None,
@@ -146,18 +189,12 @@ def compute_beta(
             "interpretation_label": "알 수 없음",
         }
 
-    # Compute returns for both series
-    stock_returns = []
-    index_returns = []
+    # Compute returns for both series (days after a non-positive price in either are skipped)
+    valid = (s[:-1] > 0) & (x[:-1] > 0)
+    stock_returns = (s[1:][valid] - s[:-1][valid]) / s[:-1][valid]
+    index_returns = (x[1:][valid] - x[:-1][valid]) / x[:-1][valid]
 
-    for i in range(1, len(stock_prices)):
-        if stock_prices[i - 1] > 0 and index_prices[i - 1] > 0:
-            stock_ret = (stock_prices[i] - stock_prices[i - 1]) / stock_prices[i - 1]
-            index_ret = (index_prices[i] - index_prices[i - 1]) / index_prices[i - 1]
-            stock_returns.append(stock_ret)
-            index_returns.append(index_ret)
-
-    if not stock_returns or not index_returns:
+    if stock_returns.size == 0:
         return {
             "beta_60d": None,
             "beta_252d": None,
@@ -168,19 +205,18 @@ def compute_beta(
     result = {}
     period_keys = {60: "beta_60d", 252: "beta_252d"}
 
-    # Compute beta for each period
+    # Compute beta for each period: Cov(s, m) / Var(m) from demeaned dot products
+    # (the 1/(n-1) factors cancel)
     for period in periods:
         key = period_keys.get(period, f"beta_{period}d")
 
         if len(stock_returns) >= period:
-            stock_ret_period = stock_returns[-period:]
-            market_ret_period = index_returns[-period:]
-
-            market_var = float(np.var(market_ret_period, ddof=1))
+            s_c = stock_returns[-period:] - stock_returns[-period:].mean()
+            m_c = index_returns[-period:] - index_returns[-period:].mean()
+            market_ss = float(m_c @ m_c)
 
-            if market_var > 0:
-                cov_matrix = np.cov(stock_ret_period, market_ret_period)
-                beta = round(float(cov_matrix[0, 1] / market_var), 4)
+            if market_ss > 0:
+                beta = round(float(s_c @ m_c) / market_ss, 4)
                 result[key] = beta
             else:
                 result[key] = None
@@ -193,18 +229,10 @@ def compute_beta(
     if beta_60d is None:
         interpretation = "unknown"
         interpretation_label = "알 수 없음"
-    elif beta_60d < 0.8:
-        interpretation = "defensive"
-        interpretation_label = "방어적"
-    elif beta_60d < 1.2:
-        interpretation = "neutral"
-        interpretation_label = "중립"
-    elif beta_60d < 1.5:
-        interpretation = "aggressive"
-        interpretation_label = "공격적"
     else:
-        interpretation = "highly_aggressive"
-        interpretation_label = "초공격적"
+        band = int(np.searchsorted(_BETA_THRESHOLDS, beta_60d, side="right"))
+        interpretation = _BETA_LEVELS[band]
+        interpretation_label = _BETA_LABELS[band]
 
     result["interpretation"] = interpretation
     result["interpretation_label"] = interpretation_label
@@ -215,6 +243,7 @@ def compute_beta(
 def compute_max_drawdown(
     prices: list[float],
     periods: tuple[int, ...] = (60, 252),
+    ath_window: int | None = None,
 ) -> dict[str, Any]:
     """Compute maximum drawdown (peak-to-trough decline) for multiple periods.
 
@@ -224,6 +253,8 @@ def compute_max_drawdown(
     Args:
         prices: List of closing prices (chronological order, oldest first)
         periods: Tuple of lookback periods in trading days (default: 60d, 252d)
+        ath_window: Trading days the high for current_drawdown is taken over
+            (default: all prices given)
 
     Returns:
         {
@@ -243,48 +274,39 @@ def compute_max_drawdown(
 
     result = {}
     period_keys = {60: "mdd_60d", 252: "mdd_1y"}
+    arr = np.asarray(prices, dtype=np.float64)
 
     # Compute MDD for each period
     for period in periods:
         key = period_keys.get(period, f"mdd_{period}d")
 
-        if len(prices) >= period:
-            subset = prices[-period:]
-
-            # Track running peak and compute drawdowns
-            running_max = []
-            for i in range(len(subset)):
-                running_max.append(max(subset[: i + 1]))
+        if len(arr) >= period:
+            subset = arr[-period:]
 
-            drawdowns = []
-            for i in range(len(subset)):
-                if running_max[i] > 0:
-                    dd = (subset[i] - running_max[i]) / running_max[i]
-                    drawdowns.append(dd)
+            # Running peak and drawdown from it (days with a non-positive peak are skipped)
+            running_max = np.maximum.accumulate(subset)
+            valid = running_max > 0
+            drawdowns = (subset[valid] - running_max[valid]) / running_max[valid]
 
-            if drawdowns:
-                mdd = round(float(min(drawdowns)), 4)
+            if drawdowns.size:
+                mdd = round(float(drawdowns.min()), 4)
                 result[key] = mdd
             else:
                 result[key] = None
         else:
             result[key] = None
 
-    # Current drawdown from all-time high
-    current_price = prices[-1]
-    all_time_high = max(prices)
+    # Current drawdown from all-time (or ath_window) high
+    current_price = float(arr[-1])
+    all_time_high = float(arr[-ath_window:].max() if ath_window else arr.max())
 
     if all_time_high > 0:
         current_dd = round((current_price - all_time_high) / all_time_high, 4)
         result["current_drawdown"] = current_dd
 
         # Recovery label
-        if current_dd > -0.05:
-            recovery_label = "회복"
-        elif current_dd > -0.15:
-            recovery_label = "조정 중"
-        else:
-            recovery_label = "하락 지속"
+        band = int(np.searchsorted(_RECOVERY_THRESHOLDS, current_dd, side="left"))
+        recovery_label = _RECOVERY_LABELS[band]
     else:
         result["current_drawdown"] = None
         recovery_label = "알 수 없음"
@@ -292,3 +314,22 @@ def compute_max_drawdown(
     result["recovery_label"] = recovery_label
 
     return result
+
+
+def compute_max_drawdown_batch(prices: np.ndarray) -> np.ndarray:
+    """Maximum drawdown of each row of a (n_tickers, n_days) price matrix.
+
+    Same definition as ``compute_max_drawdown`` for one period, evaluated for all
+    tickers in one pass over the matrix (one running-peak scan along the day axis).
+
+    Returns:
+        float64 array of MDDs rounded to 4 places; NaN for rows with no positive peak.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    running_max = np.maximum.accumulate(prices, axis=1)
+    valid = running_max > 0
+    drawdowns = np.where(
+        valid, (prices - running_max) / np.where(valid, running_max, 1.0), np.inf
+    )
+    mdd = drawdowns.min(axis=1)
+    return np.round(np.where(np.isinf(mdd), np.nan, mdd), 4)
@@ -7,6 +7,8 @@ accumulation/distribution patterns across whale investor types.
 import logging
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 WHALE_TYPES = ["institution_net", "foreign_net", "pension_net", "private_equity_net", "other_corp_net"]
@@ -50,6 +52,11 @@ def compute_sector_flows(
         if sector and ticker in investor_data:
             sector_tickers.setdefault(sector, []).append(ticker)
 
+    # Rows are sorted once per ticker, and only for tickers that belong to a sector
+    soa = _prepare_investor_soa(
+        {t: investor_data[t] for tickers in sector_tickers.values() for t in tickers},
+        lookback_days,
+    )
     results = []
 
     for sector, tickers in sector_tickers.items():
@@ -60,69 +67,121 @@ def compute_sector_flows(
         # Aggregate sector trading value
         sector_trading_value = sum(trading_values.get(t, 0) for t in tickers)
 
-        for whale_type in WHALE_TYPES:
-            # Aggregate daily net flows across all tickers in sector
-            daily_sector_flows: dict[str, int] = {}  # date -> total net
-
-            for ticker in tickers:
-                rows = investor_data.get(ticker, [])
-                recent = sorted(rows, key=lambda x: x.get("trade_date", ""))[-lookback_days:]
-                for row in recent:
-                    d = str(row.get("trade_date", ""))
-                    val = row.get(whale_type)
-                    if val is not None:
-                        daily_sector_flows[d] = daily_sector_flows.get(d, 0) + val
-
-            if not daily_sector_flows:
+        # Aggregate daily net flows across all tickers in sector on a common date axis:
+        # totals[d, w] sums each whale type, seen[d, w] counts non-None contributions.
+        # All tickers' rows are stacked so the scatter-add is one call per sector.
+        all_dates, date_idx = np.unique(
+            np.concatenate([soa[t][0] for t in tickers]), return_inverse=True,
+        )
+        totals = np.zeros((len(all_dates), len(WHALE_TYPES)), dtype=np.int64)
+        seen = np.zeros((len(all_dates), len(WHALE_TYPES)), dtype=np.int64)
+        np.add.at(totals, date_idx, np.concatenate([soa[t][1] for t in tickers]))
+        np.add.at(seen, date_idx, np.concatenate([soa[t][2] for t in tickers]))
+
+        summary = _summarize_flows(totals, seen > 0, sector_trading_value)
+        net_purchase, total_days, consistency, intensity, trend_5d, signal_code = summary
+
+        for w, whale_type in enumerate(WHALE_TYPES):
+            if total_days[w] == 0:
                 results.append(_empty_sector_flow(sector, whale_type, stock_count))
                 continue
 
-            dates_sorted = sorted(daily_sector_flows.keys())
-            flows = [daily_sector_flows[d] for d in dates_sorted]
-            total_days = len(flows)
-
-            net_purchase = sum(flows)
-            buy_days = sum(1 for f in flows if f > 0)
-            consistency = buy_days / total_days if total_days > 0 else 0.0
-
-            # Intensity
-            if sector_trading_value > 0 and total_days > 0:
-                avg_daily_net = abs(net_purchase) / total_days
-                intensity = min(avg_daily_net / sector_trading_value, 1.0)
-            else:
-                intensity = 0.0
-
-            # Signal
-            signal = _classify_flow_signal(consistency, intensity, net_purchase)
-
-            # Trend: last 5 days vs full period
-            trend_5d = sum(flows[-5:]) if len(flows) >= 5 else net_purchase
-            trend_20d = net_purchase
-
             results.append({
                 "sector": sector,
                 "investor_type": whale_type,
-                "net_purchase": net_purchase,
-                "intensity": round(intensity, 4),
-                "consistency": round(consistency, 2),
-                "signal": signal,
-                "trend_5d": trend_5d,
-                "trend_20d": trend_20d,
+                "net_purchase": int(net_purchase[w]),
+                "intensity": round(float(intensity[w]), 4),
+                "consistency": round(float(consistency[w]), 2),
+                "signal": _FLOW_SIGNALS[signal_code[w]],
+                "trend_5d": int(trend_5d[w]),
+                "trend_20d": int(net_purchase[w]),
                 "stock_count": stock_count,
             })
 
     return results
 
 
-def _classify_flow_signal(consistency: float, intensity: float, net_purchase: int) -> str:
-    """Classify sector flow into signal categories."""
-    if net_purchase > 0 and consistency >= 0.7 and intensity >= 0.3:
-        return "strong_accumulation"
-    elif net_purchase > 0 and consistency >= 0.5:
-        return "mild_accumulation"
-    elif net_purchase < 0 and consistency <= 0.3:
-        return "distribution"
-    return "neutral"
+def _date_key(value: Any) -> int:
+    """Pack a trade date (date, or "YYYY-MM-DD"/"YYYYMMDD" string) into int YYYYMMDD."""
+    if hasattr(value, "year"):
+        return value.year * 10000 + value.month * 100 + value.day
+    return int(str(value).replace("-", "") or 0)
+
+
+def _prepare_investor_soa(
+    investor_data: dict[str, list[dict[str, Any]]],
+    lookback_days: int,
+) -> dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Convert per-ticker investor rows to arrays, sorted by date once per ticker.
+
+    Returns:
+        {ticker: (dates, flows, present)} over the last ``lookback_days`` rows, where
+        dates are int64 YYYYMMDD keys, flows is an int64 (n_days, len(WHALE_TYPES))
+        matrix with columns in WHALE_TYPES order (None stored as 0), and present marks
+        non-None values.
+    """
+    soa = {}
+    for ticker, rows in investor_data.items():
+        keys = [_date_key(row.get("trade_date", "")) for row in rows]
+        order = sorted(range(len(rows)), key=keys.__getitem__)[-lookback_days:]
+        values = [[rows[i].get(wt) for wt in WHALE_TYPES] for i in order]
+        present = np.array(
+            [[v is not None for v in vals] for vals in values], dtype=bool,
+        ).reshape(len(order), len(WHALE_TYPES))
+        flows = np.array(
+            [[v or 0 for v in vals] for vals in values], dtype=np.int64,
+        ).reshape(len(order), len(WHALE_TYPES))
+        dates = np.array([keys[i] for i in order], dtype=np.int64)
+        soa[ticker] = (dates, flows, present)
+    return soa
+
+
+# Signal codes returned by _summarize_flows
+_FLOW_SIGNALS = ("neutral", "strong_accumulation", "mild_accumulation", "distribution")
+
+
+def _summarize_flows(
+    totals: np.ndarray,
+    present: np.ndarray,
+    sector_trading_value: float,
+) -> tuple[np.ndarray, ...]:
+    """Summarize a sector's daily flows for all whale types in one pass over the matrix.
+
+    Args:
+        totals: int64 (n_dates, len(WHALE_TYPES)) daily sector net flows, oldest first
+        present: Same-shape mask of days that had any value for that whale type
+        sector_trading_value: Sector's summed average daily trading value
+
+    Returns:
+        (net_purchase, total_days, consistency, intensity, trend_5d, signal_code), each
+        an array over whale types. trend_5d sums the last 5 present days (the full
+        period when fewer); signal_code indexes _FLOW_SIGNALS.
+    """
+    flows = np.where(present, totals, 0)
+    net_purchase = flows.sum(axis=0)
+    total_days = present.sum(axis=0)
+    days = np.maximum(total_days, 1)
+    consistency = (flows > 0).sum(axis=0) / days
+
+    if sector_trading_value > 0:
+        intensity = np.minimum(np.abs(net_purchase) / days / sector_trading_value, 1.0)
+    else:
+        intensity = np.zeros(len(net_purchase))
+
+    # Present days counted from the most recent one: 1 = last present day
+    from_end = np.cumsum(present[::-1], axis=0)[::-1]
+    trend_5d = np.where(from_end <= 5, flows, 0).sum(axis=0)
+
+    signal_code = np.select(
+        [
+            (net_purchase > 0) & (consistency >= 0.7) & (intensity >= 0.3),
+            (net_purchase > 0) & (consistency >= 0.5),
+            (net_purchase < 0) & (consistency <= 0.3),
+        ],
+        [1, 2, 3],
+        default=0,
+    )
+    return net_purchase, total_days, consistency, intensity, trend_5d, signal_code
 
 
 def _empty_sector_flow(sector: str, investor_type: str, stock_count: int) -> dict[str, Any]:
@@ -8,7 +8,7 @@ Provides multiple stochastic models for price path simulation:
 """
 
 from enum import Enum
-from typing import Any, TypedDict
+from typing import Any, NamedTuple, TypedDict
 
 import numpy as np
 
@@ -39,4 +39,20 @@ class ModelResult(TypedDict):
     horizons: dict[int, HorizonStats]
 
 
-__all__ = ["SimModel", "HorizonStats", "ModelResult"]
+class ReturnStats(NamedTuple):
+    """Daily log-return statistics shared by all models."""
+    mean: float
+    std: float  # sample std (ddof=1)
+    recent_var: float  # sample variance of the last 20 returns (all if fewer)
+
+    @classmethod
+    def from_returns(cls, log_returns: np.ndarray) -> "ReturnStats":
+        recent = log_returns[-20:] if len(log_returns) >= 20 else log_returns
+        return cls(
+            mean=float(np.mean(log_returns)),
+            std=float(np.std(log_returns, ddof=1)),
+            recent_var=float(np.var(recent, ddof=1)),
+        )
+
+
+__all__ = ["SimModel", "HorizonStats", "ModelResult", "ReturnStats"]
@@ -11,6 +11,7 @@ import numpy as np
 
 from . import ModelResult, SimModel
 from .gbm import _compute_horizon_stats, HORIZON_LABELS
+from .scoring import compute_simulation_score
 
 logger = logging.getLogger(__name__)
 
@@ -70,45 +71,18 @@ def combine_ensemble(
     ensemble_horizons: dict[int, dict[str, Any]] = {}
     ensemble_terminal: dict[int, np.ndarray] = {}
 
-    rng = np.random.default_rng(42)  # deterministic pooling
-
+    # Each horizon is pooled independently with its own deterministic generator
     for h in horizons:
-        pooled_parts: list[np.ndarray] = []
-
-        for model_name, result in model_results.items():
-            tp = result["terminal_prices"].get(h)
-            if tp is None or len(tp) == 0:
-                continue
-
-            n_sample = sample_counts.get(model_name, 0)
-            if n_sample <= 0:
-                continue
-
-            # Sample with replacement from this model's terminal prices
-            indices = rng.choice(len(tp), size=n_sample, replace=True)
-            pooled_parts.append(tp[indices])
-
-        if not pooled_parts:
+        pooled = _pool_horizon(h, model_results, sample_counts, np.random.default_rng(42 + h))
+        if pooled is None:
             continue
-
-        pooled = np.concatenate(pooled_parts)
         ensemble_terminal[h] = pooled
         ensemble_horizons[h] = _compute_horizon_stats(pooled, base_price, h)
 
     # Target probabilities from pooled distribution
-    target_probs: dict[str, dict[int, float]] = {}
-    for mult in target_multipliers:
-        target_price = base_price * mult
-        key = str(mult)
-        target_probs[key] = {}
-        for h in horizons:
-            tp = ensemble_terminal.get(h)
-            if tp is not None:
-                target_probs[key][h] = round(float(np.mean(tp > target_price)), 4)
+    target_probs = _target_probs(ensemble_terminal, base_price, target_multipliers)
 
     # Model breakdown for transparency
-    from whaleback.analysis.simulation import compute_simulation_score
-
     model_scores: list[dict[str, Any]] = []
     for model_name, result in model_results.items():
         score_result = compute_simulation_score(result["horizons"])
@@ -130,3 +104,66 @@ def combine_ensemble(
         "terminal_prices": ensemble_terminal,
         "model_breakdown": model_breakdown,
     }
+
+
+def _pool_horizon(
+    h: int,
+    model_results: dict[str, ModelResult],
+    sample_counts: dict[str, int],
+    rng: np.random.Generator,
+) -> np.ndarray | None:
+    """Pool each model's allotted terminal prices at horizon h (None if none have any).
+
+    Terminal prices are iid draws, so a model with enough samples contributes its
+    first n_sample directly; only short arrays are resampled with replacement.
+    """
+    sources: list[tuple[np.ndarray, int]] = []
+    for model_name, result in model_results.items():
+        tp = result["terminal_prices"].get(h)
+        if tp is None or len(tp) == 0:
+            continue
+
+        n_sample = sample_counts.get(model_name, 0)
+        if n_sample <= 0:
+            continue
+
+        sources.append((tp, n_sample))
+
+    if not sources:
+        return None
+
+    pooled = np.empty(
+        sum(n for _, n in sources), dtype=np.result_type(*(tp for tp, _ in sources))
+    )
+    offset = 0
+    for tp, n_sample in sources:
+        out = pooled[offset:offset + n_sample]
+        if len(tp) >= n_sample:
+            out[:] = tp[:n_sample]
+        else:
+            np.take(tp, rng.integers(0, len(tp), size=n_sample), out=out)
+        offset += n_sample
+    return pooled
+
+
+def _target_probs(
+    terminal_prices: dict[int, np.ndarray],
+    base_price: int,
+    target_multipliers: tuple[float, ...],
+) -> dict[str, dict[int, float]]:
+    """P(terminal > base_price·mult) for every multiplier and horizon in one broadcast.
+
+    All horizons hold the same number of samples, so they are stacked into one
+    (horizons, samples) array and compared against every target at once.
+    """
+    if not terminal_prices:
+        return {str(mult): {} for mult in target_multipliers}
+
+    stacked = np.stack(list(terminal_prices.values()))
+    # Targets in the prices' dtype, as a scalar comparison would cast them
+    targets = np.array([base_price * mult for mult in target_multipliers], dtype=stacked.dtype)
+    probs = (stacked > targets[:, None, None]).mean(axis=2)
+    return {
+        str(mult): {h: round(float(p), 4) for h, p in zip(terminal_prices, row)}
+        for mult, row in zip(target_multipliers, probs)
+    }
@@ -5,16 +5,18 @@ Three-stage fallback: GARCH fit → EWMA(λ=0.94) → constant σ.
 
 import logging
 import warnings
+from functools import lru_cache
 
 import numpy as np
 
-from . import ModelResult
-from .gbm import _compute_horizon_stats
+from . import ModelResult, ReturnStats
+from .gbm import _compute_horizon_stats, _nested_terminal_prices
 
 logger = logging.getLogger(__name__)
 
 TRADING_DAYS_PER_YEAR = 252
 MAX_DAILY_MU = 1.0 / TRADING_DAYS_PER_YEAR  # Cap annual drift at ±100%
+ARCH_LM_CRITICAL = 3.84  # χ²(1) at 95%: below this the GARCH fit is skipped
 
 
 def simulate_garch(
@@ -28,17 +30,20 @@ def simulate_garch(
     max_sigma: float = 1.50,
     drift_adj_daily: float = 0.0,
     var_multiplier: float = 1.0,
+    stats: ReturnStats | None = None,
 ) -> ModelResult | None:
     """Run GARCH(1,1) simulation with time-varying volatility paths.
 
-    Fallback chain: GARCH → EWMA → constant σ.
+    Fallback chain: GARCH → EWMA → constant σ. ``stats`` are precomputed return
+    statistics (computed from log_returns if None).
     """
     if len(log_returns) < 30:
         logger.debug("GARCH: insufficient data (%d returns)", len(log_returns))
         return None
 
-    daily_mu = float(np.mean(log_returns))
-    daily_sigma_hist = float(np.std(log_returns, ddof=1))
+    if stats is None:
+        stats = ReturnStats.from_returns(log_returns)
+    daily_mu, daily_sigma_hist = stats.mean, stats.std
 
     # Recover arithmetic drift from sample log returns (undo implicit Ito correction).
     # E[log_ret] = (μ_arith − ½σ²_hist)·dt  →  μ_arith_daily = daily_mu + ½σ²_hist
@@ -60,10 +65,9 @@ def simulate_garch(
 
     if forecast_variance is None:
         # Stage 3: constant sigma fallback
-        daily_sigma = float(np.std(log_returns, ddof=1))
-        if daily_sigma == 0.0:
+        if daily_sigma_hist == 0.0:
             return None
-        forecast_variance = np.full(max_horizon, daily_sigma**2)
+        forecast_variance = np.full(max_horizon, daily_sigma_hist**2)
         logger.debug("GARCH: fell back to constant sigma")
 
     # Apply variance multiplier before capping
@@ -73,29 +77,27 @@ def simulate_garch(
     max_var = max_daily_sigma**2
     forecast_variance = np.clip(forecast_variance, 1e-10, max_var)
 
-    terminal_prices: dict[int, np.ndarray] = {}
-    horizons_result = {}
-
-    for h in horizons:
-        # NOTE: All paths share the same GARCH-forecasted volatility trajectory.
-        # In a full GARCH simulation, each path would evolve its own variance.
-        # This produces lighter tails than a path-dependent approach but is
-        # acceptable for screening/scoring purposes.
-        sigma_path = np.sqrt(forecast_variance[:h])  # (h,)
-
-        # Broadcast: (num_simulations, h)
-        z = rng.standard_normal((num_simulations, h))
-        # Use arithmetic drift with time-varying Ito correction from GARCH volatility
-        daily_log_ret = (mu_arith_daily - 0.5 * sigma_path**2) + sigma_path * z
-
-        cumulative = np.cumsum(daily_log_ret, axis=1)
-        terminal = base_price * np.exp(cumulative[:, -1])
-
-        # Cap extreme values
-        terminal = np.clip(terminal, base_price * 0.001, base_price * 100)
-
-        terminal_prices[h] = terminal
-        horizons_result[h] = _compute_horizon_stats(terminal, base_price, h)
+    # NOTE: All paths share the same GARCH-forecasted volatility trajectory.
+    # In a full GARCH simulation, each path would evolve its own variance.
+    # This produces lighter tails than a path-dependent approach but is
+    # acceptable for screening/scoring purposes.
+    # With a shared path the h-day log return is normal with mean Σ(μ − ½σ²_t) and
+    # variance Σσ²_t, extended segment by segment across nested horizons.
+    steps = sorted(set(horizons))
+    cum_var = np.cumsum(forecast_variance)
+    log_var = [float(cum_var[h - 1]) for h in steps]
+    terminal_prices = _nested_terminal_prices(
+        base_price,
+        steps,
+        [mu_arith_daily * h - 0.5 * v for h, v in zip(steps, log_var)],
+        log_var,
+        num_simulations,
+        rng,
+    )
+    horizons_result = {
+        h: _compute_horizon_stats(terminal, base_price, h)
+        for h, terminal in terminal_prices.items()
+    }
 
     return ModelResult(
         model="garch",
@@ -107,7 +109,39 @@ def simulate_garch(
 def _fit_garch(
     log_returns: np.ndarray, p: int, q: int, max_horizon: int
 ) -> np.ndarray | None:
-    """Fit GARCH(p,q) and return forecasted variance path."""
+    """Fit GARCH(p,q) and return forecasted variance path.
+
+    Returns None without fitting when squared returns show no ARCH effect (the
+    fit would be near-constant variance, which the EWMA fallback already covers).
+    Fits are cached per (returns, p, q, horizon).
+    """
+    if not _has_arch_effect(log_returns):
+        logger.debug("GARCH: no ARCH effect, skipping fit")
+        return None
+
+    forecast = _fit_garch_cached(
+        np.ascontiguousarray(log_returns, dtype=np.float64).tobytes(), p, q, max_horizon
+    )
+    return None if forecast is None else forecast.copy()
+
+
+def _has_arch_effect(log_returns: np.ndarray) -> bool:
+    """Engle LM test with one lag: N·ρ₁² of squared demeaned returns vs χ²(1) 95%."""
+    r2 = (log_returns - log_returns.mean()) ** 2
+    a = r2[:-1] - r2[:-1].mean()
+    b = r2[1:] - r2[1:].mean()
+    denom = float(np.sqrt((a @ a) * (b @ b)))
+    if denom == 0.0:
+        return False
+    rho = float(a @ b) / denom
+    return len(r2) * rho**2 >= ARCH_LM_CRITICAL
+
+
+@lru_cache(maxsize=256)
+def _fit_garch_cached(
+    returns_bytes: bytes, p: int, q: int, max_horizon: int
+) -> np.ndarray | None:
+    log_returns = np.frombuffer(returns_bytes, dtype=np.float64)
     try:
         from arch import arch_model
 
@@ -147,15 +181,11 @@ def _mean_reverting_variance(
         if daily_var <= 0:
             return None
 
-        # EWMA: variance mean-reverts slowly
-        variance_path = np.empty(max_horizon)
-        variance_path[0] = daily_var
+        # EWMA: variance mean-reverts slowly. Closed form of the recurrence:
+        # h[t] = σ²_lr + (h[0] − σ²_lr)·λ^t
         long_run_var = float(np.var(log_returns, ddof=1))
-
-        for t in range(1, max_horizon):
-            variance_path[t] = lam * variance_path[t - 1] + (1 - lam) * long_run_var
-
-        return variance_path
+        decay = np.power(lam, np.arange(max_horizon, dtype=np.float64))
+        return long_run_var + (daily_var - long_run_var) * decay
 
     except Exception as e:
         logger.debug("EWMA fallback failed: %s", e)
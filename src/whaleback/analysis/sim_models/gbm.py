@@ -1,10 +1,11 @@
 """Geometric Brownian Motion (constant volatility) simulation."""
 
 import logging
+import math
 
 import numpy as np
 
-from . import HorizonStats, ModelResult
+from . import HorizonStats, ModelResult, ReturnStats
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,8 @@ HORIZON_LABELS = {
     252: "1년",
 }
 
+_STAT_QUANTILES = np.array([0.05, 0.25, 0.50, 0.75, 0.95])  # p5, p25, p50, p75, p95
+
 
 def simulate_gbm(
     log_returns: np.ndarray,
@@ -28,6 +31,7 @@ def simulate_gbm(
     max_sigma: float = 1.50,
     drift_adj_daily: float = 0.0,
     vol_multiplier: float = 1.0,
+    stats: ReturnStats | None = None,
 ) -> ModelResult | None:
     """Run GBM simulation and return terminal prices + per-horizon stats.
 
@@ -40,12 +44,14 @@ def simulate_gbm(
         max_sigma: Cap on annualised volatility.
         drift_adj_daily: Additive daily drift adjustment (sentiment).
         vol_multiplier: Multiplicative volatility scaling (sentiment).
+        stats: Precomputed return statistics (computed from log_returns if None).
 
     Returns:
         ModelResult with terminal prices and horizon statistics, or None.
     """
-    daily_mu = float(np.mean(log_returns))
-    daily_sigma = float(np.std(log_returns, ddof=1))
+    if stats is None:
+        stats = ReturnStats.from_returns(log_returns)
+    daily_mu, daily_sigma = stats.mean, stats.std
 
     sigma = daily_sigma * np.sqrt(TRADING_DAYS_PER_YEAR)
 
@@ -71,20 +77,21 @@ def simulate_gbm(
     daily_vol = min(daily_vol, max_daily_vol)
     daily_drift = mu_arith_daily - 0.5 * daily_vol**2
 
-    terminal_prices: dict[int, np.ndarray] = {}
-    horizons_result: dict[int, HorizonStats] = {}
-
-    for h in horizons:
-        z = rng.standard_normal((num_simulations, h))
-        daily_log_ret = daily_drift + daily_vol * z
-        cumulative = np.cumsum(daily_log_ret, axis=1)
-        terminal = base_price * np.exp(cumulative[:, -1])
-
-        # Cap extreme values (consistent with other models)
-        terminal = np.clip(terminal, base_price * 0.001, base_price * 100)
-
-        terminal_prices[h] = terminal
-        horizons_result[h] = _compute_horizon_stats(terminal, base_price, h)
+    # Nested horizons: the h-day log return of N(h·drift, h·vol²) is extended segment
+    # by segment, so each simulation is one path observed at every horizon.
+    steps = sorted(set(horizons))
+    terminal_prices = _nested_terminal_prices(
+        base_price,
+        steps,
+        [daily_drift * h for h in steps],
+        [daily_vol**2 * h for h in steps],
+        num_simulations,
+        rng,
+    )
+    horizons_result = {
+        h: _compute_horizon_stats(terminal, base_price, h)
+        for h, terminal in terminal_prices.items()
+    }
 
     return ModelResult(
         model="gbm",
@@ -93,19 +100,76 @@ def simulate_gbm(
     )
 
 
+def _nested_terminal_prices(
+    base_price: int,
+    horizons: list[int],
+    log_mean: list[float],
+    log_var: list[float],
+    num_simulations: int,
+    rng: np.random.Generator,
+) -> dict[int, np.ndarray]:
+    """Terminal prices at ascending horizons from one log-return path per simulation.
+
+    ``log_mean[k]``/``log_var[k]`` are the mean and variance of the log return to
+    ``horizons[k]``. Each horizon multiplies in an independent lognormal growth factor
+    for the days since the previous one, so one draw per simulation is made per
+    horizon. Draws, growth and prices are float32 (rounding stays far below Monte
+    Carlo error); prices are capped to [0.1%, 100×] of base_price.
+    """
+    growth = np.ones(num_simulations, dtype=np.float32)
+    # Lognormal factors are formed in one reused buffer (rng.lognormal has no out=)
+    draw = np.empty(num_simulations, dtype=np.float32)
+    prev_mean = prev_var = 0.0
+    terminal_prices: dict[int, np.ndarray] = {}
+
+    for h, mean, var in zip(horizons, log_mean, log_var):
+        rng.standard_normal(out=draw, dtype=np.float32)
+        draw *= math.sqrt(max(var - prev_var, 0.0))
+        draw += float(mean - prev_mean)
+        growth *= np.exp(draw, out=draw)
+        prev_mean, prev_var = mean, var
+
+        # Prices feed only int percentiles and rounded means
+        terminal = growth * base_price
+        # Cap extreme values (consistent with other models)
+        np.clip(terminal, base_price * 0.001, base_price * 100, out=terminal)
+        terminal_prices[h] = terminal
+
+    return terminal_prices
+
+
+def _capped_prices(log_return: np.ndarray, base_price: int) -> np.ndarray:
+    """base_price·exp(log_return) capped to [0.1%, 100×] of base_price, in one buffer."""
+    terminal = np.exp(log_return)
+    terminal *= base_price
+    np.clip(terminal, base_price * 0.001, base_price * 100, out=terminal)
+    return terminal
+
+
 def _compute_horizon_stats(
     terminal: np.ndarray, base_price: int, h: int
 ) -> HorizonStats:
     """Compute percentile stats from terminal price distribution."""
     label = HORIZON_LABELS.get(h, f"{h}일")
+    # One sort serves all quantiles (linear interpolation, as np.percentile) and
+    # the upside count; p5 also gives the 5% VaR
+    sorted_t = np.sort(terminal)
+    n = sorted_t.size
+    pos = _STAT_QUANTILES * (n - 1)
+    lo = pos.astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    below = sorted_t[lo].astype(np.float64)
+    quantiles = below + (sorted_t[hi] - below) * (pos - lo)
+    p5, p25, p50, p75, p95 = quantiles.tolist()
+    n_up = n - int(np.searchsorted(sorted_t, base_price, side="right"))
     return HorizonStats(
         label=label,
-        p5=int(np.percentile(terminal, 5)),
-        p25=int(np.percentile(terminal, 25)),
-        p50=int(np.percentile(terminal, 50)),
-        p75=int(np.percentile(terminal, 75)),
-        p95=int(np.percentile(terminal, 95)),
-        expected_return_pct=round(float((np.mean(terminal) / base_price - 1) * 100), 2),
-        var_5pct_pct=round(float((np.percentile(terminal, 5) / base_price - 1) * 100), 2),
-        upside_prob=round(float(np.mean(terminal > base_price)), 4),
+        p5=int(p5),
+        p25=int(p25),
+        p50=int(p50),
+        p75=int(p75),
+        p95=int(p95),
+        expected_return_pct=round(float((terminal.mean() / base_price - 1) * 100), 2),
+        var_5pct_pct=round(float((p5 / base_price - 1) * 100), 2),
+        upside_prob=round(n_up / n, 4),
     )
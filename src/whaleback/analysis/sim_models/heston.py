@@ -7,11 +7,12 @@ Two coupled SDEs with Euler-Maruyama discretisation:
 """
 
 import logging
+import math
 
 import numpy as np
 
-from . import ModelResult
-from .gbm import _compute_horizon_stats
+from . import ModelResult, ReturnStats
+from .gbm import _capped_prices, _compute_horizon_stats
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ def simulate_heston(
     theta_mult: float = 1.0,
     v0_mult: float = 1.0,
     rho_adj: float = 0.0,
+    stats: ReturnStats | None = None,
 ) -> ModelResult | None:
     """Run Heston stochastic volatility simulation.
 
@@ -50,6 +52,7 @@ def simulate_heston(
         theta_mult: Multiplicative scaling for long-run variance (sentiment).
         v0_mult: Multiplicative scaling for initial variance (sentiment).
         rho_adj: Additive adjustment for price-variance correlation (sentiment).
+        stats: Precomputed return statistics (computed from log_returns if None).
     """
     if len(log_returns) < 30:
         logger.debug("Heston: insufficient data")
@@ -70,8 +73,9 @@ def simulate_heston(
         )
 
     # Annualise drift and variance so all parameters are on the same scale
-    daily_mu = float(np.mean(log_returns))
-    daily_sigma = float(np.std(log_returns, ddof=1))
+    if stats is None:
+        stats = ReturnStats.from_returns(log_returns)
+    daily_mu, daily_sigma = stats.mean, stats.std
     dt = 1.0 / TRADING_DAYS_PER_YEAR
 
     # Recover arithmetic drift from sample log returns (undo implicit Ito correction).
@@ -83,41 +87,34 @@ def simulate_heston(
     mu_arith_annual = float(np.clip(mu_arith_annual, -MAX_ANNUAL_MU * 2, MAX_ANNUAL_MU * 2))
 
     # Initial variance: annualise daily variance to match theta scale
-    recent_var = float(np.var(log_returns[-20:], ddof=1)) if len(log_returns) >= 20 else float(np.var(log_returns, ddof=1))
-    v0 = max(recent_var * TRADING_DAYS_PER_YEAR, 1e-8)
+    v0 = max(stats.recent_var * TRADING_DAYS_PER_YEAR, 1e-8)
     v0 *= v0_mult
 
     max_horizon = max(horizons)
 
-    # Pre-generate all random numbers
-    z1 = rng.standard_normal((num_simulations, max_horizon))
-    z_indep = rng.standard_normal((num_simulations, max_horizon))
-    z2 = rho * z1 + np.sqrt(1 - rho**2) * z_indep  # correlated
-
-    # Euler-Maruyama simulation
-    log_s = np.zeros((num_simulations, max_horizon + 1))
-    v = np.zeros((num_simulations, max_horizon + 1))
-    v[:, 0] = v0
-
-    for t in range(max_horizon):
-        v_pos = np.maximum(v[:, t], 0)  # full truncation
-        sqrt_v = np.sqrt(v_pos)
-
-        # Price process (log space) — arithmetic drift with stochastic Ito correction
-        log_s[:, t + 1] = log_s[:, t] + (mu_arith_annual - 0.5 * v_pos) * dt + sqrt_v * np.sqrt(dt) * z1[:, t]
-
-        # Variance process (cap at 10x long-run variance to prevent blowup)
-        v[:, t + 1] = v[:, t] + kappa * (theta - v_pos) * dt + xi * sqrt_v * np.sqrt(dt) * z2[:, t]
-        v[:, t + 1] = np.minimum(v[:, t + 1], max(theta * 10, 2.25))
+    # Pre-generate all random numbers, time-major so each step reads contiguous rows.
+    # float32 paths: rounding stays far below Monte Carlo error at these path counts
+    # (one fill for both factors; the stream matches two sequential draws)
+    z1, z_indep = rng.standard_normal((2, max_horizon, num_simulations), dtype=np.float32)
+
+    # Brownian increments: scale the shocks by √dt once rather than every step.
+    # The correlated factor ρ·dW₁ + √(1−ρ²)·dW⊥ is formed in z_indep's buffer.
+    sqdt = math.sqrt(dt)
+    z1 *= sqdt
+    z2 = z_indep
+    z2 *= math.sqrt(1 - rho**2) * sqdt
+    z2 += rho * z1
+
+    log_s_at = _euler_log_prices(
+        z1, z2, v0, mu_arith_annual, kappa, theta, xi, dt,
+        v_cap=max(theta * 10, 2.25), horizons=horizons,
+    )
 
     terminal_prices: dict[int, np.ndarray] = {}
     horizons_result = {}
 
     for h in horizons:
-        terminal = base_price * np.exp(log_s[:, h])
-
-        # Cap extreme values
-        terminal = np.clip(terminal, base_price * 0.001, base_price * 100)
+        terminal = _capped_prices(log_s_at[h], base_price)
 
         terminal_prices[h] = terminal
         horizons_result[h] = _compute_horizon_stats(terminal, base_price, h)
@@ -127,3 +124,64 @@ def simulate_heston(
         terminal_prices=terminal_prices,
         horizons=horizons_result,
     )
+
+
+def _euler_log_prices(
+    dw1: np.ndarray,
+    dw2: np.ndarray,
+    v0: float,
+    mu: float,
+    kappa: float,
+    theta: float,
+    xi: float,
+    dt: float,
+    v_cap: float,
+    horizons: tuple[int, ...],
+) -> dict[int, np.ndarray]:
+    """Step the Heston SDEs over the rows of dw1/dw2 and return log prices at horizons.
+
+    dw1/dw2 are (days, paths) Brownian increments (shocks already scaled by √dt)
+    for the price and variance processes; the state is kept in their dtype.
+
+    Log price and variance are held as one state vector each and updated in place,
+    so no (paths, days) path matrix is stored; log prices are copied out only at
+    the requested horizons.
+    """
+    max_horizon, num_simulations = dw1.shape
+    log_s = np.zeros(num_simulations, dtype=dw1.dtype)
+    v = np.full(num_simulations, v0, dtype=dw1.dtype)
+    wanted = set(horizons)
+    log_s_at: dict[int, np.ndarray] = {}
+
+    # Per-step scratch is allocated once; every update below writes through out=
+    v_pos = np.empty_like(v)
+    sqrt_v = np.empty_like(v)
+    tmp = np.empty_like(v)
+    mu_dt, half_dt = mu * dt, 0.5 * dt
+    kappa_dt, kappa_theta_dt = kappa * dt, kappa * theta * dt
+
+    for t in range(max_horizon):
+        np.maximum(v, 0, out=v_pos)  # full truncation
+        np.sqrt(v_pos, out=sqrt_v)
+
+        # Price process (log space) — arithmetic drift with stochastic Ito correction:
+        # log_s += (μ − ½v⁺)·dt + √v⁺·dW₁
+        np.multiply(sqrt_v, dw1[t], out=tmp)
+        log_s += tmp
+        np.multiply(v_pos, half_dt, out=tmp)
+        log_s -= tmp
+        log_s += mu_dt
+
+        # Variance process (capped to prevent blowup): v += κ(θ − v⁺)·dt + ξ√v⁺·dW₂
+        np.multiply(sqrt_v, dw2[t], out=tmp)
+        tmp *= xi
+        v += tmp
+        np.multiply(v_pos, kappa_dt, out=tmp)
+        v -= tmp
+        v += kappa_theta_dt
+        np.minimum(v, v_cap, out=v)
+
+        if t + 1 in wanted:
+            log_s_at[t + 1] = log_s.copy()
+
+    return log_s_at
@@ -9,8 +9,8 @@ import logging
 
 import numpy as np
 
-from . import ModelResult
-from .gbm import _compute_horizon_stats
+from . import ModelResult, ReturnStats
+from .gbm import _capped_prices, _compute_horizon_stats
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +33,7 @@ def simulate_merton(
     lam_multiplier: float = 1.0,
     mu_j_adj: float = 0.0,
     sig_j_multiplier: float = 1.0,
+    stats: ReturnStats | None = None,
 ) -> ModelResult | None:
     """Run Merton jump-diffusion simulation.
 
@@ -51,13 +52,15 @@ def simulate_merton(
         lam_multiplier: Multiplicative jump intensity scaling (sentiment).
         mu_j_adj: Additive mean jump size adjustment (sentiment).
         sig_j_multiplier: Multiplicative jump volatility scaling (sentiment).
+        stats: Precomputed return statistics (computed from log_returns if None).
     """
     if len(log_returns) < 30:
         logger.debug("Merton: insufficient data")
         return None
 
-    daily_mu = float(np.mean(log_returns))
-    daily_sigma_orig = float(np.std(log_returns, ddof=1))
+    if stats is None:
+        stats = ReturnStats.from_returns(log_returns)
+    daily_mu, daily_sigma_orig = stats.mean, stats.std
 
     sigma = daily_sigma_orig * np.sqrt(TRADING_DAYS_PER_YEAR)
     if sigma > max_sigma:
@@ -93,41 +96,38 @@ def simulate_merton(
 
     max_horizon = max(horizons)
 
-    # Pre-generate diffusion component
-    z = rng.standard_normal((num_simulations, max_horizon))
-
-    # Pre-generate jump component
-    n_jumps = rng.poisson(lam_daily, (num_simulations, max_horizon))
-    jump_sizes = np.zeros((num_simulations, max_horizon))
-
-    # For each cell with jumps > 0, sample jump magnitudes
-    mask = n_jumps > 0
-    total_jumps = int(n_jumps[mask].sum())
-    if total_jumps > 0:
-        # Sample all jump sizes at once, then assign
-        all_jumps = rng.normal(mu_j, sigma_j, total_jumps)
-
-        idx = 0
-        rows, cols = np.where(mask)
-        for r, c in zip(rows, cols):
-            nj = n_jumps[r, c]
-            jump_sizes[r, c] = np.sum(all_jumps[idx:idx + nj])
-            idx += nj
-
-    # Daily log returns: drift + diffusion + jumps
-    daily_log_ret = (drift_comp - 0.5 * daily_sigma**2) + daily_sigma * z + jump_sizes
-
-    # Cumulative
-    cumulative = np.cumsum(daily_log_ret, axis=1)
+    # Pre-generate diffusion component (float32 paths: rounding stays far below
+    # Monte Carlo error at these path counts)
+    z = rng.standard_normal((num_simulations, max_horizon), dtype=np.float32)
+
+    # Daily log returns: drift + diffusion, formed in z's buffer
+    # (Python float scalars keep the float32 arrays from being promoted)
+    daily_log_ret = z
+    daily_log_ret *= float(daily_sigma)
+    daily_log_ret += float(drift_comp - 0.5 * daily_sigma**2)
+
+    # Jump component, skipped entirely when jumps are off or cannot move the price
+    if lam_daily > 0 and (mu_j != 0 or sigma_j != 0):
+        n_jumps = rng.poisson(lam_daily, (num_simulations, max_horizon))
+
+        # The sum of a cell's n iid N(μ_j, σ_j²) jumps is one N(n·μ_j, n·σ_j²) draw
+        mask = n_jumps > 0
+        if mask.any():
+            nj = n_jumps[mask]
+            daily_log_ret[mask] += rng.normal(nj * mu_j, np.sqrt(nj) * sigma_j)
+
+    # Cumulative log returns at the horizons only: sum the days between consecutive
+    # horizons, then accumulate those few segment sums
+    steps = sorted(set(horizons))
+    segment_sums = np.add.reduceat(daily_log_ret, [0, *steps[:-1]], axis=1)
+    np.cumsum(segment_sums, axis=1, out=segment_sums)
+    cumulative = dict(zip(steps, segment_sums.T))
 
     terminal_prices: dict[int, np.ndarray] = {}
     horizons_result = {}
 
     for h in horizons:
-        terminal = base_price * np.exp(cumulative[:, h - 1])
-
-        # Cap extreme values
-        terminal = np.clip(terminal, base_price * 0.001, base_price * 100)
+        terminal = _capped_prices(cumulative[h], base_price)
 
         terminal_prices[h] = terminal
         horizons_result[h] = _compute_horizon_stats(terminal, base_price, h)
@@ -0,0 +1,100 @@
+"""Simulation score: 0-100 score and grade from per-horizon statistics.
+
+Kept in a leaf module so both the orchestrator (``simulation``) and the ensemble
+combiner can import it at module level.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+
+# Simulation score weights
+SCORE_WEIGHTS = {
+    "mean_return_6m": 0.40,
+    "upside_prob_3m": 0.35,
+    "neg_var_5pct_3m": 0.25,
+}
+
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+
+
+def compute_simulation_score(
+    horizons_result: Mapping[Any, Mapping[str, Any]],
+) -> dict[str, float | str | None]:
+    """Derive a 0-100 simulation score from horizon statistics.
+
+    Weights:
+        - 40 %  mean return at 6 months (126d)
+        - 35 %  upside probability at 3 months (63d)
+        - 25 %  negative VaR (5 %) at 3 months (63d)
+
+    Returns:
+        {"score": float | None, "grade": str | None}
+    """
+    # Support both int keys (pre-DB) and string keys (post-JSONB)
+    h126 = horizons_result.get(126) or horizons_result.get("126")
+    h63 = horizons_result.get(63) or horizons_result.get("63")
+
+    if h126 is None or h63 is None:
+        return {"score": None, "grade": None}
+
+    median_return_6m = h126.get("expected_return_pct")
+    upside_prob_3m = h63.get("upside_prob")
+    var_5pct_3m = h63.get("var_5pct_pct")
+
+    if any(v is None for v in (median_return_6m, upside_prob_3m, var_5pct_3m)):
+        return {"score": None, "grade": None}
+
+    # Normalize components to 0-100
+    norm_return = _normalize_return(median_return_6m, center=0, scale=50)
+    norm_upside = upside_prob_3m * 100
+    norm_var = _normalize_var(var_5pct_3m, center=-25, scale=15)
+
+    w = SCORE_WEIGHTS
+    score = (
+        w["mean_return_6m"] * norm_return
+        + w["upside_prob_3m"] * norm_upside
+        + w["neg_var_5pct_3m"] * norm_var
+    )
+
+    score = round(float(np.clip(score, 0, 100)), 2)
+
+    if score >= 70:
+        grade = "positive"
+    elif score >= 50:
+        grade = "neutral_positive"
+    elif score >= 30:
+        grade = "neutral"
+    else:
+        grade = "negative"
+
+    return {"score": score, "grade": grade}
+
+
+# ---------------------------------------------------------------------------
+# Normalisation helpers (sigmoid mapping to 0-100)
+# ---------------------------------------------------------------------------
+
+
+def _normalize_return(value: float, center: float = 0, scale: float = 50) -> float:
+    """Sigmoid normalisation for expected-return values.
+
+    Responsive range (10-90 score): approx -110% to +110%.
+    Wider scale prevents saturation for Korean equities with high volatility.
+    Calibrated via walk-forward backtest on KOSPI/KOSDAQ universe.
+    """
+    return float(100.0 / (1.0 + np.exp(-(value - center) / scale)))
+
+
+def _normalize_var(value: float, center: float = -25, scale: float = 15) -> float:
+    """Sigmoid normalisation for VaR values (lower VaR loss = higher score).
+
+    Center at -25% means a 25% loss over 3 months scores 50 (neutral).
+    Responsive range (10-90 score): approx -58% to +8% VaR.
+    Calibrated for Korean equities (median 3M VaR ≈ -29% across KOSPI/KOSDAQ).
+    """
+    return float(100.0 / (1.0 + np.exp(-(value - center) / scale)))
@@ -6,16 +6,22 @@ and combines results via weighted-pooling ensemble.
 
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
 
-from whaleback.analysis.sim_models import SimModel
+from whaleback.analysis.sim_models import ModelResult, ReturnStats, SimModel
 from whaleback.analysis.sim_models.gbm import simulate_gbm
 from whaleback.analysis.sim_models.garch import simulate_garch
 from whaleback.analysis.sim_models.heston import simulate_heston
 from whaleback.analysis.sim_models.merton import simulate_merton
-from whaleback.analysis.sim_models.ensemble import combine_ensemble
+from whaleback.analysis.sim_models.ensemble import _target_probs, combine_ensemble
+from whaleback.analysis.sim_models.scoring import (  # noqa: F401 (SCORE_WEIGHTS re-export)
+    SCORE_WEIGHTS,
+    compute_simulation_score,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,13 +45,6 @@ HORIZON_LABELS = {
     252: "1년",
 }
 
-# Simulation score weights
-SCORE_WEIGHTS = {
-    "mean_return_6m": 0.40,
-    "upside_prob_3m": 0.35,
-    "neg_var_5pct_3m": 0.25,
-}
-
 # Default ensemble weights
 DEFAULT_WEIGHTS = {
     SimModel.GBM.value: 0.25,
@@ -77,6 +76,7 @@ def run_monte_carlo(
     merton_params: dict[str, Any] | None = None,
     max_sigma: float = MAX_ANNUALIZED_SIGMA,
     sentiment_adjustments: dict[str, Any] | None = None,
+    model_workers: int = 1,
 ) -> dict[str, Any] | None:
     """Run multi-model Monte Carlo simulation on a price series.
 
@@ -96,6 +96,8 @@ def run_monte_carlo(
         merton_params: Override Merton parameters {lam, mu_j, sigma_j}.
         max_sigma: Cap on annualised volatility.
         sentiment_adjustments: Optional sentiment-based parameter overrides.
+        model_workers: Threads for running the models concurrently (default 1,
+            as batch callers already run one ticker per process).
 
     Returns:
         Result dict with ensemble statistics + model_breakdown, or None.
@@ -109,9 +111,8 @@ def run_monte_carlo(
         )
         return None
 
-    clean_prices = np.array(
-        [p for p in prices if p is not None and np.isfinite(p) and p > 0]
-    )
+    clean_prices = np.asarray(prices, dtype=np.float64)  # None becomes NaN
+    clean_prices = clean_prices[np.isfinite(clean_prices) & (clean_prices > 0)]
     if len(clean_prices) < MIN_HISTORY_DAYS:
         logger.debug("After cleaning, insufficient prices: %d", len(clean_prices))
         return None
@@ -124,8 +125,9 @@ def run_monte_carlo(
         return None
 
     # --- Derive annualised stats for metadata ---------------------------
-    daily_mu = float(np.mean(log_returns))
-    daily_sigma = float(np.std(log_returns, ddof=1))
+    # Computed once and shared with every model
+    stats = ReturnStats.from_returns(log_returns)
+    daily_mu, daily_sigma = stats.mean, stats.std
     mu = daily_mu * TRADING_DAYS_PER_YEAR
     sigma = daily_sigma * np.sqrt(TRADING_DAYS_PER_YEAR)
 
@@ -138,13 +140,6 @@ def run_monte_carlo(
 
     base_price = max(1, int(round(clean_prices[-1])))
 
-    # --- Stable seed (hashlib-based, not session-dependent hash()) ------
-    if ticker:
-        seed = int(hashlib.sha256(ticker.encode()).hexdigest(), 16) % (2**32)
-    else:
-        seed = None
-    rng = np.random.default_rng(seed=seed)
-
     # --- Resolve models and weights -------------------------------------
     if models is None:
         models = ALL_MODELS
@@ -160,72 +155,38 @@ def run_monte_carlo(
     merton_p = merton_params or {}
 
     # --- Run each model (independent child RNGs for isolation) ----------
-    model_results = {}
-
-    for model in models:
-        # Model-keyed seed: deterministic per (ticker, model) regardless of
-        # which other models are in the set — true isolation.
-        if ticker:
-            model_seed = int(
-                hashlib.sha256(f"{ticker}:{model.value}".encode()).hexdigest(), 16
-            ) % (2**63)
-        else:
-            model_seed = rng.integers(2**63)
-        child_rng = np.random.default_rng(model_seed)
-        try:
-            if model == SimModel.GBM:
-                result = simulate_gbm(
-                    log_returns, base_price, num_simulations,
-                    horizons, child_rng, max_sigma=max_sigma,
-                    drift_adj_daily=sa.get("drift_adj_daily", 0.0),
-                    vol_multiplier=sa.get("vol_multiplier", 1.0),
-                )
-            elif model == SimModel.GARCH:
-                result = simulate_garch(
-                    log_returns, base_price, num_simulations,
-                    horizons, child_rng,
-                    p=garch_p.get("p", 1),
-                    q=garch_p.get("q", 1),
-                    max_sigma=max_sigma,
-                    drift_adj_daily=sa.get("drift_adj_daily", 0.0),
-                    var_multiplier=sa.get("var_multiplier", 1.0),
-                )
-            elif model == SimModel.HESTON:
-                result = simulate_heston(
-                    log_returns, base_price, num_simulations,
-                    horizons, child_rng,
-                    kappa=heston_p.get("kappa", 3.0),
-                    theta=heston_p.get("theta", 0.09),
-                    xi=heston_p.get("xi", 0.40),
-                    rho=heston_p.get("rho", -0.50),
-                    drift_adj_annual=sa.get("drift_adj_daily", 0.0) * 252,
-                    theta_mult=sa.get("theta_mult", 1.0),
-                    v0_mult=sa.get("v0_mult", 1.0),
-                    rho_adj=sa.get("rho_adj", 0.0),
-                )
-            elif model == SimModel.MERTON:
-                result = simulate_merton(
-                    log_returns, base_price, num_simulations,
-                    horizons, child_rng,
-                    lam=merton_p.get("lam", 3.0),
-                    mu_j=merton_p.get("mu_j", 0.0),
-                    sigma_j=merton_p.get("sigma_j", 0.06),
-                    max_sigma=max_sigma,
-                    drift_adj_daily=sa.get("drift_adj_daily", 0.0),
-                    vol_multiplier=sa.get("vol_multiplier", 1.0),
-                    lam_multiplier=sa.get("lam_mult", 1.0),
-                    mu_j_adj=sa.get("mu_j_adj", 0.0),
-                    sig_j_multiplier=sa.get("sig_j_mult", 1.0),
-                )
-            else:
-                continue
-
-            if result is not None:
-                model_results[model.value] = result
-
-        except Exception as e:
-            logger.warning("Model %s failed: %s", model.value, e)
-            continue
+    # Stable seed (hashlib-based, not session-dependent hash()), keyed per
+    # (ticker, model) regardless of which other models are in the set — true
+    # isolation. Unseeded runs spawn independent child streams. Seeds are
+    # resolved in model order before dispatch so threading does not change them.
+    model_seeds: list[int | np.random.SeedSequence]
+    if ticker:
+        model_seeds = [_model_seed(ticker, model.value) for model in models]
+    else:
+        model_seeds = [*np.random.SeedSequence().spawn(len(models))]
+    model_args = (
+        log_returns, base_price, num_simulations, horizons,
+        max_sigma, sa, garch_p, heston_p, merton_p, stats,
+    )
+
+    if model_workers > 1 and len(models) > 1:
+        # The path kernels are NumPy ufunc loops that release the GIL
+        with ThreadPoolExecutor(max_workers=min(model_workers, len(models))) as executor:
+            results = list(executor.map(
+                lambda model, model_seed: _run_model(model, model_seed, *model_args),
+                models, model_seeds,
+            ))
+    else:
+        results = [
+            _run_model(model, model_seed, *model_args)
+            for model, model_seed in zip(models, model_seeds)
+        ]
+
+    model_results: dict[str, ModelResult] = {
+        model.value: result
+        for model, result in zip(models, results)
+        if result is not None
+    }
 
     if not model_results:
         logger.debug("All models failed, returning None")
@@ -297,6 +258,86 @@ def run_monte_carlo(
     }
 
 
+@lru_cache(maxsize=65536)
+def _model_seed(ticker: str, model_value: str) -> int:
+    """Deterministic child seed for a (ticker, model) pair, hashed once per process."""
+    return int(hashlib.sha256(f"{ticker}:{model_value}".encode()).hexdigest(), 16) % (2**63)
+
+
+def _run_model(
+    model: SimModel,
+    model_seed: int | np.random.SeedSequence,
+    log_returns: np.ndarray,
+    base_price: int,
+    num_simulations: int,
+    horizons: tuple[int, ...],
+    max_sigma: float,
+    sa: dict[str, Any],
+    garch_p: dict[str, Any],
+    heston_p: dict[str, Any],
+    merton_p: dict[str, Any],
+    stats: ReturnStats,
+) -> ModelResult | None:
+    """Run one model on its own seeded generator; None if it fails or is unknown.
+
+    SFC64 is NumPy's fastest bundled bit generator for the normal fills that
+    dominate the path kernels; SeedSequence seeding keeps streams independent.
+    """
+    child_rng = np.random.Generator(np.random.SFC64(model_seed))
+    try:
+        if model == SimModel.GBM:
+            return simulate_gbm(
+                log_returns, base_price, num_simulations,
+                horizons, child_rng, max_sigma=max_sigma,
+                drift_adj_daily=sa.get("drift_adj_daily", 0.0),
+                vol_multiplier=sa.get("vol_multiplier", 1.0),
+                stats=stats,
+            )
+        if model == SimModel.GARCH:
+            return simulate_garch(
+                log_returns, base_price, num_simulations,
+                horizons, child_rng,
+                p=garch_p.get("p", 1),
+                q=garch_p.get("q", 1),
+                max_sigma=max_sigma,
+                drift_adj_daily=sa.get("drift_adj_daily", 0.0),
+                var_multiplier=sa.get("var_multiplier", 1.0),
+                stats=stats,
+            )
+        if model == SimModel.HESTON:
+            return simulate_heston(
+                log_returns, base_price, num_simulations,
+                horizons, child_rng,
+                kappa=heston_p.get("kappa", 3.0),
+                theta=heston_p.get("theta", 0.09),
+                xi=heston_p.get("xi", 0.40),
+                rho=heston_p.get("rho", -0.50),
+                drift_adj_annual=sa.get("drift_adj_daily", 0.0) * 252,
+                theta_mult=sa.get("theta_mult", 1.0),
+                v0_mult=sa.get("v0_mult", 1.0),
+                rho_adj=sa.get("rho_adj", 0.0),
+                stats=stats,
+            )
+        if model == SimModel.MERTON:
+            return simulate_merton(
+                log_returns, base_price, num_simulations,
+                horizons, child_rng,
+                lam=merton_p.get("lam", 3.0),
+                mu_j=merton_p.get("mu_j", 0.0),
+                sigma_j=merton_p.get("sigma_j", 0.06),
+                max_sigma=max_sigma,
+                drift_adj_daily=sa.get("drift_adj_daily", 0.0),
+                vol_multiplier=sa.get("vol_multiplier", 1.0),
+                lam_multiplier=sa.get("lam_mult", 1.0),
+                mu_j_adj=sa.get("mu_j_adj", 0.0),
+                sig_j_multiplier=sa.get("sig_j_mult", 1.0),
+                stats=stats,
+            )
+    except Exception as e:
+        logger.warning("Model %s failed: %s", model.value, e)
+    return None
+
+
 def _stringify_keys(d: dict) -> dict[str, Any]:
     """Convert int dict keys to strings for JSONB compatibility."""
     return {str(k): v for k, v in d.items()}
@@ -308,94 +349,7 @@ def _compute_target_probs(
     target_multipliers: tuple[float, ...],
 ) -> dict[str, dict[str, float]]:
     """Compute target-price probabilities from terminal price arrays."""
-    target_probs: dict[str, dict[str, float]] = {}
-    for mult in target_multipliers:
-        target_price = base_price * mult
-        key = str(mult)
-        target_probs[key] = {}
-        for h, terminal in terminal_prices.items():
-            target_probs[key][str(h)] = round(float(np.mean(terminal > target_price)), 4)
-    return target_probs
-
-
-# ---------------------------------------------------------------------------
-# Scoring (unchanged from original)
-# ---------------------------------------------------------------------------
-
-
-def compute_simulation_score(
-    horizons_result: dict[int, dict[str, Any]],
-) -> dict[str, float | str | None]:
-    """Derive a 0-100 simulation score from horizon statistics.
-
-    Weights:
-        - 40 %  mean return at 6 months (126d)
-        - 35 %  upside probability at 3 months (63d)
-        - 25 %  negative VaR (5 %) at 3 months (63d)
-
-    Returns:
-        {"score": float | None, "grade": str | None}
-    """
-    # Support both int keys (pre-DB) and string keys (post-JSONB)
-    h126 = horizons_result.get(126) or horizons_result.get("126")
-    h63 = horizons_result.get(63) or horizons_result.get("63")
-
-    if h126 is None or h63 is None:
-        return {"score": None, "grade": None}
-
-    median_return_6m = h126.get("expected_return_pct")
-    upside_prob_3m = h63.get("upside_prob")
-    var_5pct_3m = h63.get("var_5pct_pct")
-
-    if any(v is None for v in (median_return_6m, upside_prob_3m, var_5pct_3m)):
-        return {"score": None, "grade": None}
-
-    # Normalize components to 0-100
-    norm_return = _normalize_return(median_return_6m, center=0, scale=50)
-    norm_upside = upside_prob_3m * 100
-    norm_var = _normalize_var(var_5pct_3m, center=-25, scale=15)
-
-    w = SCORE_WEIGHTS
-    score = (
-        w["mean_return_6m"] * norm_return
-        + w["upside_prob_3m"] * norm_upside
-        + w["neg_var_5pct_3m"] * norm_var
-    )
-
-    score = round(float(np.clip(score, 0, 100)), 2)
-
-    if score >= 70:
-        grade = "positive"
-    elif score >= 50:
-        grade = "neutral_positive"
-    elif score >= 30:
-        grade = "neutral"
-    else:
-        grade = "negative"
-
-    return {"score": score, "grade": grade}
-
-
-# ---------------------------------------------------------------------------
-# Normalisation helpers (sigmoid mapping to 0-100)
-# ---------------------------------------------------------------------------
-
-
-def _normalize_return(value: float, center: float = 0, scale: float = 50) -> float:
-    """Sigmoid normalisation for expected-return values.
-
-    Responsive range (10-90 score): approx -110% to +110%.
-    Wider scale prevents saturation for Korean equities with high volatility.
-    Calibrated via walk-forward backtest on KOSPI/KOSDAQ universe.
-    """
-    return float(100.0 / (1.0 + np.exp(-(value - center) / scale)))
-
-
-def _normalize_var(value: float, center: float = -25, scale: float = 15) -> float:
-    """Sigmoid normalisation for VaR values (lower VaR loss = higher score).
-
-    Center at -25% means a 25% loss over 3 months scores 50 (neutral).
-    Responsive range (10-90 score): approx -58% to +8% VaR.
-    Calibrated for Korean equities (median 3M VaR ≈ -29% across KOSPI/KOSDAQ).
-    """
-    return float(100.0 / (1.0 + np.exp(-(value - center) / scale)))
+    return {
+        key: {str(h): p for h, p in hprobs.items()}
+        for key, hprobs in _target_probs(terminal_prices, base_price, target_multipliers).items()
+    }
@@ -91,6 +91,12 @@ class Settings(BaseSettings):
     news_bert_confidence_threshold: float = 0.55
     news_max_llm_escalation: int = 200  # Max articles for LLM escalation (cost cap ~$0.32/run)
     news_use_batch_api: bool = False  # Batch API is slow for small batches; use concurrent by default
+    news_llm_concurrency: int = 32  # Max in-flight LLM requests on the concurrent path
+    news_keyword_prefilter: bool = True  # Score boilerplate notices neutral without BERT
+    news_keyword_polar: bool = False  # Also let polar keyword hits skip BERT
+    news_llm_articles_per_request: int = 10  # Articles packed into one LLM escalation request
+    news_bert_compile: bool = False  # torch.compile the BERT model on CUDA (experimental)
+    news_sentiment_cache_path: str = ""  # SQLite file caching BERT/LLM scores across runs (empty = off)
     news_sentiment_half_life: float = 3.0
 
     # Market AI Summary
@@ -1,10 +1,21 @@
 """Unit tests for whaleback.analysis.quant module."""
 
+import numpy as np
+import pytest
+
 from whaleback.analysis.quant import (
+    Fundamentals,
     compute_rim,
+    compute_rim_batch,
+    compute_rim_default,
     compute_safety_margin,
+    compute_safety_margin_batch,
     compute_fscore,
+    compute_fscore_batch,
+    format_fscore_criteria,
     compute_investment_grade,
+    rim_calculator,
+    with_median_labels,
 )
 
 
@@ -170,6 +181,68 @@ class TestComputeSafetyMargin:
         assert round(result["safety_margin_pct"], 2) == result["safety_margin_pct"]
 
 
+class TestRimCalculator:
+    """Test rim_calculator specializations against compute_rim."""
+
+    CASES = [(50000, 15.0), (50000, 5.0), (None, 15.0), (50000, None), (-1000, 15.0),
+             (0, 15.0), (10000, -90.0)]
+
+    def test_default_matches_compute_rim(self):
+        for bps, roe in self.CASES:
+            assert compute_rim_default(bps, roe) == compute_rim(bps, roe)
+
+    def test_custom_rates_match_compute_rim(self):
+        rim = rim_calculator(risk_free_rate=0.03, equity_risk_premium=0.05, growth_rate=0.02)
+        for bps, roe in self.CASES:
+            assert rim(bps, roe) == compute_rim(bps, roe, 0.03, 0.05, 0.02)
+
+    def test_degenerate_denominator_matches_compute_rim(self):
+        rim = rim_calculator(risk_free_rate=0.05, equity_risk_premium=0.05, growth_rate=0.10)
+        for bps, roe in self.CASES:
+            assert rim(bps, roe) == compute_rim(bps, roe, 0.05, 0.05, 0.10)
+
+
+class TestBatchValuation:
+    """Test compute_rim_batch / compute_safety_margin_batch against the scalar versions."""
+
+    BPS = [50000, 50000, None, -1000, 0, 20000, 10000]
+    ROE = [15.0, 5.0, 15.0, 15.0, 15.0, None, -40.0]
+
+    def test_rim_batch_matches_scalar(self):
+        bps = np.array([np.nan if b is None else b for b in self.BPS], dtype=float)
+        roe = np.array([np.nan if r is None else r for r in self.ROE], dtype=float)
+        values, computable = compute_rim_batch(bps, roe)
+
+        for i, (b, r) in enumerate(zip(self.BPS, self.ROE)):
+            scalar = compute_rim(bps=b, roe=r)
+            assert computable[i] == scalar["computable"]
+            if scalar["computable"]:
+                assert values[i] == scalar["rim_value"]
+            else:
+                assert np.isnan(values[i])
+
+    def test_rim_batch_degenerate_denominator(self):
+        values, _ = compute_rim_batch(
+            np.array([1000.0, 1000.0]), np.array([20.0, 5.0]),
+            risk_free_rate=0.05, equity_risk_premium=0.05, growth_rate=0.10,
+        )
+        assert values.tolist() == [10000.0, 1000.0]
+
+    def test_safety_margin_batch_matches_scalar(self):
+        rims = [100000.0, 100000.0, None, 0.0, 50000.0]
+        prices = [70000, 130000, 50000, 50000, None]
+        margins = compute_safety_margin_batch(
+            np.array([np.nan if v is None else v for v in rims]),
+            np.array([np.nan if p is None else p for p in prices], dtype=float),
+        )
+        for i, (rim, price) in enumerate(zip(rims, prices)):
+            expected = compute_safety_margin(rim, price)["safety_margin_pct"]
+            if expected is None:
+                assert np.isnan(margins[i])
+            else:
+                assert margins[i] == expected
+
+
 class TestComputeFScore:
     """Test compute_fscore function."""
 
@@ -290,6 +363,98 @@ class TestComputeFScore:
         vol_criterion = next(c for c in result["criteria"] if c["name"] == "volume_increasing")
         assert vol_criterion["score"] == 0
 
+    def test_fundamentals_match_dicts(self):
+        current = {"eps": 5000, "roe": 15.0, "bps": 60000, "pbr": 0.5, "per": 8.0, "div": 0}
+        previous = {"eps": 6000, "roe": 10.0}
+        medians = {"median_pbr": 1.0, "median_per": 15.0}
+        from_dicts = compute_fscore(current, previous, medians, 10, 20)
+        from_dataclass = compute_fscore(
+            Fundamentals.from_dict(current), Fundamentals.from_dict(previous), medians, 10, 20
+        )
+        assert from_dataclass == from_dicts
+
+
+class TestFundamentals:
+    """Test Fundamentals constructors."""
+
+    def test_from_record_treats_zero_as_missing(self):
+        class Row:
+            bps, per, pbr, eps, div, dps, roe = 50000, 0, None, -120, 1, 500, 3
+
+        fund = Fundamentals.from_record(Row())
+        assert fund == Fundamentals(50000.0, None, None, -120.0, 1.0, 500.0, 3.0)
+        assert isinstance(fund.bps, float)
+
+    def test_from_dict_missing_keys(self):
+        assert Fundamentals.from_dict({"roe": 7.5}) == Fundamentals(roe=7.5)
+
+
+class TestMedianLabels:
+    """Test precomputed sector median labels."""
+
+    def test_labels_match_inline_formatting(self):
+        current = {"pbr": 0.8, "per": 9.0}
+        medians = {"median_pbr": 1.234, "median_per": 12.0}
+        plain = compute_fscore(current, None, dict(medians))
+        labeled = compute_fscore(current, None, with_median_labels(dict(medians)))
+        assert plain == labeled
+        assert any(c["label"] == "PBR < 섹터 중앙값 (1.23)" for c in labeled["criteria"])
+
+
+class TestFormatFScoreCriteria:
+    """Test format_fscore_criteria output rounding."""
+
+    def test_rounds_yoy_changes_only(self):
+        result = compute_fscore(
+            {"eps": 100.126, "roe": 10.123456, "bps": 5000.0, "div": 1.23456},
+            {"eps": 100.0, "roe": 10.0, "bps": 4999.994},
+        )
+        values = {c["name"]: c["value"] for c in result["criteria"]}
+        assert values["roe_increasing"] == pytest.approx(0.123456)
+
+        formatted = {c["name"]: c["value"] for c in format_fscore_criteria(result["criteria"])}
+        assert formatted["roe_increasing"] == 0.1235
+        assert formatted["eps_increasing"] == 0.13
+        assert formatted["bps_increasing"] == 0.01
+        assert formatted["positive_dividend"] == 1.23456
+        assert formatted["volume_increasing"] is None
+
+
+class TestComputeFScoreBatch:
+    """Test compute_fscore_batch against compute_fscore."""
+
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(7)
+        n = 200
+
+        def column():
+            values = rng.choice([-2.0, 0.0, 0.5, 1.0, 8.0, 15.0], n)
+            values[rng.random(n) < 0.2] = np.nan
+            return values
+
+        current = {k: column() for k in ("eps", "roe", "bps", "pbr", "per", "div")}
+        previous = {k: column() for k in ("eps", "roe", "bps")}
+        median_pbr, median_per, vol_cur, vol_prev = column(), column(), column(), column()
+
+        totals, completeness = compute_fscore_batch(
+            current, previous, median_pbr, median_per, vol_cur, vol_prev
+        )
+
+        def scalar(a, i):
+            return None if np.isnan(a[i]) else float(a[i])
+
+        for i in range(n):
+            medians = {"median_pbr": scalar(median_pbr, i), "median_per": scalar(median_per, i)}
+            expected = compute_fscore(
+                {k: scalar(v, i) for k, v in current.items()},
+                {k: scalar(v, i) for k, v in previous.items()},
+                medians,
+                scalar(vol_cur, i),
+                scalar(vol_prev, i),
+            )
+            assert totals[i] == expected["total_score"]
+            assert completeness[i] == expected["data_completeness"]
+
 
 class TestComputeInvestmentGrade:
     """Test compute_investment_grade function."""
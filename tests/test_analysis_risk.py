@@ -0,0 +1,156 @@
+"""Unit tests for risk analysis module.
+
+Tests for compute_volatility, compute_beta and compute_max_drawdown.
+"""
+
+import numpy as np
+import pytest
+
+from whaleback.analysis.risk import (
+    compute_beta,
+    compute_max_drawdown,
+    compute_max_drawdown_batch,
+    compute_volatility,
+    compute_volatility_batch,
+)
+
+
+class TestComputeVolatility:
+    """Test compute_volatility function."""
+
+    def test_matches_reference_std(self):
+        """Annualized 20d volatility equals sample std of daily returns * sqrt(252)."""
+        rng = np.random.default_rng(0)
+        prices = list(10000 * np.cumprod(1 + rng.normal(0, 0.02, 100)))
+        result = compute_volatility(prices)
+
+        returns = np.diff(prices) / np.array(prices[:-1])
+        expected = np.std(returns[-20:], ddof=1) * np.sqrt(252) * 100
+        assert result["volatility_20d"] == pytest.approx(expected, abs=1e-4)
+        assert result["volatility_60d"] is not None
+        assert result["volatility_1y"] is None  # fewer than 252 returns
+
+    def test_skips_returns_after_zero_price(self):
+        """A zero price contributes no return for the following day."""
+        prices = [100.0, 0.0, 100.0, 110.0]
+        result = compute_volatility(prices, periods=(2,))
+        # Returns kept: 100->0 (-1.0) and 100->110 (+0.1)
+        expected = np.std([-1.0, 0.1], ddof=1) * np.sqrt(252) * 100
+        assert result["volatility_2d"] == pytest.approx(expected, abs=1e-4)
+
+    def test_insufficient_data(self):
+        result = compute_volatility([100.0])
+        assert result["volatility_20d"] is None
+        assert result["risk_level"] == "unknown"
+
+    def test_low_volatility_classification(self):
+        prices = [100.0 + 0.01 * (i % 2) for i in range(80)]
+        result = compute_volatility(prices)
+        assert result["risk_level"] == "low"
+
+
+class TestComputeVolatilityBatch:
+    """Test compute_volatility_batch against compute_volatility."""
+
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(4)
+        scales = rng.choice([0.005, 0.015, 0.03, 0.05], size=(30, 1))
+        prices = 5000 * np.cumprod(1 + rng.normal(0, 1, (30, 100)) * scales, axis=1)
+        batch = compute_volatility_batch(prices)
+
+        for i, row in enumerate(prices):
+            expected = compute_volatility(list(row))
+            assert batch["volatility_20d"][i] == pytest.approx(expected["volatility_20d"])
+            assert batch["volatility_60d"][i] == pytest.approx(expected["volatility_60d"])
+            assert np.isnan(batch["volatility_1y"][i])
+            assert batch["risk_level"][i] == expected["risk_level"]
+            assert batch["risk_label"][i] == expected["risk_label"]
+
+    def test_non_positive_price_in_window_is_nan(self):
+        prices = np.tile(np.linspace(100, 130, 70), (2, 1))
+        prices[1, -10] = 0.0
+        batch = compute_volatility_batch(prices)
+        assert not np.isnan(batch["volatility_60d"][0])
+        assert np.isnan(batch["volatility_60d"][1])
+        assert batch["risk_level"][1] == "unknown"
+
+
+class TestComputeMaxDrawdown:
+    """Test compute_max_drawdown function."""
+
+    def test_peak_to_trough(self):
+        prices = [100.0, 120.0, 90.0, 110.0, 60.0, 80.0]
+        result = compute_max_drawdown(prices, periods=(6, 3))
+        assert result["mdd_6d"] == pytest.approx(-0.5)  # 120 -> 60
+        assert result["mdd_3d"] == pytest.approx(-50 / 110, abs=1e-4)
+        assert result["current_drawdown"] == pytest.approx(-1 / 3, abs=1e-4)
+        assert result["recovery_label"] == "하락 지속"
+
+    def test_ath_window_limits_reference_high(self):
+        prices = [200.0, 100.0, 120.0, 110.0]
+        assert compute_max_drawdown(prices)["current_drawdown"] == -0.45
+        windowed = compute_max_drawdown(prices, ath_window=3)
+        assert windowed["current_drawdown"] == pytest.approx(-10 / 120, abs=1e-4)
+
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(2)
+        prices = 1000 * np.cumprod(1 + rng.normal(0, 0.03, (20, 60)), axis=1)
+        prices[3] = 0.0  # no positive peak
+        mdd = compute_max_drawdown_batch(prices)
+
+        for i, row in enumerate(prices):
+            expected = compute_max_drawdown(list(row), periods=(60,))["mdd_60d"]
+            if expected is None:
+                assert np.isnan(mdd[i])
+            else:
+                assert mdd[i] == expected
+
+    def test_recovery_label_boundaries(self):
+        """A drawdown exactly on a band edge falls in the worse band."""
+        assert compute_max_drawdown([100.0, 96.0])["recovery_label"] == "회복"
+        assert compute_max_drawdown([100.0, 95.0])["recovery_label"] == "조정 중"
+        assert compute_max_drawdown([100.0, 85.0])["recovery_label"] == "하락 지속"
+
+    def test_monotonic_rise_has_no_drawdown(self):
+        prices = [float(p) for p in range(100, 170)]
+        result = compute_max_drawdown(prices)
+        assert result["mdd_60d"] == 0.0
+        assert result["mdd_1y"] is None
+        assert result["recovery_label"] == "회복"
+
+
+class TestComputeBeta:
+    """Test compute_beta function."""
+
+    def test_matches_covariance_definition(self):
+        rng = np.random.default_rng(1)
+        index = 2500 * np.cumprod(1 + rng.normal(0, 0.01, 80))
+        stock = 50000 * np.cumprod(1 + 1.3 * np.diff(index, prepend=index[0]) / index)
+        result = compute_beta(list(stock), list(index))
+
+        s_ret = np.diff(stock) / stock[:-1]
+        m_ret = np.diff(index) / index[:-1]
+        expected = np.cov(s_ret[-60:], m_ret[-60:])[0, 1] / np.var(m_ret[-60:], ddof=1)
+        assert result["beta_60d"] == pytest.approx(expected, abs=1e-4)
+        assert result["beta_252d"] is None
+        assert result["interpretation"] == "aggressive"
+
+    def test_flat_market_has_no_beta(self):
+        result = compute_beta([100.0 + i for i in range(70)], [1000.0] * 70)
+        assert result["beta_60d"] is None
+        assert result["interpretation"] == "unknown"
+
+    def test_mismatched_lengths_are_trimmed(self):
+        stock = [100.0 * (1.02 ** i) * (1 + 0.01 * (i % 3)) for i in range(75)]
+        index = [1000.0 * (1 + 0.01 * (i % 3)) for i in range(70)]
+        result = compute_beta(stock, index)
+        assert result["beta_60d"] is not None
+
+    def test_interpretation_bands(self):
+        rng = np.random.default_rng(6)
+        index = 2500 * np.cumprod(1 + rng.normal(0, 0.01, 70))
+        m_ret = np.diff(index) / index[:-1]
+        expected = {0.5: "defensive", 1.0: "neutral", 1.3: "aggressive", 2.0: "highly_aggressive"}
+        for scale, interpretation in expected.items():
+            stock = 100 * np.cumprod(np.concatenate([[1.0], 1 + scale * m_ret]))
+            assert compute_beta(list(stock), list(index))["interpretation"] == interpretation
@@ -0,0 +1,90 @@
+"""Unit tests for sector flow analysis module."""
+
+from datetime import date, timedelta
+
+import numpy as np
+
+from whaleback.analysis.sector_flow import (
+    _FLOW_SIGNALS,
+    WHALE_TYPES,
+    _summarize_flows,
+    compute_sector_flows,
+)
+
+
+def _rows(values: list[int | None], start: date = date(2024, 1, 2)) -> list[dict]:
+    """Investor rows with every whale type set to the same daily value."""
+    return [
+        {"trade_date": start + timedelta(days=i), **{wt: v for wt in WHALE_TYPES}}
+        for i, v in enumerate(values)
+    ]
+
+
+def _by_type(results: list[dict], sector: str) -> dict[str, dict]:
+    return {r["investor_type"]: r for r in results if r["sector"] == sector}
+
+
+class TestComputeSectorFlows:
+    """Test compute_sector_flows function."""
+
+    def test_aggregates_tickers_by_date(self):
+        sector_map = {"A": "반도체", "B": "반도체"}
+        investor_data = {"A": _rows([10, 20, -5]), "B": _rows([1, 2, 3])}
+        results = compute_sector_flows(sector_map, investor_data, {"A": 100, "B": 100})
+
+        flow = _by_type(results, "반도체")["foreign_net"]
+        assert flow["net_purchase"] == 31
+        assert flow["consistency"] == 0.67  # daily sector totals 11, 22, -2
+        assert flow["stock_count"] == 2
+
+    def test_lookback_and_unsorted_rows(self):
+        rows = _rows([100, 1, 2, 3])
+        investor_data = {"A": list(reversed(rows))}
+        results = compute_sector_flows({"A": "은행"}, investor_data, {"A": 0}, lookback_days=3)
+
+        flow = _by_type(results, "은행")["institution_net"]
+        assert flow["net_purchase"] == 6  # oldest day dropped
+        assert flow["trend_5d"] == 6  # fewer than 5 days: full period
+
+    def test_missing_values_are_skipped(self):
+        investor_data = {"A": _rows([None, None]), "B": _rows([4, None])}
+        results = compute_sector_flows({"A": "화학", "B": "화학"}, investor_data, {})
+
+        flow = _by_type(results, "화학")["pension_net"]
+        assert flow["net_purchase"] == 4
+        assert flow["consistency"] == 1.0  # only one day has any value
+
+    def test_no_values_gives_empty_flow(self):
+        results = compute_sector_flows({"A": "조선"}, {"A": _rows([None])}, {"A": 10})
+        flow = _by_type(results, "조선")["other_corp_net"]
+        assert flow["net_purchase"] == 0
+        assert flow["signal"] == "neutral"
+
+    def test_string_and_date_keys_align(self):
+        rows_a = [{"trade_date": "2024-01-03", **{wt: 5 for wt in WHALE_TYPES}}]
+        rows_b = [{"trade_date": date(2024, 1, 3), **{wt: -2 for wt in WHALE_TYPES}}]
+        results = compute_sector_flows({"A": "증권", "B": "증권"}, {"A": rows_a, "B": rows_b}, {})
+
+        flow = _by_type(results, "증권")["foreign_net"]
+        assert flow["net_purchase"] == 3
+        assert flow["consistency"] == 1.0  # both tickers land on the same day
+
+
+class TestSummarizeFlows:
+    """Test the fused per-sector flow summary."""
+
+    def test_columns_summarized_independently(self):
+        totals = np.array(
+            [[5, -3], [0, -4], [7, 2], [1, -1], [2, -6], [3, -2], [4, 0]], dtype=np.int64
+        )
+        present = np.ones_like(totals, dtype=bool)
+        present[6, 0] = False  # trend_5d skips the missing latest day
+        net, days, consistency, intensity, trend_5d, code = _summarize_flows(
+            totals, present, 10.0
+        )
+
+        assert list(net) == [18, -14]
+        assert list(days) == [6, 7]
+        assert list(trend_5d) == [13, -7]
+        assert intensity[0] == 0.3
+        assert [_FLOW_SIGNALS[c] for c in code] == ["strong_accumulation", "distribution"]
@@ -0,0 +1,73 @@
+"""Unit tests for market summary prompt building."""
+
+import logging
+
+from whaleback.analysis.market_summary import (
+    _PROMPT_SHRINK_ORDER,
+    MarketSummaryInput,
+    _build_user_prompt,
+    _estimate_tokens,
+)
+
+_HEADERS = {
+    "sector_flows": "## [섹터별 수급 현황]",
+    "news_data": "## [뉴스 감성 분석 데이터]",
+    "composite_bottom": "## [종합점수 하위 종목]",
+    "flow_data": "## [수급 상세 데이터 (투자자별)]",
+}
+
+
+def _input() -> MarketSummaryInput:
+    """Input where every droppable section is populated."""
+    return MarketSummaryInput(
+        trade_date="2024-01-02",
+        sector_flows=[{"sector_name": f"섹터{i}", "investor_type": "외국인"} for i in range(20)],
+        whale_top=[],
+        trend_data=[],
+        news_data={"summary": "뉴스 " * 200},
+        composite_top=[],
+        composite_bottom=[{"name": f"종목{i}", "ticker": f"{i:06d}"} for i in range(20)],
+        market_stats={},
+        flow_data=[{"name": f"종목{i}", "ticker": f"{i:06d}"} for i in range(20)],
+    )
+
+
+def _dropped_sections(caplog) -> list[str]:
+    return [
+        r.args[-1] for r in caplog.records if r.getMessage().startswith("Market report prompt over")
+    ]
+
+
+class TestBuildUserPromptBudget:
+    """Test section dropping in _build_user_prompt."""
+
+    def test_within_budget_keeps_every_section(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            prompt = _build_user_prompt(_input())
+        assert all(header in prompt for header in _HEADERS.values())
+        assert not caplog.records
+
+    def test_drops_sections_in_shrink_order(self, caplog):
+        data = _input()
+        full = _build_user_prompt(data)
+        without_first = _build_user_prompt(data, max_tokens=_estimate_tokens(full) - 1)
+        budget = _estimate_tokens(without_first) - 1
+        caplog.clear()
+
+        with caplog.at_level(logging.WARNING):
+            prompt = _build_user_prompt(data, max_tokens=budget)
+
+        assert _dropped_sections(caplog) == list(_PROMPT_SHRINK_ORDER[:2])
+        for name in _PROMPT_SHRINK_ORDER[:2]:
+            assert _HEADERS[name] not in prompt
+        for name in _PROMPT_SHRINK_ORDER[2:]:
+            assert _HEADERS[name] in prompt
+        assert _estimate_tokens(prompt) <= budget
+
+    def test_warns_when_still_over_budget(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            prompt = _build_user_prompt(_input(), max_tokens=1)
+
+        assert _dropped_sections(caplog) == list(_PROMPT_SHRINK_ORDER)
+        assert not any(header in prompt for header in _HEADERS.values())
+        assert "still over budget" in caplog.records[-1].getMessage()
@@ -0,0 +1,760 @@
+"""Tests for whaleback.analysis.news_scorer pure helpers (no model/API required)."""
+
+import asyncio
+import importlib.util
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from whaleback.analysis import news_scorer
+from whaleback.analysis.news_scorer import (
+    _bert_scores_from_logits,
+    _classify,
+    _parse_llm_response,
+    score_article_keyword,
+)
+
+# ---------------------------------------------------------------------------
+# BERT logits post-processing
+# ---------------------------------------------------------------------------
+
+
+def test_logits_to_scores_label_and_confidence():
+    logits = np.log(np.array([[0.1, 0.2, 0.7], [0.6, 0.3, 0.1]], dtype=np.float32))
+    scores = _bert_scores_from_logits(logits, ["LABEL_0", "LABEL_1", "LABEL_2"])
+
+    assert scores.labels == ["positive", "negative"]
+    np.testing.assert_allclose(scores.confidence, [0.7, 0.6], atol=1e-3)
+    np.testing.assert_allclose(scores.raw, [0.6, -0.5], atol=1e-4)
+    result = scores.result(0)
+    assert result["scoring_method"] == "bert"
+    assert type(result["sentiment_raw"]) is float
+
+
+def test_logits_to_scores_text_labels_any_order():
+    logits = np.log(np.array([[0.7, 0.2, 0.1]], dtype=np.float32))
+    scores = _bert_scores_from_logits(logits, ["positive", "neutral", "negative"])
+
+    assert scores.labels == ["positive"]
+    assert scores.raw[0] == pytest.approx(0.6, abs=1e-4)
+
+
+def test_logits_to_scores_neutral():
+    logits = np.log(np.array([[0.2, 0.6, 0.2]], dtype=np.float32))
+    scores = _bert_scores_from_logits(logits, ["LABEL_0", "LABEL_1", "LABEL_2"])
+
+    assert scores.labels == ["neutral"]
+    assert scores.raw[0] == pytest.approx(0.0, abs=1e-4)
+
+
+def test_unscored_entries_have_nan_confidence():
+    scores = news_scorer._BertScores.empty(2)
+    scores.set(1, {"sentiment_raw": 0.5, "sentiment_label": "positive",
+                   "sentiment_confidence": 0.9})
+
+    assert np.isnan(scores.confidence[0])
+    assert scores.result(1)["sentiment_label"] == "positive"
+
+
+# ---------------------------------------------------------------------------
+# Label classification
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "label,expected",
+    [
+        ("LABEL_0", 0),
+        ("LABEL_1", 1),
+        ("LABEL_2", 2),
+        ("positive", 2),
+        ("Negative_news", 0),
+        ("POS", 2),
+        ("other", 1),
+    ],
+)
+def test_classify_labels(label, expected):
+    assert _classify(label) == expected
+
+
+# ---------------------------------------------------------------------------
+# score_articles: duplicate texts share one LLM request
+# ---------------------------------------------------------------------------
+
+
+def test_score_articles_dedupes_llm_requests(monkeypatch):
+    calls: list[tuple[str, str]] = []
+
+    async def fake_llm(text, api_key, ticker=""):
+        calls.append((text, ticker))
+        return {
+            "sentiment_raw": 0.8,
+            "sentiment_label": "positive",
+            "sentiment_confidence": 0.8,
+            "scoring_method": "llm",
+        }
+
+    monkeypatch.setattr(news_scorer, "_get_bert_onnx_session", lambda: None)
+    monkeypatch.setattr(news_scorer, "_get_bert_model", lambda **_: None)
+    monkeypatch.setattr(news_scorer, "score_article_llm", fake_llm)
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+    articles = [
+        {"title": "같은 기사", "description": "본문", "ticker": "005930"},
+        {"title": "같은 기사", "description": "본문", "ticker": "005930"},
+        {"title": "같은 기사", "description": "본문", "ticker": "000660"},
+        {"title": "다른 기사", "description": "", "ticker": "005930"},
+    ]
+    scored = asyncio.run(
+        news_scorer.score_articles(
+            articles, anthropic_api_key="key", llm_articles_per_request=1,
+        )
+    )
+
+    assert len(scored) == 4
+    assert len(calls) == 3
+    assert all(a["scoring_method"] == "llm" for a in scored)
+
+
+def test_score_articles_aggregate_stop_cancels_pending(monkeypatch):
+    calls: list[str] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_llm(text, api_key, ticker=""):
+        calls.append(text)
+        await real_sleep(0.01)
+        return {
+            "sentiment_raw": 0.9,
+            "sentiment_label": "positive",
+            "sentiment_confidence": 0.9,
+            "scoring_method": "llm",
+        }
+
+    monkeypatch.setattr(news_scorer, "_get_bert_onnx_session", lambda: None)
+    monkeypatch.setattr(news_scorer, "_get_bert_model", lambda **_: None)
+    monkeypatch.setattr(news_scorer, "score_article_llm", fake_llm)
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+    def enough_llm(scored):
+        return sum(a.get("scoring_method") == "llm" for a in scored) >= 1
+
+    articles = [{"title": f"기사 {i}", "description": "", "ticker": "005930"} for i in range(6)]
+    scored = asyncio.run(
+        news_scorer.score_articles(
+            articles, anthropic_api_key="key", llm_concurrency=1,
+            llm_articles_per_request=1, aggregate_stop=enough_llm,
+        )
+    )
+
+    assert len(scored) == 6
+    assert len(calls) < 6
+    assert all(a["scoring_method"] in ("llm", "fallback") for a in scored)
+
+
+def test_score_articles_aggregate_stop_keeps_finished_results(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_llm(text, api_key, ticker=""):
+        calls.append(text)
+        return {
+            "sentiment_raw": 0.9,
+            "sentiment_label": "positive",
+            "sentiment_confidence": 0.9,
+            "scoring_method": "llm",
+        }
+
+    monkeypatch.setattr(news_scorer, "_get_bert_onnx_session", lambda: None)
+    monkeypatch.setattr(news_scorer, "_get_bert_model", lambda **_: None)
+    monkeypatch.setattr(news_scorer, "score_article_llm", fake_llm)
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+    def enough_llm(scored):
+        return sum(a.get("scoring_method") == "llm" for a in scored) >= 1
+
+    articles = [{"title": f"기사 {i}", "description": "", "ticker": "005930"} for i in range(6)]
+    scored = asyncio.run(
+        news_scorer.score_articles(
+            articles, anthropic_api_key="key", llm_concurrency=6,
+            llm_articles_per_request=1, aggregate_stop=enough_llm,
+        )
+    )
+
+    # Every request finished before the stop, so none of their results are dropped
+    assert len(calls) == 6
+    assert all(a["scoring_method"] == "llm" for a in scored)
+
+
+def test_score_articles_bounds_client_warmup(monkeypatch):
+    warm_cancelled = []
+
+    async def hanging_warmup(api_key):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            warm_cancelled.append(True)
+            raise
+
+    async def fake_llm(text, api_key, ticker=""):
+        return {
+            "sentiment_raw": 0.0,
+            "sentiment_label": "neutral",
+            "sentiment_confidence": 0.9,
+            "scoring_method": "llm",
+        }
+
+    monkeypatch.setattr(news_scorer, "_get_bert_onnx_session", lambda: None)
+    monkeypatch.setattr(news_scorer, "_get_bert_model", lambda **_: None)
+    monkeypatch.setattr(news_scorer, "_warm_anthropic_client", hanging_warmup)
+    monkeypatch.setattr(news_scorer, "_WARMUP_TIMEOUT", 0.01)
+    monkeypatch.setattr(news_scorer, "score_article_llm", fake_llm)
+
+    articles = [{"title": "기사", "description": "", "ticker": "005930"}]
+    scored = asyncio.run(
+        asyncio.wait_for(
+            news_scorer.score_articles(articles, anthropic_api_key="key"),
+            timeout=5,
+        )
+    )
+
+    assert scored[0]["scoring_method"] == "llm"
+    assert warm_cancelled == [True]
+
+
+def test_score_articles_packs_articles_per_request(monkeypatch):
+    requests: list[str] = []
+
+    class FakeMessages:
+        async def create(self, **params):
+            requests.append(params["messages"][0]["content"])
+            text = '[{"id": 1, "sentiment": "positive", "score": 0.9}, ' \
+                   '{"id": 2, "sentiment": "negative", "score": 0.8}]'
+            return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    monkeypatch.setattr(news_scorer, "_get_bert_onnx_session", lambda: None)
+    monkeypatch.setattr(news_scorer, "_get_bert_model", lambda **_: None)
+    monkeypatch.setattr(
+        news_scorer, "_get_anthropic_client", lambda _key: SimpleNamespace(messages=FakeMessages()),
+    )
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+    articles = [
+        {"title": "기사 A", "description": "", "ticker": "005930"},
+        {"title": "기사 B", "description": "", "ticker": "000660"},
+        {"title": "기사 C", "description": "", "ticker": "035420"},
+    ]
+    scored = asyncio.run(
+        news_scorer.score_articles(articles, anthropic_api_key="key")
+    )
+
+    assert len(requests) == 1
+    assert [a["sentiment_label"] for a in scored] == ["positive", "negative", "neutral"]
+    # Article missing from the response falls back (no BERT here)
+    assert scored[2]["scoring_method"] == "fallback"
+
+
+def test_score_articles_reuses_cached_llm_results(monkeypatch, tmp_path):
+    calls: list[str] = []
+
+    async def fake_llm(text, api_key, ticker=""):
+        calls.append(text)
+        return {
+            "sentiment_raw": -0.7,
+            "sentiment_label": "negative",
+            "sentiment_confidence": 0.7,
+            "scoring_method": "llm",
+        }
+
+    monkeypatch.setattr(news_scorer, "_get_bert_onnx_session", lambda: None)
+    monkeypatch.setattr(news_scorer, "_get_bert_model", lambda **_: None)
+    monkeypatch.setattr(news_scorer, "score_article_llm", fake_llm)
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+    def run():
+        articles = [{"title": "실적 악화", "description": "", "ticker": "005930"}]
+        return asyncio.run(
+            news_scorer.score_articles(
+                articles, anthropic_api_key="key", cache_path=tmp_path / "cache.sqlite3",
+            )
+        )
+
+    first = run()
+    second = run()
+
+    assert len(calls) == 1
+    assert first[0]["sentiment_label"] == second[0]["sentiment_label"] == "negative"
+
+
+async def _no_sleep(_seconds):
+    return None
+
+
+def _fake_torch(monkeypatch, cuda: bool):
+    torch = SimpleNamespace(
+        cuda=SimpleNamespace(is_available=lambda: cuda),
+        compile=lambda fn, **_: SimpleNamespace(compiled=fn),
+    )
+    monkeypatch.setitem(sys.modules, "torch", torch)
+
+
+def test_compile_bert_model_restores_eager_forward_on_warmup_failure(monkeypatch):
+    _fake_torch(monkeypatch, cuda=True)
+
+    def failing_warmup(texts, tokenizer, model):
+        raise RuntimeError("inductor failed")
+
+    monkeypatch.setattr(news_scorer, "_bert_logits_torch", failing_warmup)
+    eager = object()
+    model = SimpleNamespace(forward=eager)
+    news_scorer._compile_bert_model(model, tokenizer=None)
+
+    assert model.forward is eager
+
+
+def test_compile_bert_model_keeps_compiled_forward(monkeypatch):
+    _fake_torch(monkeypatch, cuda=True)
+    warmups: list[list[str]] = []
+    monkeypatch.setattr(
+        news_scorer, "_bert_logits_torch", lambda texts, tokenizer, model: warmups.append(texts),
+    )
+    eager = object()
+    model = SimpleNamespace(forward=eager)
+    news_scorer._compile_bert_model(model, tokenizer=None)
+
+    assert model.forward.compiled is eager
+    assert len(warmups) == 1
+
+
+def test_compile_bert_model_skipped_without_cuda(monkeypatch):
+    _fake_torch(monkeypatch, cuda=False)
+    eager = object()
+    model = SimpleNamespace(forward=eager)
+    news_scorer._compile_bert_model(model, tokenizer=None)
+
+    assert model.forward is eager
+
+
+def _stub_onnxruntime(monkeypatch, tmp_path, available, started, exported=True):
+    """Install stub onnxruntime/transformers modules; returns created sessions.
+
+    ``started`` is the provider list the stub session reports after creation.
+    """
+    sessions: list[SimpleNamespace] = []
+
+    def inference_session(path, providers):
+        session = SimpleNamespace(path=path, providers=providers, get_providers=lambda: started)
+        sessions.append(session)
+        return session
+
+    config = SimpleNamespace(id2label={0: "negative", 1: "neutral", 2: "positive"}, num_labels=3)
+    modules = {
+        "onnxruntime": SimpleNamespace(
+            get_available_providers=lambda: available, InferenceSession=inference_session,
+        ),
+        "transformers": SimpleNamespace(
+            AutoConfig=SimpleNamespace(from_pretrained=lambda name: config),
+            AutoTokenizer=SimpleNamespace(from_pretrained=lambda name: "tokenizer"),
+        ),
+    }
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+
+    if exported:
+        (tmp_path / "model.onnx").touch()
+        (tmp_path / "model_quantized.onnx").touch()
+    monkeypatch.setattr(news_scorer, "BERT_ONNX_DIR", tmp_path)
+    monkeypatch.setattr(news_scorer, "_bert_onnx", None)
+    return sessions
+
+
+@pytest.mark.parametrize(
+    "available, started, model_file, backend",
+    [
+        (
+            ["TensorrtExecutionProvider", "CUDAExecutionProvider", "CPUExecutionProvider"],
+            ["TensorrtExecutionProvider", "CUDAExecutionProvider", "CPUExecutionProvider"],
+            "model.onnx", "onnx-trt-fp16",
+        ),
+        (
+            ["CUDAExecutionProvider", "CPUExecutionProvider"],
+            ["CUDAExecutionProvider", "CPUExecutionProvider"],
+            "model.onnx", "onnx-cuda-fp32",
+        ),
+        (["CPUExecutionProvider"], ["CPUExecutionProvider"], "model_quantized.onnx", "onnx-int8"),
+        # GPU provider failed to start: ORT runs the FP32 graph on CPU
+        (
+            ["TensorrtExecutionProvider", "CUDAExecutionProvider", "CPUExecutionProvider"],
+            ["CPUExecutionProvider"],
+            "model.onnx", "onnx-cpu-fp32",
+        ),
+    ],
+)
+def test_onnx_session_backend_follows_started_provider(
+    monkeypatch, tmp_path, available, started, model_file, backend,
+):
+    sessions = _stub_onnxruntime(monkeypatch, tmp_path, available, started)
+    onnx = news_scorer._get_bert_onnx_session()
+
+    assert sessions[0].path == str(tmp_path / model_file)
+    assert onnx.backend == backend
+    assert onnx.on_gpu == (started[0] != "CPUExecutionProvider")
+    assert news_scorer._bert_backend_tag() == backend
+
+
+def test_onnx_session_requires_existing_export(monkeypatch, tmp_path):
+    sessions = _stub_onnxruntime(
+        monkeypatch, tmp_path, ["CPUExecutionProvider"], ["CPUExecutionProvider"], exported=False,
+    )
+
+    assert news_scorer._get_bert_onnx_session() is None
+    assert sessions == []
+    assert not list(tmp_path.iterdir())
+
+
+def test_score_article_bert_uses_batch_path(monkeypatch):
+    batches: list[list[str]] = []
+
+    def fake_bert(texts, compile_model=False):
+        batches.append(texts)
+        scores = news_scorer._BertScores.empty(len(texts))
+        scores.set(0, {
+            "sentiment_raw": 0.6, "sentiment_label": "positive", "sentiment_confidence": 0.8,
+        })
+        return scores
+
+    monkeypatch.setattr(news_scorer, "_bert_score_texts", fake_bert)
+    result = news_scorer.score_article_bert("호재 기사" * 200)
+
+    assert len(batches[0][0]) == 512
+    assert result == {
+        "sentiment_raw": 0.6,
+        "sentiment_label": "positive",
+        "sentiment_confidence": 0.8,
+        "scoring_method": "bert",
+    }
+
+
+def test_trt_profile_covers_bert_batches():
+    trt_name, options = news_scorer._onnx_providers(["TensorrtExecutionProvider"])[0]
+    batch = news_scorer._BERT_BATCH_SIZE
+    length = news_scorer._BERT_LENGTH_BUCKETS[-1]
+
+    assert trt_name == "TensorrtExecutionProvider"
+    assert options["trt_profile_max_shapes"] == (
+        f"input_ids:{batch}x{length},attention_mask:{batch}x{length}"
+    )
+
+
+def test_bert_backend_tag_predicts_without_loading(monkeypatch, tmp_path):
+    sessions = _stub_onnxruntime(
+        monkeypatch, tmp_path, ["CUDAExecutionProvider", "CPUExecutionProvider"], [],
+    )
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+
+    assert news_scorer._bert_backend_tag() == "onnx-cuda-fp32"
+    assert sessions == []
+
+
+# ---------------------------------------------------------------------------
+# Keyword pre-filter
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("삼성전자 3분기 어닝서프라이즈, 흑자 전환", "positive"),
+        ("코스닥 상장사 대표 횡령 혐의로 거래정지", "negative"),
+        ("SK하이닉스 4분기 실적발표 예정", "neutral"),
+    ],
+)
+def test_keyword_single_polarity(text, expected):
+    result = score_article_keyword(text, polar=True)
+    assert result is not None
+    assert result["sentiment_label"] == expected
+    assert result["scoring_method"] == "keyword"
+
+
+def test_keyword_mixed_or_no_hits_defers_to_model():
+    assert score_article_keyword("상한가 이후 하한가로 급반전", polar=True) is None
+    assert score_article_keyword("반도체 업황 점검", polar=True) is None
+
+
+def test_keyword_polar_terms_off_by_default():
+    assert score_article_keyword("삼성전자 3분기 어닝서프라이즈, 흑자 전환") is None
+    assert score_article_keyword("SK하이닉스 4분기 실적발표 예정")["sentiment_label"] == "neutral"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "A사 흑자 전환 실패, 적자 지속",
+        "B사 수주 계약 해지 공시",
+        "서울 부도심 개발 호재로 주가 급등",
+        "C사 상한가 기록 후 급락",
+        "D사 공모 일정 철회",
+    ],
+)
+def test_keyword_guards_defer_to_model(text):
+    assert score_article_keyword(text, polar=True) is None
+
+
+def test_score_articles_keyword_skips_bert(monkeypatch):
+    def fail(**_):
+        raise AssertionError("BERT should not load")
+
+    monkeypatch.setattr(news_scorer, "_get_bert_onnx_session", fail)
+    monkeypatch.setattr(news_scorer, "_get_bert_model", fail)
+
+    articles = [{"title": "사상 최대 실적 달성", "description": "", "ticker": "005930"}]
+    scored = asyncio.run(
+        news_scorer.score_articles(articles, keyword_polar=True)
+    )
+
+    assert scored[0]["scoring_method"] == "keyword"
+    assert scored[0]["sentiment_raw"] > 0
+
+
+# ---------------------------------------------------------------------------
+# On-disk sentiment cache
+# ---------------------------------------------------------------------------
+
+
+def test_sentiment_cache_roundtrip_and_expiry(tmp_path):
+    cache = news_scorer._SentimentCache(tmp_path / "cache.sqlite3")
+    key = news_scorer._SentimentCache.key("bert", "기사")
+    cache.set_many({key: {"sentiment_raw": 0.5, "sentiment_label": "positive"}})
+
+    assert cache.get_many([key, "bert:missing"]) == {
+        key: {"sentiment_raw": 0.5, "sentiment_label": "positive"}
+    }
+
+    expired = news_scorer._SentimentCache(tmp_path / "expired.sqlite3", ttl=-1)
+    expired.set_many({key: {"sentiment_raw": 0.5}})
+    assert expired.get_many([key]) == {}
+
+
+def test_sentiment_cache_purges_expired_rows_on_open(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    news_scorer._SentimentCache(path, ttl=-1).set_many({"bert:old": {"sentiment_raw": 0.5}})
+    news_scorer._SentimentCache(path).set_many({"bert:new": {"sentiment_raw": 0.5}})
+
+    reopened = news_scorer._SentimentCache(path)
+    assert reopened._conn.execute("SELECT key FROM sentiment").fetchall() == [("bert:new",)]
+
+
+def _fake_bert_scores(calls: list[list[str]]):
+    def fake_bert(texts, compile_model=False):
+        calls.append(texts)
+        scores = news_scorer._BertScores.empty(len(texts))
+        for i in range(len(texts)):
+            scores.set(i, {
+                "sentiment_raw": 0.0, "sentiment_label": "neutral", "sentiment_confidence": 0.9,
+            })
+        return scores
+
+    return fake_bert
+
+
+def test_score_articles_cache_off_by_default(tmp_path, monkeypatch):
+    calls: list[list[str]] = []
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(news_scorer, "_bert_score_texts", _fake_bert_scores(calls))
+
+    for _ in range(2):
+        asyncio.run(news_scorer.score_articles([{"title": "기사", "ticker": "005930"}]))
+
+    assert len(calls) == 2
+    assert not list(tmp_path.iterdir())
+
+
+def test_bert_cache_key_includes_backend(tmp_path, monkeypatch):
+    scored_batches: list[list[str]] = []
+    backend = "onnx-int8"
+    monkeypatch.setattr(news_scorer, "_bert_backend_tag", lambda: backend)
+    monkeypatch.setattr(news_scorer, "_bert_score_texts", _fake_bert_scores(scored_batches))
+
+    def run():
+        articles = [{"title": "기사", "description": "", "ticker": "005930"}]
+        return asyncio.run(
+            news_scorer.score_articles(articles, cache_path=tmp_path / "cache.sqlite3")
+        )
+
+    run()
+    run()
+    assert len(scored_batches) == 1
+
+    backend = "torch-fp32"
+    scored = run()
+    assert len(scored_batches) == 2
+    assert scored[0]["scoring_method"] == "bert"
+
+
+def test_fully_cached_run_does_not_load_bert(tmp_path, monkeypatch):
+    def no_load(**_):
+        raise AssertionError("model loaded")
+
+    scored_batches: list[list[str]] = []
+    monkeypatch.setattr(news_scorer, "_bert_score_texts", _fake_bert_scores(scored_batches))
+    monkeypatch.setattr(news_scorer, "_get_bert_onnx_session", no_load)
+    monkeypatch.setattr(news_scorer, "_get_bert_model", no_load)
+
+    for _ in range(2):
+        scored = asyncio.run(
+            news_scorer.score_articles(
+                [{"title": "기사", "ticker": "005930"}], cache_path=tmp_path / "cache.sqlite3",
+            )
+        )
+
+    assert len(scored_batches) == 1
+    assert scored[0]["scoring_method"] == "bert"
+
+
+def test_llm_cache_key_depends_on_request_mode(tmp_path, monkeypatch):
+    calls: list[str] = []
+
+    async def fake_llm(text, api_key, ticker=""):
+        calls.append(text)
+        return {
+            "sentiment_raw": 0.0,
+            "sentiment_label": "neutral",
+            "sentiment_confidence": 0.9,
+            "scoring_method": "llm",
+        }
+
+    monkeypatch.setattr(news_scorer, "_get_bert_onnx_session", lambda: None)
+    monkeypatch.setattr(news_scorer, "_get_bert_model", lambda **_: None)
+    monkeypatch.setattr(news_scorer, "score_article_llm", fake_llm)
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+    def run(per_request):
+        articles = [{"title": "기사", "description": "", "ticker": "005930"}]
+        asyncio.run(
+            news_scorer.score_articles(
+                articles, anthropic_api_key="key", cache_path=tmp_path / "cache.sqlite3",
+                llm_articles_per_request=per_request,
+            )
+        )
+
+    run(1)
+    run(1)
+    assert len(calls) == 1
+    run(10)  # multi-article prompt: single-prompt scores are not reused
+    assert len(calls) == 2
+
+
+# ---------------------------------------------------------------------------
+# LLM response parsing
+# ---------------------------------------------------------------------------
+
+
+def test_parse_llm_response_prefixed():
+    result = _parse_llm_response("sentiment: Positive\nscore: 0.9")
+    assert result["sentiment_label"] == "positive"
+    assert result["sentiment_confidence"] == pytest.approx(0.9)
+    assert result["sentiment_raw"] == pytest.approx(0.9)
+    assert result["scoring_method"] == "llm"
+
+
+def test_parse_llm_response_bare_tokens():
+    result = _parse_llm_response("negative\n0.8")
+    assert result["sentiment_label"] == "negative"
+    assert result["sentiment_raw"] == pytest.approx(-0.8)
+
+
+def test_parse_llm_response_ignores_numbered_lines():
+    result = _parse_llm_response("1. 실적 개선 기대\nsentiment: positive")
+    assert result["sentiment_label"] == "positive"
+    assert result["sentiment_confidence"] == pytest.approx(0.5)
+
+
+class _FakeStream:
+    def __init__(self, chunks, consumed):
+        self._chunks = chunks
+        self._consumed = consumed
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    async def text_stream(self):
+        for chunk in self._chunks:
+            self._consumed.append(chunk)
+            yield chunk
+
+
+@pytest.mark.parametrize(
+    "chunks, consumed_count",
+    [
+        # Trailing output after a complete score value is not read
+        (["sentiment: positive\n", "score: 0.8", "5 ", "(근거: 실적)", "추가 설명"], 3),
+        # A score on the last line ends with the stream itself
+        (["sentiment: positive\n", "score: 0.8", "5"], 3),
+    ],
+)
+def test_score_article_llm_stops_after_score(monkeypatch, chunks, consumed_count):
+    consumed: list[str] = []
+    messages = SimpleNamespace(stream=lambda **params: _FakeStream(chunks, consumed))
+    monkeypatch.setattr(
+        news_scorer, "_get_anthropic_client", lambda _key: SimpleNamespace(messages=messages),
+    )
+
+    result = asyncio.run(news_scorer.score_article_llm("기사", "key", "005930"))
+
+    assert len(consumed) == consumed_count
+    assert result["sentiment_confidence"] == pytest.approx(0.85)
+
+
+def test_parse_llm_response_garbage_defaults_neutral():
+    result = _parse_llm_response("모르겠습니다")
+    assert result["sentiment_label"] == "neutral"
+    assert result["sentiment_confidence"] == pytest.approx(0.5)
+    assert result["sentiment_raw"] == 0.0
+
+
+def test_parse_llm_multi_response():
+    text = 'ok [{"id": 2, "sentiment": "Negative", "score": 0.8},\n' \
+           '{"id": 1, "sentiment": "neutral", "score": 1.4}, {"id": 9, "sentiment": "positive"}]'
+    results = news_scorer._parse_llm_multi_response(text, 2)
+
+    assert set(results) == {0, 1}
+    assert results[0]["sentiment_confidence"] == 1.0
+    assert results[1]["sentiment_label"] == "negative"
+    assert results[1]["sentiment_raw"] == pytest.approx(-0.8)
+
+
+def test_parse_llm_multi_response_malformed():
+    assert news_scorer._parse_llm_multi_response("[{broken", 3) == {}
+    assert news_scorer._parse_llm_multi_response('[{"id": 1}, 5]', 1) == {}
+
+
+def test_parse_llm_multi_response_ignores_trailing_brackets():
+    text = '[{"id": 1, "sentiment": "positive", "score": 0.9}]\n(참고: [기사1]은 호재)'
+    results = news_scorer._parse_llm_multi_response(text, 1)
+
+    assert results[0]["sentiment_label"] == "positive"
+
+
+def test_score_articles_llm_warns_on_truncation(monkeypatch, caplog):
+    class FakeMessages:
+        async def create(self, **params):
+            text = '[{"id": 1, "sentiment": "positive", "score": 0.9}, {"id": 2, "sent'
+            return SimpleNamespace(content=[SimpleNamespace(text=text)], stop_reason="max_tokens")
+
+    monkeypatch.setattr(
+        news_scorer, "_get_anthropic_client", lambda _key: SimpleNamespace(messages=FakeMessages()),
+    )
+    items = [("기사 A", "005930"), ("기사 B", "000660")]
+    results = asyncio.run(news_scorer.score_articles_llm(items, "key"))
+
+    assert results == {}
+    assert "hit max_tokens" in caplog.text
+
+
+def test_parse_llm_response_clamps_confidence():
+    result = _parse_llm_response("sentiment: positive\nscore: 1.7")
+    assert result["sentiment_confidence"] == 1.0
@@ -3,11 +3,16 @@
 import math
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
 from whaleback.analysis.sentiment import (
     SentimentAdjustments,
     SentimentScore,
+    _compute_ensemble_weights,
+    _exact_ensemble_weights,
+    _score_components,
+    _weighted_mean,
     classify_sentiment_signal,
     compute_sentiment_adjustments,
     compute_sentiment_score,
@@ -107,6 +112,36 @@ def test_mixed_articles_neutral_direction():
     assert score.signal == "neutral"
 
 
+def test_direction_uses_decayed_source_and_type_weights():
+    # Weights: 1.5 × max(2.0, 1.0) = 3.0 now; 0.7 × max(1.0, 2.5) × 0.5 = 0.875 one
+    # half-life ago; unknown source/type fall back to 1.0 × 1.0
+    articles = [
+        make_article(0.9, source_type="financial", article_type="disclosure"),
+        make_article(-0.6, days_ago=3.0, importance_weight=2.5, source_type="portal"),
+        make_article(0.3, source_type="blog", article_type="rumor"),
+    ]
+    score = compute_sentiment_score(articles, half_life=3.0)
+    expected = (0.9 * 3.0 - 0.6 * 0.875 + 0.3 * 1.0) / (3.0 + 0.875 + 1.0)
+    assert score.direction == pytest.approx(expected, rel=1e-12)
+
+
+def test_weighted_mean_returns_total_weight():
+    mean, total = _weighted_mean(np.array([1.0, -0.5, 0.25]), np.array([2.0, 1.0, 4.0]))
+    assert total == 7.0
+    assert mean == pytest.approx(2.5 / 7.0)
+    assert _weighted_mean(np.array([0.5]), np.array([0.0])) == (0.0, 0.0)
+
+
+def test_score_components_clamped():
+    D, I, C, S_eff = _score_components(1.3, 1.4, 25)
+    assert (D, I, C, S_eff) == (1.0, 1.0, 0.0, 0.0)
+    D, I, C, S_eff = _score_components(-0.5, 0.2, 5)
+    assert D == -0.5
+    assert I == pytest.approx(0.5 * math.sqrt(0.25))
+    assert C == pytest.approx(0.8)
+    assert S_eff == pytest.approx(D * I * C)
+
+
 # ---------------------------------------------------------------------------
 # 6. Adjustments with neutral sentiment → all multipliers near 1.0
 # ---------------------------------------------------------------------------
@@ -249,6 +284,15 @@ def test_ensemble_weights_sum_to_one():
         )
 
 
+def test_ensemble_weight_table_matches_exact():
+    for S in (-1.0, -0.61803, -0.15, 0.0, 0.00031, 0.4, 1.0):
+        table = _compute_ensemble_weights(S)
+        exact = _exact_ensemble_weights(S)
+        assert table.keys() == exact.keys()
+        for model in exact:
+            assert table[model] == pytest.approx(exact[model], abs=5e-4)
+
+
 # ---------------------------------------------------------------------------
 # 12. Edge case: all same sentiment → high confidence
 # ---------------------------------------------------------------------------
@@ -315,3 +359,13 @@ def test_var_multiplier_equals_vol_squared():
     assert adj.var_multiplier == pytest.approx(adj.vol_multiplier ** 2, rel=1e-9)
     assert adj.theta_mult == pytest.approx(adj.vol_multiplier ** 2, rel=1e-9)
     assert adj.v0_mult == pytest.approx(adj.vol_multiplier ** 2, rel=1e-9)
+
+
+def test_cached_adjustments_return_independent_overrides():
+    articles = [make_article(-0.6, days_ago=i * 0.5) for i in range(5)]
+    score = compute_sentiment_score(articles)
+    first = compute_sentiment_adjustments(score)
+    first.ensemble_weight_overrides["gbm"] = 99.0
+    second = compute_sentiment_adjustments(score)
+    assert second.ensemble_weight_overrides["gbm"] != 99.0
+    assert second.vol_multiplier == first.vol_multiplier
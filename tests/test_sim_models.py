@@ -3,10 +3,15 @@
 import numpy as np
 import pytest
 
-from whaleback.analysis.sim_models import SimModel, ModelResult
-from whaleback.analysis.sim_models.gbm import simulate_gbm
-from whaleback.analysis.sim_models.garch import simulate_garch
-from whaleback.analysis.sim_models.heston import simulate_heston
+from whaleback.analysis.sim_models import ModelResult, ReturnStats, SimModel
+from whaleback.analysis.sim_models.gbm import _compute_horizon_stats, simulate_gbm
+from whaleback.analysis.sim_models.garch import (
+    _fit_garch,
+    _has_arch_effect,
+    _mean_reverting_variance,
+    simulate_garch,
+)
+from whaleback.analysis.sim_models.heston import _euler_log_prices, simulate_heston
 from whaleback.analysis.sim_models.merton import simulate_merton
 
 
@@ -34,6 +39,32 @@ HORIZONS = (21, 63, 126, 252)
 NUM_SIMS = 1000  # smaller for test speed
 
 
+# ---------------------------------------------------------------------------
+# Shared Return Stats
+# ---------------------------------------------------------------------------
+
+class TestReturnStats:
+    def test_from_returns(self, sample_log_returns):
+        stats = ReturnStats.from_returns(sample_log_returns)
+        assert stats.mean == np.mean(sample_log_returns)
+        assert stats.std == np.std(sample_log_returns, ddof=1)
+        assert stats.recent_var == np.var(sample_log_returns[-20:], ddof=1)
+
+    def test_short_series_uses_all_returns_for_recent_var(self):
+        returns = np.array([0.01, -0.02, 0.005])
+        assert ReturnStats.from_returns(returns).recent_var == np.var(returns, ddof=1)
+
+    def test_precomputed_stats_match_internal(self, sample_log_returns):
+        stats = ReturnStats.from_returns(sample_log_returns)
+        for simulate in (simulate_gbm, simulate_garch, simulate_heston, simulate_merton):
+            a = simulate(sample_log_returns, BASE_PRICE, 200, HORIZONS, np.random.default_rng(1))
+            b = simulate(
+                sample_log_returns, BASE_PRICE, 200, HORIZONS, np.random.default_rng(1),
+                stats=stats,
+            )
+            assert a["horizons"] == b["horizons"]
+
+
 # ---------------------------------------------------------------------------
 # GBM Tests
 # ---------------------------------------------------------------------------
@@ -87,6 +118,35 @@ class TestGBM:
         r2 = simulate_gbm(sample_log_returns, BASE_PRICE, NUM_SIMS, HORIZONS, rng2)
         np.testing.assert_array_equal(r1["terminal_prices"][63], r2["terminal_prices"][63])
 
+    def test_terminal_log_return_moments(self, sample_log_returns):
+        """h-day log returns have mean h·drift and std √h·vol."""
+        result = simulate_gbm(
+            sample_log_returns, BASE_PRICE, 20000, (63,), np.random.default_rng(7)
+        )
+        log_ret = np.log(result["terminal_prices"][63] / BASE_PRICE)
+        daily_sigma = np.std(sample_log_returns, ddof=1)
+        daily_drift = np.mean(sample_log_returns)  # Ito terms cancel without caps
+        assert log_ret.mean() == pytest.approx(63 * daily_drift, abs=0.005)
+        assert log_ret.std() == pytest.approx(np.sqrt(63) * daily_sigma, rel=0.02)
+
+    def test_horizon_stats_match_numpy_percentile(self):
+        terminal = np.random.default_rng(9).lognormal(np.log(BASE_PRICE), 0.3, 4999)
+        stats = _compute_horizon_stats(terminal, BASE_PRICE, 63)
+        p5, p25, p50, p75, p95 = np.percentile(terminal, [5, 25, 50, 75, 95])
+        assert (stats["p5"], stats["p25"], stats["p50"], stats["p75"], stats["p95"]) == (
+            int(p5), int(p25), int(p50), int(p75), int(p95)
+        )
+        assert stats["upside_prob"] == round(float(np.mean(terminal > BASE_PRICE)), 4)
+
+    def test_horizons_share_paths(self, sample_log_returns):
+        """Shorter horizons are earlier points of the same paths: corr = √(h1/h2)."""
+        result = simulate_gbm(
+            sample_log_returns, BASE_PRICE, 20000, (252, 63), np.random.default_rng(8)
+        )
+        short = np.log(result["terminal_prices"][63])
+        long = np.log(result["terminal_prices"][252])
+        assert np.corrcoef(short, long)[0, 1] == pytest.approx(0.5, abs=0.03)
+
 
 # ---------------------------------------------------------------------------
 # GARCH Tests
@@ -123,6 +183,25 @@ class TestGARCH:
             assert np.all(tp >= BASE_PRICE * 0.001)
             assert np.all(tp <= BASE_PRICE * 100)
 
+    def test_mean_reverting_variance_follows_recurrence(self, sample_log_returns):
+        path = _mean_reverting_variance(sample_log_returns, 252, lam=0.94)
+        long_run = np.var(sample_log_returns, ddof=1)
+        assert path[0] == pytest.approx(np.var(sample_log_returns[-20:], ddof=1))
+        np.testing.assert_allclose(path[1:], 0.94 * path[:-1] + 0.06 * long_run, rtol=1e-12)
+
+    def test_arch_effect_detection(self, sample_log_returns):
+        assert not _has_arch_effect(sample_log_returns)  # iid normal
+        assert _fit_garch(sample_log_returns, 1, 1, 21) is None  # fit skipped
+
+        # GARCH(1,1) returns: volatility clustering
+        gen = np.random.default_rng(3)
+        var, clustered = 1e-4, np.empty(500)
+        for t in range(500):
+            clustered[t] = np.sqrt(var) * gen.standard_normal()
+            var = 1e-6 + 0.25 * clustered[t] ** 2 + 0.7 * var
+        assert _has_arch_effect(clustered)
+        assert not _has_arch_effect(np.zeros(100))
+
 
 # ---------------------------------------------------------------------------
 # Heston Tests
@@ -166,6 +245,26 @@ class TestHeston:
         )
         assert result is not None
 
+    def test_euler_log_prices_match_path_matrix(self):
+        """State-vector stepping equals the full path-matrix recursion."""
+        g = np.random.default_rng(3)
+        z1, z2 = g.standard_normal((2, 50, 30))
+        mu, kappa, theta, xi, dt, cap = 0.1, 3.0, 0.09, 0.8, 1 / 252, 2.25
+        log_s = np.zeros((50, 31))
+        v = np.full((50, 31), 0.2)
+        for t in range(30):
+            v_pos = np.maximum(v[:, t], 0)
+            log_s[:, t + 1] = log_s[:, t] + (mu - 0.5 * v_pos) * dt + np.sqrt(v_pos * dt) * z1[:, t]
+            v[:, t + 1] = np.minimum(
+                v[:, t] + kappa * (theta - v_pos) * dt + xi * np.sqrt(v_pos * dt) * z2[:, t], cap
+            )
+
+        dw1, dw2 = z1.T * np.sqrt(dt), z2.T * np.sqrt(dt)
+        result = _euler_log_prices(dw1, dw2, 0.2, mu, kappa, theta, xi, dt, cap, (5, 30))
+        assert sorted(result) == [5, 30]
+        np.testing.assert_allclose(result[5], log_s[:, 5], rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(result[30], log_s[:, 30], rtol=1e-12, atol=1e-15)
+
 
 # ---------------------------------------------------------------------------
 # Merton Tests
@@ -209,6 +308,20 @@ class TestMerton:
         )
         assert result is not None
 
+    def test_inert_jumps_skip_jump_sampling(self, sample_log_returns):
+        """Zero-size jumps give the same paths as no jumps (no jump draws are made)."""
+        no_jumps = simulate_merton(
+            sample_log_returns, BASE_PRICE, NUM_SIMS, HORIZONS, np.random.default_rng(4), lam=0.0
+        )
+        zero_size = simulate_merton(
+            sample_log_returns, BASE_PRICE, NUM_SIMS, HORIZONS, np.random.default_rng(4),
+            lam=5.0, mu_j=0.0, sigma_j=0.0,
+        )
+        for h in HORIZONS:
+            np.testing.assert_array_equal(
+                no_jumps["terminal_prices"][h], zero_size["terminal_prices"][h]
+            )
+
     def test_high_jump_intensity(self, sample_log_returns, rng):
         """High jump intensity should produce wider distributions."""
         result = simulate_merton(
@@ -216,3 +329,16 @@ class TestMerton:
             lam=2.0, mu_j=-0.05, sigma_j=0.10
         )
         assert result is not None
+
+    def test_jump_sums_match_compound_poisson_variance(self):
+        """Per-day jump sums give the compound-Poisson variance of the log return."""
+        returns = np.random.default_rng(5).normal(0.0, 0.01, 200)
+        lam, mu_j, sigma_j = 50.0, -0.02, 0.05
+        result = simulate_merton(
+            returns, BASE_PRICE, 20000, (21,), np.random.default_rng(9),
+            lam=lam, mu_j=mu_j, sigma_j=sigma_j,
+        )
+        log_ret = np.log(result["terminal_prices"][21] / BASE_PRICE)
+        daily_sigma = np.std(returns, ddof=1)
+        expected = 21 * (daily_sigma**2 + lam / 252 * (mu_j**2 + sigma_j**2))
+        assert np.var(log_ret) == pytest.approx(expected, rel=0.05)
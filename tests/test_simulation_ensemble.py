@@ -6,7 +6,7 @@ import pytest
 from whaleback.analysis.simulation import run_monte_carlo, compute_simulation_score
 from whaleback.analysis.sim_models import SimModel
 from whaleback.analysis.sim_models.gbm import simulate_gbm
-from whaleback.analysis.sim_models.ensemble import combine_ensemble
+from whaleback.analysis.sim_models.ensemble import _target_probs, combine_ensemble
 
 
 # ---------------------------------------------------------------------------
@@ -83,6 +83,12 @@ class TestBackwardCompatibility:
         assert run_monte_carlo([]) is None
         assert run_monte_carlo(None) is None
 
+    def test_invalid_prices_are_dropped(self, realistic_prices):
+        noisy = [None, float("nan"), 0.0, -5.0, float("inf"), *realistic_prices]
+        result = run_monte_carlo(noisy, num_simulations=200, models=(SimModel.GBM,))
+        assert result["input_days_used"] == len(realistic_prices)
+        assert result["base_price"] == round(realistic_prices[-1])
+
 
 # ---------------------------------------------------------------------------
 # Ensemble Tests
@@ -144,11 +150,42 @@ class TestEnsemble:
         assert result is not None
         assert "horizons" in result
 
+    def test_pooling_takes_prefixes_without_resampling(self):
+        """Models with enough samples contribute their first n draws as-is."""
+        rng = np.random.default_rng(3)
+        results = {
+            name: {"terminal_prices": {63: rng.lognormal(10, 0.2, 1000)}, "horizons": {}}
+            for name in ("gbm", "garch")
+        }
+        result = combine_ensemble(
+            model_results=results,
+            weights={"gbm": 0.7, "garch": 0.3},
+            horizons=(63,),
+            base_price=22026,
+            target_multipliers=(1.1,),
+            total_samples=1000,
+        )
+        expected = np.concatenate([
+            results["gbm"]["terminal_prices"][63][:700],
+            results["garch"]["terminal_prices"][63][:300],
+        ])
+        np.testing.assert_array_equal(result["terminal_prices"][63], expected)
+
+    def test_target_probs_match_per_target_means(self):
+        g = np.random.default_rng(8)
+        terminals = {h: (50000 * g.lognormal(0, 0.2, 1000)).astype(np.float32) for h in (21, 63)}
+        terminals[21][:10] = 55000.0  # exactly on the 1.1x target
+        probs = _target_probs(terminals, 50000, (1.1, 1.5))
+        for mult in (1.1, 1.5):
+            for h, tp in terminals.items():
+                assert probs[str(mult)][h] == round(float(np.mean(tp > 50000 * mult)), 4)
+
 
 # ---------------------------------------------------------------------------
 # Scoring Tests
 # ---------------------------------------------------------------------------
 
+
 class TestScoring:
     def test_compute_simulation_score_valid(self):
         horizons = {
@@ -186,3 +223,9 @@ class TestSeedStability:
                              models=(SimModel.GBM,))
         # Different seeds should produce different median prices (very unlikely to match)
         assert r1["horizons"]["126"]["p50"] != r2["horizons"]["126"]["p50"]
+
+    def test_threaded_models_match_sequential(self, realistic_prices):
+        sequential = run_monte_carlo(realistic_prices, num_simulations=500, ticker="005930")
+        threaded = run_monte_carlo(realistic_prices, num_simulations=500, ticker="005930",
+                                   model_workers=4)
+        assert threaded == sequential